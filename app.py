@@ -11,7 +11,6 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sys
-import os
 import subprocess
 import logging
 from pathlib import Path
@@ -26,14 +25,7 @@ from scheduler_manager import get_scheduler_manager
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-# Configuration (built-in)
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'database': os.getenv('DB_NAME', 'supply_chain'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', 'password123'),
-    'port': int(os.getenv('DB_PORT', '5432'))
-}
+from config import DB_DSN
 
 # Page configuration
 st.set_page_config(
@@ -646,7 +638,7 @@ def get_scheduler():
 def get_database_connection():
     """Get database connection with caching"""
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        conn = psycopg2.connect(DB_DSN)
         return conn
     except Exception as e:
         st.error(f"Database connection failed: {e}")
@@ -655,7 +647,7 @@ def get_database_connection():
 def execute_query(query, fetch_all=True):
     """Execute SQL query and return results"""
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
         cursor.execute(query)
 
@@ -919,7 +911,7 @@ if current_page == "home":
     with col1:
         if st.button("🚀 Test Connection", use_container_width=True):
             try:
-                conn = psycopg2.connect(**DB_CONFIG)
+                conn = psycopg2.connect(DB_DSN)
                 cursor = conn.cursor()
                 cursor.execute("SELECT 1")
                 cursor.close()
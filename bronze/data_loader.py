@@ -1,88 +1,144 @@
+import csv
+import io
 import logging
-import httplib2
 import pandas as pd
 import psycopg2
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from google_auth_httplib2 import AuthorizedHttp
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
 from pathlib import Path
 import sys
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG, GOOGLE_SHEETS_CONFIG, SHEET_RANGES, LOG_CONFIG
-
-# Set up logging
-log_dir = Path(__file__).parent.parent / LOG_CONFIG['log_dir']
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=getattr(logging, LOG_CONFIG['level']),
-    format=LOG_CONFIG['format'],
-    handlers=[
-        logging.FileHandler(log_dir / 'data_loader.log'),
-        logging.StreamHandler()
-    ]
-)
+from config import setup_logging, DB_DSN, GOOGLE_SHEETS_CONFIG, SHEET_RANGES, GOLD_MATERIALIZED_VIEWS
+from bronze.database_setup import bulk_load_mode
+
 logger = logging.getLogger(__name__)
 
+# Google Sheets service is built once per process and reused by every fetch
+_sheets_service = None
+
+# Sheets v4 REST endpoint; called directly so no discovery document is fetched
+SHEETS_API_URL = 'https://sheets.googleapis.com/v4/spreadsheets'
+SHEETS_TIMEOUT = 60
+
+# Session settings for loader connections (see get_db_connection)
+LOADER_SESSION_OPTIONS = "-c synchronous_commit=off -c work_mem=64MB -c maintenance_work_mem=512MB"
+
+# Number of sheets loaded concurrently by load_all_data_to_bronze
+LOAD_WORKERS = 4
+
 
 def get_db_connection():
-    """Create database connection."""
+    """Create database connection tuned for bulk bronze loading.
+
+    Bronze ingest is re-runnable from the source sheets, so the session skips
+    waiting for the WAL flush on commit and gets more memory for sorts/index
+    maintenance. Settings are passed as startup options to avoid extra
+    round-trips.
+    """
     try:
-        return psycopg2.connect(**DB_CONFIG)
+        return psycopg2.connect(DB_DSN, options=LOADER_SESSION_OPTIONS)
     except psycopg2.Error as e:
-        logger.error(f"Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return None
 
 
 def get_sheets_service():
-    """Create Google Sheets service."""
+    """Create Google Sheets service (cached for the lifetime of the process).
+
+    The service is an authorized requests session with a pooled HTTPS adapter,
+    so TLS sessions and keep-alive connections are reused across fetches.
+    Certificates are verified; set REQUESTS_CA_BUNDLE to trust a corporate CA.
+    """
+    global _sheets_service
+    if _sheets_service is not None:
+        return _sheets_service
+
     try:
         credentials = Credentials.from_service_account_file(
             GOOGLE_SHEETS_CONFIG['credentials_path'],
             scopes=GOOGLE_SHEETS_CONFIG['scopes']
         )
-        # Create HTTP client with SSL verification disabled for corporate environments
-        unverified_http = httplib2.Http(disable_ssl_certificate_validation=True)
-        authed_http = AuthorizedHttp(credentials, http=unverified_http)
-        service = build('sheets', 'v4', http=authed_http)
-        logger.info("Google Sheets service created successfully (SSL verification disabled)")
+        service = AuthorizedSession(credentials)
+        service.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        logger.info("Google Sheets service created successfully")
+        _sheets_service = service
         return service
     except Exception as e:
-        logger.error(f"Error creating Google Sheets service: {e}")
+        logger.error("Error creating Google Sheets service: %s", e)
         return None
 
 
+def values_to_dataframe(values, range_name):
+    """Convert raw sheet values (header row + data rows) to a DataFrame."""
+    if not values:
+        return pd.DataFrame()
+
+    # Create DataFrame with headers from first row
+    headers = values[0]
+    data = values[1:]
+
+    # Ensure all rows have the same number of columns as headers
+    for i, row in enumerate(data):
+        if len(row) < len(headers):
+            data[i] = row + [''] * (len(headers) - len(row))
+
+    df = pd.DataFrame(data, columns=headers)
+    logger.info("Fetched %s rows from %s", len(df), range_name)
+    return df
+
+
 def fetch_sheet_data(service, range_name):
     """Fetch data from Google Sheets and return as DataFrame."""
     try:
-        result = service.spreadsheets().values().get(
-            spreadsheetId=GOOGLE_SHEETS_CONFIG['spreadsheet_id'],
-            range=range_name
-        ).execute()
-        values = result.get('values', [])
+        response = service.get(
+            f"{SHEETS_API_URL}/{GOOGLE_SHEETS_CONFIG['spreadsheet_id']}/values/{quote(range_name)}",
+            timeout=SHEETS_TIMEOUT
+        )
+        response.raise_for_status()
+        result = response.json()
+        return values_to_dataframe(result.get('values', []), range_name)
 
-        if not values:
-            return pd.DataFrame()
+    except Exception as e:
+        logger.error("Error fetching data from %s: %s", range_name, e)
+        return pd.DataFrame()
 
-        # Create DataFrame with headers from first row
-        headers = values[0]
-        data = values[1:]
 
-        # Ensure all rows have the same number of columns as headers
-        for i, row in enumerate(data):
-            if len(row) < len(headers):
-                data[i] = row + [''] * (len(headers) - len(row))
+def fetch_all_sheet_data(service, sheet_names):
+    """Fetch several sheets in a single batchGet request.
 
-        df = pd.DataFrame(data, columns=headers)
-        logger.info(f"Fetched {len(df)} rows from {range_name}")
-        return df
+    Returns a dict of sheet name -> DataFrame. Returns an empty dict on
+    failure so callers can fall back to per-sheet fetches.
+    """
+    ranges = [SHEET_RANGES[name] for name in sheet_names if name in SHEET_RANGES]
+    if not ranges:
+        return {}
 
+    try:
+        response = service.get(
+            f"{SHEETS_API_URL}/{GOOGLE_SHEETS_CONFIG['spreadsheet_id']}/values:batchGet",
+            params={'ranges': ranges},
+            timeout=SHEETS_TIMEOUT
+        )
+        response.raise_for_status()
+        result = response.json()
     except Exception as e:
-        logger.error(f"Error fetching data from {range_name}: {e}")
-        return pd.DataFrame()
+        logger.error("Error batch fetching sheet data: %s", e)
+        return {}
+
+    # valueRanges are returned in the same order as the requested ranges
+    frames = {}
+    names = [name for name in sheet_names if name in SHEET_RANGES]
+    for name, value_range in zip(names, result.get('valueRanges', [])):
+        frames[name] = values_to_dataframe(value_range.get('values', []), SHEET_RANGES[name])
+    return frames
 
 
 def safe_str_conversion(value):
@@ -92,115 +148,190 @@ def safe_str_conversion(value):
     return str(value).strip() if str(value).strip() else None
 
 
-def load_suppliers_to_bronze    (df):
+def clean_str_column(df, column, default=None):
+    """Vectorized safe_str_conversion over a DataFrame column."""
+    if column not in df.columns:
+        return pd.Series([default] * len(df), index=df.index, dtype=object)
+    values = df[column].astype('string').str.strip().replace('', pd.NA)
+    return values.astype(object).where(values.notna(), None)
+
+
+# Bounds of PostgreSQL INT, the type of every integer column in bronze
+PG_INT_MIN = -2**31
+PG_INT_MAX = 2**31 - 1
+
+
+def extract_int_column(values, pattern=r'(\d+)'):
+    """Vectorized re.search(pattern) + int() over a string column; no match -> <NA>.
+
+    Values are downcast to nullable Int32 to match the INT columns they feed;
+    numbers outside the INT range are treated like non-matches.
+    """
+    matches = values.astype('string').str.extract(pattern, expand=False)
+    numbers = pd.to_numeric(matches, errors='coerce', downcast='integer')
+    numbers = numbers.where(numbers.between(PG_INT_MIN, PG_INT_MAX))
+    return numbers.astype('Int32')
+
+
+def extract_decimal_column(values):
+    """Vectorized price/cost parsing; currency symbols are ignored, no match -> 0.0."""
+    matches = values.astype('string').str.extract(r'(-?\d+\.?\d*)', expand=False)
+    return pd.to_numeric(matches, errors='coerce').fillna(0.0)
+
+
+def parse_date_column(values):
+    """Vectorized date parsing over a string column; unparseable values -> NaT.
+
+    The common case is parsed in one pass with a single inferred format; only
+    values that don't match it are re-parsed element-wise (format='mixed').
+    """
+    parsed = pd.to_datetime(values, errors='coerce')
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], errors='coerce', format='mixed')
+    return parsed.dt.date
+
+
+def build_rows(columns, mask):
+    """Zip column Series into row tuples for rows where ``mask`` is True.
+
+    Duplicate primary keys (first column) keep the last occurrence, which is
+    what upserting the rows one at a time used to produce.
+    """
+    frame = pd.concat(
+        [col.astype(object).where(col.notna(), None) for col in columns],
+        axis=1, ignore_index=True
+    )[mask]
+    frame = frame.drop_duplicates(subset=0, keep='last')
+    return list(frame.itertuples(index=False, name=None))
+
+
+def copy_from_iter(cursor, table, columns, rows):
+    """COPY an iterable of row tuples into ``table`` as CSV.
+
+    Rows are written straight to the buffer with csv.writer, without building
+    a DataFrame first. None is written as an unquoted empty field, which
+    COPY ... CSV reads as NULL.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buffer
+    )
+
+
+def copy_rows_to_stage(cursor, stage_table, source_table, columns, rows):
+    """COPY rows into an UNLOGGED staging table shaped like ``source_table``.
+
+    Staging tables skip WAL, so the bulk transfer is cheap; the caller then
+    merges them into the real table with a single INSERT ... SELECT.
+    """
+    cursor.execute(f"CREATE UNLOGGED TABLE IF NOT EXISTS {stage_table} (LIKE {source_table})")
+    copy_from_iter(cursor, stage_table, columns, rows)
+
+
+def run_upsert(cursor, upsert_query):
+    """Run an INSERT ... ON CONFLICT DO UPDATE and return (inserted, updated).
+
+    Rows the upsert inserted have xmax = 0, rows it updated do not, so the
+    split comes back with the statement instead of from COUNT(*) scans of
+    the target table before and after.
+    """
+    cursor.execute(f"""
+        WITH upserted AS (
+            {upsert_query}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted)
+        FROM upserted
+    """)
+    return cursor.fetchone()
+
+
+def load_suppliers_to_bronze(df, conn=None):
     """Load suppliers data to PostgreSQL bronze.suppliers table - RAW DATA."""
     if df.empty:
         logger.warning("No suppliers data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.suppliers")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.suppliers (supplier_id, supplier_name, contact_email, phone_number)
-        VALUES (%s, %s, %s, %s)
+        SELECT supplier_id, supplier_name, contact_email, phone_number
+        FROM bronze.suppliers_stage
         ON CONFLICT (supplier_id) DO UPDATE SET
             supplier_name = EXCLUDED.supplier_name,
             contact_email = EXCLUDED.contact_email,
             phone_number = EXCLUDED.phone_number
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                # Convert all values to string, preserve exactly as received
-                supplier_id_raw = safe_str_conversion(row.get('supplier_id', ''))
-                supplier_name_raw = safe_str_conversion(row.get('supplier_name', ''))
-                contact_email_raw = safe_str_conversion(row.get('contact_email', ''))
-                phone_number_raw = safe_str_conversion(row.get('phone_number', ''))
-
-                # Try to extract supplier_id for primary key, but be lenient
-                supplier_id = None
-                if supplier_id_raw:
-                    try:
-                        # Try to extract numeric part if possible
-                        import re
-                        numeric_match = re.search(r'\d+', supplier_id_raw)
-                        if numeric_match:
-                            supplier_id = int(numeric_match.group())
-                        else:
-                            # If no numeric part, skip this row
-                            logger.warning(f"Skipping row with invalid supplier_id: {supplier_id_raw}")
-                            error_count += 1
-                            continue
-                    except:
-                        logger.warning(f"Skipping row with unparseable supplier_id: {supplier_id_raw}")
-                        error_count += 1
-                        continue
-
-                cursor.execute(upsert_query, (
-                    supplier_id,
-                    supplier_name_raw,
-                    contact_email_raw,
-                    phone_number_raw
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing supplier row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.suppliers")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        # Extract numeric supplier_id for the primary key; rows without one are skipped
+        supplier_id = extract_int_column(clean_str_column(df, 'supplier_id'))
+        valid = supplier_id.notna()
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d supplier rows with invalid supplier_id", error_count)
+
+        rows = build_rows([
+            supplier_id,
+            clean_str_column(df, 'supplier_name'),
+            clean_str_column(df, 'contact_email'),
+            clean_str_column(df, 'phone_number')
+        ], valid)
+        copy_rows_to_stage(cursor, 'bronze.suppliers_stage', 'bronze.suppliers',
+                           ['supplier_id', 'supplier_name', 'contact_email', 'phone_number'],
+                           rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.suppliers_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Suppliers processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Suppliers processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading suppliers data: {e}")
+        logger.error("Error loading suppliers data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_warehouses_to_bronze(df):
+def load_warehouses_to_bronze(df, conn=None):
     """Load warehouses data to PostgreSQL bronze.warehouses table - RAW DATA."""
     if df.empty:
         logger.warning("No warehouses data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.warehouses")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.warehouses (warehouse_id, warehouse_name, city, region, storage_capacity)
-        VALUES (%s, %s, %s, %s, %s)
+        SELECT warehouse_id, warehouse_name, city, region, storage_capacity
+        FROM bronze.warehouses_stage
         ON CONFLICT (warehouse_id) DO UPDATE SET
             warehouse_name = EXCLUDED.warehouse_name,
             city = EXCLUDED.city,
@@ -208,97 +339,67 @@ def load_warehouses_to_bronze(df):
             storage_capacity = EXCLUDED.storage_capacity
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                # Extract warehouse_id for primary key
-                warehouse_id_raw = safe_str_conversion(row.get('warehouse_id', ''))
-                warehouse_id = None
-                if warehouse_id_raw:
-                    try:
-                        import re
-                        numeric_match = re.search(r'\d+', warehouse_id_raw)
-                        if numeric_match:
-                            warehouse_id = int(numeric_match.group())
-                        else:
-                            logger.warning(f"Skipping row with invalid warehouse_id: {warehouse_id_raw}")
-                            error_count += 1
-                            continue
-                    except:
-                        logger.warning(f"Skipping row with unparseable warehouse_id: {warehouse_id_raw}")
-                        error_count += 1
-                        continue
-
-                # Extract storage_capacity for integer field, but be lenient
-                storage_capacity_raw = safe_str_conversion(row.get('storage_capacity', ''))
-                storage_capacity = None
-                if storage_capacity_raw:
-                    try:
-                        import re
-                        numeric_match = re.search(r'-?\d+', storage_capacity_raw)
-                        if numeric_match:
-                            storage_capacity = int(numeric_match.group())
-                        else:
-                            storage_capacity = 0  # Default for invalid data
-                    except:
-                        storage_capacity = 0
-
-                cursor.execute(upsert_query, (
-                    warehouse_id,
-                    safe_str_conversion(row.get('warehouse_name', '')),
-                    safe_str_conversion(row.get('city', '')),
-                    safe_str_conversion(row.get('region', '')),
-                    storage_capacity
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing warehouse row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.warehouses")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        # Extract warehouse_id for primary key
+        warehouse_id = extract_int_column(clean_str_column(df, 'warehouse_id'))
+        valid = warehouse_id.notna()
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d warehouse rows with invalid warehouse_id", error_count)
+
+        # Extract storage_capacity for integer field, but be lenient (0 for invalid data)
+        storage_capacity_raw = clean_str_column(df, 'storage_capacity')
+        storage_capacity = extract_int_column(storage_capacity_raw, r'(-?\d+)')
+        storage_capacity = storage_capacity.mask(storage_capacity.isna() & storage_capacity_raw.notna(), 0)
+
+        rows = build_rows([
+            warehouse_id,
+            clean_str_column(df, 'warehouse_name'),
+            clean_str_column(df, 'city'),
+            clean_str_column(df, 'region'),
+            storage_capacity
+        ], valid)
+        copy_rows_to_stage(cursor, 'bronze.warehouses_stage', 'bronze.warehouses',
+                           ['warehouse_id', 'warehouse_name', 'city', 'region', 'storage_capacity'],
+                           rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.warehouses_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Warehouses processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Warehouses processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading warehouses data: {e}")
+        logger.error("Error loading warehouses data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_products_to_bronze(df):
+def load_products_to_bronze(df, conn=None):
     """Load products data to PostgreSQL bronze.products table - RAW DATA."""
     if df.empty:
         logger.warning("No products data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.products")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.products (product_id, product_name, unit_cost, selling_price, supplier_id, product_category, status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        SELECT product_id, product_name, unit_cost, selling_price, supplier_id, product_category, status
+        FROM bronze.products_stage
         ON CONFLICT (product_id) DO UPDATE SET
             product_name = EXCLUDED.product_name,
             unit_cost = EXCLUDED.unit_cost,
@@ -308,115 +409,65 @@ def load_products_to_bronze(df):
             status = EXCLUDED.status
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                # Extract product_id for primary key
-                product_id_raw = safe_str_conversion(row.get('product_id', ''))
-                product_id = None
-                if product_id_raw:
-                    try:
-                        import re
-                        numeric_match = re.search(r'\d+', product_id_raw)
-                        if numeric_match:
-                            product_id = int(numeric_match.group())
-                        else:
-                            logger.warning(f"Skipping row with invalid product_id: {product_id_raw}")
-                            error_count += 1
-                            continue
-                    except:
-                        logger.warning(f"Skipping row with unparseable product_id: {product_id_raw}")
-                        error_count += 1
-                        continue
-
-                # Extract numeric fields but be lenient with dirty data
-                def extract_decimal(raw_value):
-                    if not raw_value:
-                        return 0.0
-                    try:
-                        import re
-                        # Remove currency symbols and extract numeric part
-                        numeric_match = re.search(r'-?\d+\.?\d*', str(raw_value))
-                        if numeric_match:
-                            return float(numeric_match.group())
-                        return 0.0
-                    except:
-                        return 0.0
-
-                def extract_int(raw_value):
-                    if not raw_value:
-                        return None
-                    try:
-                        import re
-                        numeric_match = re.search(r'\d+', str(raw_value))
-                        if numeric_match:
-                            return int(numeric_match.group())
-                        return None
-                    except:
-                        return None
-
-                unit_cost = extract_decimal(safe_str_conversion(row.get('unit_cost', '')))
-                selling_price = extract_decimal(safe_str_conversion(row.get('selling_price', '')))
-                supplier_id = extract_int(safe_str_conversion(row.get('supplier_id', '')))
-
-                cursor.execute(upsert_query, (
-                    product_id,
-                    safe_str_conversion(row.get('product_name', '')),
-                    unit_cost,
-                    selling_price,
-                    supplier_id,
-                    safe_str_conversion(row.get('product_category', '')),
-                    safe_str_conversion(row.get('status', 'active'))
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing product row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.products")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        # Extract product_id for primary key
+        product_id = extract_int_column(clean_str_column(df, 'product_id'))
+        valid = product_id.notna()
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d product rows with invalid product_id", error_count)
+
+        # Extract numeric fields but be lenient with dirty data
+        rows = build_rows([
+            product_id,
+            clean_str_column(df, 'product_name'),
+            extract_decimal_column(clean_str_column(df, 'unit_cost')),
+            extract_decimal_column(clean_str_column(df, 'selling_price')),
+            extract_int_column(clean_str_column(df, 'supplier_id')),
+            clean_str_column(df, 'product_category'),
+            clean_str_column(df, 'status', default='active')
+        ], valid)
+        copy_rows_to_stage(cursor, 'bronze.products_stage', 'bronze.products',
+                           ['product_id', 'product_name', 'unit_cost', 'selling_price', 'supplier_id', 'product_category', 'status'],
+                           rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.products_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Products processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Products processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading products data: {e}")
+        logger.error("Error loading products data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_inventory_to_bronze(df):
+def load_inventory_to_bronze(df, conn=None):
     """Load inventory data to PostgreSQL bronze.inventory table - RAW DATA."""
     if df.empty:
         logger.warning("No inventory data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.inventory")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.inventory (inventory_id, product_id, warehouse_id, quantity_on_hand, last_stocked_date)
-        VALUES (%s, %s, %s, %s, %s)
+        SELECT inventory_id, product_id, warehouse_id, quantity_on_hand, last_stocked_date
+        FROM bronze.inventory_stage
         ON CONFLICT (inventory_id) DO UPDATE SET
             product_id = EXCLUDED.product_id,
             warehouse_id = EXCLUDED.warehouse_id,
@@ -424,98 +475,64 @@ def load_inventory_to_bronze(df):
             last_stocked_date = EXCLUDED.last_stocked_date
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                def extract_int(raw_value):
-                    if not raw_value:
-                        return None
-                    try:
-                        import re
-                        numeric_match = re.search(r'-?\d+', str(raw_value))
-                        if numeric_match:
-                            return int(numeric_match.group())
-                        return None
-                    except:
-                        return None
-
-                def extract_date(raw_value):
-                    if not raw_value or str(raw_value).strip() in ['', 'N/A', 'NULL', 'TBD']:
-                        return None
-                    try:
-                        # Try to parse various date formats, but don't fail if we can't
-                        import dateutil.parser
-                        return dateutil.parser.parse(str(raw_value).strip()).date()
-                    except:
-                        return None
-
-                inventory_id = extract_int(safe_str_conversion(row.get('inventory_id', '')))
-                if not inventory_id:
-                    logger.warning(f"Skipping row with invalid inventory_id")
-                    error_count += 1
-                    continue
-
-                product_id = extract_int(safe_str_conversion(row.get('product_id', '')))
-                warehouse_id = extract_int(safe_str_conversion(row.get('warehouse_id', '')))
-                quantity = extract_int(safe_str_conversion(row.get('quantity_on_hand', '')))
-                last_stocked = extract_date(safe_str_conversion(row.get('last_stocked_date', '')))
-
-                cursor.execute(upsert_query, (
-                    inventory_id,
-                    product_id,
-                    warehouse_id,
-                    quantity if quantity is not None else 0,
-                    last_stocked
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing inventory row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.inventory")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        inventory_id = extract_int_column(clean_str_column(df, 'inventory_id'), r'(-?\d+)')
+        valid = inventory_id.notna() & (inventory_id != 0)
+        valid = valid.fillna(False).astype(bool)
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d inventory rows with invalid inventory_id", error_count)
+
+        quantity = extract_int_column(clean_str_column(df, 'quantity_on_hand'), r'(-?\d+)').fillna(0)
+
+        rows = build_rows([
+            inventory_id,
+            extract_int_column(clean_str_column(df, 'product_id'), r'(-?\d+)'),
+            extract_int_column(clean_str_column(df, 'warehouse_id'), r'(-?\d+)'),
+            quantity,
+            parse_date_column(clean_str_column(df, 'last_stocked_date'))
+        ], valid)
+        copy_rows_to_stage(cursor, 'bronze.inventory_stage', 'bronze.inventory',
+                           ['inventory_id', 'product_id', 'warehouse_id', 'quantity_on_hand', 'last_stocked_date'],
+                           rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.inventory_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Inventory processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Inventory processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading inventory data: {e}")
+        logger.error("Error loading inventory data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_retail_stores_to_bronze(df):
+def load_retail_stores_to_bronze(df, conn=None):
     """Load retail stores data to PostgreSQL bronze.retail_stores table - RAW DATA."""
     if df.empty:
         logger.warning("No retail stores data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.retail_stores")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.retail_stores (retail_store_id, store_name, city, region, store_type, store_status)
-        VALUES (%s, %s, %s, %s, %s, %s)
+        SELECT retail_store_id, store_name, city, region, store_type, store_status
+        FROM bronze.retail_stores_stage
         ON CONFLICT (retail_store_id) DO UPDATE SET
             store_name = EXCLUDED.store_name,
             city = EXCLUDED.city,
@@ -524,86 +541,67 @@ def load_retail_stores_to_bronze(df):
             store_status = EXCLUDED.store_status
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                def extract_int(raw_value):
-                    if not raw_value:
-                        return None
-                    try:
-                        import re
-                        numeric_match = re.search(r'\d+', str(raw_value))
-                        if numeric_match:
-                            return int(numeric_match.group())
-                        return None
-                    except:
-                        return None
-
-                retail_store_id = extract_int(safe_str_conversion(row.get('retail_store_id', '')))
-                if not retail_store_id:
-                    logger.warning(f"Skipping row with invalid retail_store_id")
-                    error_count += 1
-                    continue
-
-                cursor.execute(upsert_query, (
-                    retail_store_id,
-                    safe_str_conversion(row.get('store_name', '')),
-                    safe_str_conversion(row.get('city', '')),
-                    safe_str_conversion(row.get('region', '')),
-                    safe_str_conversion(row.get('store_type', '')),
-                    safe_str_conversion(row.get('store_status', 'active'))
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing retail store row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.retail_stores")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        retail_store_id = extract_int_column(clean_str_column(df, 'retail_store_id'))
+        valid = retail_store_id.notna() & (retail_store_id != 0)
+        valid = valid.fillna(False).astype(bool)
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d retail store rows with invalid retail_store_id", error_count)
+
+        rows = build_rows([
+            retail_store_id,
+            clean_str_column(df, 'store_name'),
+            clean_str_column(df, 'city'),
+            clean_str_column(df, 'region'),
+            clean_str_column(df, 'store_type'),
+            clean_str_column(df, 'store_status', default='active')
+        ], valid)
+        copy_rows_to_stage(cursor, 'bronze.retail_stores_stage', 'bronze.retail_stores',
+                           ['retail_store_id', 'store_name', 'city', 'region', 'store_type', 'store_status'],
+                           rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.retail_stores_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Retail stores processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Retail stores processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading retail stores data: {e}")
+        logger.error("Error loading retail stores data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_supply_orders_to_bronze(df):
+def load_supply_orders_to_bronze(df, conn=None):
     """Load supply orders data to PostgreSQL bronze.supply_orders table - RAW DATA."""
     if df.empty:
         logger.warning("No supply orders data to load")
         return False
 
-    conn = get_db_connection()
-    if not conn:
-        return False
+    # Reuse the caller's connection when given, otherwise open (and close) our own
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
 
     try:
         cursor = conn.cursor()
 
-        # Get initial count
-        cursor.execute("SELECT COUNT(*) FROM bronze.supply_orders")
-        initial_count = cursor.fetchone()[0]
-
+        # Rows are staged with COPY, then merged with one set-based upsert
         upsert_query = """
         INSERT INTO bronze.supply_orders (supply_order_id, product_id, warehouse_id, retail_store_id,
                                         quantity, price, total_invoice, order_date, shipped_date,
                                         delivered_date, status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        SELECT supply_order_id, product_id, warehouse_id, retail_store_id,
+               quantity, price, total_invoice, order_date, shipped_date,
+               delivered_date, status
+        FROM bronze.supply_orders_stage
         ON CONFLICT (supply_order_id) DO UPDATE SET
             product_id = EXCLUDED.product_id,
             warehouse_id = EXCLUDED.warehouse_id,
@@ -617,89 +615,66 @@ def load_supply_orders_to_bronze(df):
             status = EXCLUDED.status
         """
 
-        success_count = 0
-        error_count = 0
-
-        for _, row in df.iterrows():
-            try:
-                supply_order_id_raw = safe_str_conversion(row.get('supply_order_id', ''))
-                supply_order_id = None
-                if supply_order_id_raw:
-                    try:
-                        import re
-                        numeric_match = re.search(r'\d+', supply_order_id_raw)
-                        if numeric_match:
-                            supply_order_id = int(numeric_match.group())
-                        else:
-                            logger.warning(f"Skipping row with invalid supply_order_id: {supply_order_id_raw}")
-                            error_count += 1
-                            continue
-                    except:
-                        logger.warning(f"Skipping row with unparseable supply_order_id: {supply_order_id_raw}")
-                        error_count += 1
-                        continue
-
-                cursor.execute(upsert_query, (
-                    supply_order_id,
-                    safe_str_conversion(row.get('product_id', '')),
-                    safe_str_conversion(row.get('warehouse_id', '')),
-                    safe_str_conversion(row.get('retail_store_id', '')),
-                    safe_str_conversion(row.get('quantity', '')),
-                    safe_str_conversion(row.get('price', '')),
-                    safe_str_conversion(row.get('total_invoice', '')),
-                    safe_str_conversion(row.get('order_date', '')),
-                    safe_str_conversion(row.get('shipped_date', '')),
-                    safe_str_conversion(row.get('delivered_date', '')),
-                    safe_str_conversion(row.get('status', ''))
-                ))
-                success_count += 1
-
-            except Exception as e:
-                logger.warning(f"Error processing supply order row: {e}")
-                error_count += 1
-                continue
-
-        # Get final count
-        cursor.execute("SELECT COUNT(*) FROM bronze.supply_orders")
-        final_count = cursor.fetchone()[0]
-
-        inserted = final_count - initial_count
-        updated = success_count - inserted
+        supply_order_id = extract_int_column(clean_str_column(df, 'supply_order_id'))
+        valid = supply_order_id.notna()
+        error_count = int((~valid).sum())
+        if error_count:
+            logger.warning("Skipping %d supply order rows with invalid supply_order_id", error_count)
+
+        # Everything except the key is stored as raw text
+        raw_columns = ['product_id', 'warehouse_id', 'retail_store_id', 'quantity', 'price',
+                       'total_invoice', 'order_date', 'shipped_date', 'delivered_date', 'status']
+        rows = build_rows(
+            [supply_order_id] + [clean_str_column(df, col) for col in raw_columns],
+            valid
+        )
+        copy_rows_to_stage(cursor, 'bronze.supply_orders_stage', 'bronze.supply_orders',
+                           ['supply_order_id'] + raw_columns, rows)
+        inserted, updated = run_upsert(cursor, upsert_query)
+        cursor.execute("TRUNCATE bronze.supply_orders_stage")
+        success_count = len(rows)
 
         conn.commit()
-        logger.info(f"Supply orders processed: {success_count:,} successful, {error_count:,} errors, {inserted:,} inserted, {updated:,} updated")
+        logger.info("Supply orders processed: %d successful, %d errors, %d inserted, %d updated", success_count, error_count, inserted, updated)
         return True
 
     except (psycopg2.Error, ValueError) as e:
-        logger.error(f"Error loading supply orders data: {e}")
+        logger.error("Error loading supply orders data: %s", e)
         conn.rollback()
         return False
     finally:
         cursor.close()
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def load_sheet_to_bronze(sheet_name):
-    """Load data from a single Google Sheet to bronze layer - ACCEPTS DIRTY DATA."""
-    logger.info(f"📥 Loading {sheet_name} data to bronze layer (raw/unclean)...")
+def load_sheet_to_bronze(sheet_name, df=None, conn=None):
+    """Load data from a single Google Sheet to bronze layer - ACCEPTS DIRTY DATA.
 
-    # Get Google Sheets service
-    service = get_sheets_service()
-    if not service:
-        return False
+    If ``df`` is given (e.g. from a batched fetch) the sheet is not re-read.
+    If ``conn`` is given it is used instead of opening a new connection.
+    """
+    logger.info("📥 Loading %s data to bronze layer (raw/unclean)...", sheet_name)
 
-    # Fetch data from sheet
-    sheet_range = SHEET_RANGES.get(sheet_name)
-    if not sheet_range:
-        logger.error(f"No range defined for sheet: {sheet_name}")
-        return False
+    if df is None:
+        # Get Google Sheets service
+        service = get_sheets_service()
+        if not service:
+            return False
+
+        # Fetch data from sheet
+        sheet_range = SHEET_RANGES.get(sheet_name)
+        if not sheet_range:
+            logger.error("No range defined for sheet: %s", sheet_name)
+            return False
+
+        df = fetch_sheet_data(service, sheet_range)
 
-    df = fetch_sheet_data(service, sheet_range)
     if df.empty:
-        logger.warning(f"No data found for {sheet_name}")
+        logger.warning("No data found for %s", sheet_name)
         return False
 
-    logger.info(f"📊 Raw data loaded: {len(df)} rows with columns: {list(df.columns)}")
+    logger.info("📊 Raw data loaded: %s rows with columns: %s", len(df), list(df.columns))
 
     # Load data to bronze layer based on sheet type
     load_functions = {
@@ -713,14 +688,14 @@ def load_sheet_to_bronze(sheet_name):
 
     load_function = load_functions.get(sheet_name)
     if not load_function:
-        logger.error(f"No load function defined for sheet: {sheet_name}")
+        logger.error("No load function defined for sheet: %s", sheet_name)
         return False
 
-    success = load_function(df)
+    success = load_function(df, conn=conn)
     if success:
-        logger.info(f"✅ Successfully loaded {sheet_name} raw data to bronze layer")
+        logger.info("✅ Successfully loaded %s raw data to bronze layer", sheet_name)
     else:
-        logger.error(f"❌ Failed to load {sheet_name} data to bronze layer")
+        logger.error("❌ Failed to load %s data to bronze layer", sheet_name)
 
     return success
 
@@ -730,7 +705,7 @@ def load_all_data_to_bronze():
     logger.info("🚀 Starting bulk load of all raw data to bronze layer")
     logger.info("=" * 60)
 
-    # Define load order (no dependencies since we're accepting dirty data)
+    # No load order needed (no dependencies since we're accepting dirty data)
     sheets_to_load = [
         'suppliers',
         'warehouses',
@@ -740,29 +715,123 @@ def load_all_data_to_bronze():
         'supply_orders'
     ]
 
+    # Fetch every sheet in one round-trip; sheets missing from the batch
+    # result are fetched individually by load_sheet_to_bronze
+    service = get_sheets_service()
+    if not service:
+        return False
+    sheet_frames = fetch_all_sheet_data(service, sheets_to_load)
+
+    # Bronze tables have no foreign keys between them, so sheets are loaded
+    # concurrently; each worker borrows its own connection from the pool
+    try:
+        # One connection per worker plus one held for bulk_load_mode and the MV refresh
+        pool = ThreadedConnectionPool(1, LOAD_WORKERS + 1, DB_DSN, options=LOADER_SESSION_OPTIONS)
+    except psycopg2.Error as e:
+        logger.error("Database connection failed: %s", e)
+        return False
+
+    def load_with_pooled_connection(sheet):
+        conn = pool.getconn()
+        try:
+            loaded = load_sheet_to_bronze(sheet, sheet_frames.get(sheet), conn=conn)
+            if loaded:
+                analyze_bronze_table(conn, sheet)
+            return loaded
+        except Exception as e:
+            logger.error("❌ Unexpected error loading %s: %s", sheet, e)
+            conn.rollback()
+            return False
+        finally:
+            pool.putconn(conn)
+
     successful_loads = 0
     failed_loads = 0
 
-    for sheet in sheets_to_load:
-        logger.info(f"\n📋 Processing {sheet}...")
-        success = load_sheet_to_bronze(sheet)
-        if success:
-            successful_loads += 1
-            logger.info(f"✅ {sheet} loaded successfully")
-        else:
-            failed_loads += 1
-            logger.error(f"❌ {sheet} failed to load")
+    try:
+        # Autovacuum is held off the bronze tables until every sheet is loaded
+        conn = pool.getconn()
+        try:
+            with bulk_load_mode(conn, sheets_to_load):
+                with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                    futures = {executor.submit(load_with_pooled_connection, sheet): sheet for sheet in sheets_to_load}
+                    for future in as_completed(futures):
+                        sheet = futures[future]
+                        if future.result():
+                            successful_loads += 1
+                            logger.info("✅ %s loaded successfully", sheet)
+                        else:
+                            failed_loads += 1
+                            logger.error("❌ %s failed to load", sheet)
+
+            # Bring the materialized gold aggregates up to date with the new bronze data
+            refresh_gold_materialized_views(conn=conn)
+        except psycopg2.Error as e:
+            logger.error("❌ Error switching bronze tables to bulk load mode: %s", e)
+            conn.rollback()
+            failed_loads = len(sheets_to_load) - successful_loads
+        finally:
+            pool.putconn(conn)
+    finally:
+        pool.closeall()
 
-    logger.info(f"\n📊 Load Summary:")
-    logger.info(f"  ✅ Successful: {successful_loads}")
-    logger.info(f"  ❌ Failed: {failed_loads}")
-    logger.info(f"  📈 Success Rate: {(successful_loads/(successful_loads+failed_loads)*100):.1f}%")
+    logger.info("\n📊 Load Summary:")
+    logger.info("  ✅ Successful: %s", successful_loads)
+    logger.info("  ❌ Failed: %s", failed_loads)
+    logger.info("  📈 Success Rate: %.1f%%", (successful_loads/(successful_loads+failed_loads)*100))
 
     return failed_loads == 0
 
 
-def verify_bronze_data():
-    """Verify bronze layer data - shows raw/dirty data as-is."""
+def analyze_bronze_table(conn, table):
+    """Refresh planner statistics (and pg_class.reltuples) for a freshly loaded table."""
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql.SQL("ANALYZE {}").format(sql.Identifier('bronze', table)))
+        conn.commit()
+        cursor.close()
+        return True
+    except psycopg2.Error as e:
+        logger.warning("⚠️  Could not analyze bronze.%s: %s", table, e)
+        conn.rollback()
+        return False
+
+
+def refresh_gold_materialized_views(conn=None):
+    """Refresh gold materialized views built on top of bronze tables."""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
+        if not conn:
+            return False
+
+    try:
+        cursor = conn.cursor()
+        for view_name in GOLD_MATERIALIZED_VIEWS:
+            # CONCURRENTLY keeps the view readable while it is rebuilt
+            cursor.execute(sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}").format(
+                sql.Identifier(*view_name.split('.'))
+            ))
+            logger.info("🔄 Refreshed materialized view %s", view_name)
+        conn.commit()
+        cursor.close()
+        return True
+
+    except psycopg2.Error as e:
+        logger.warning("⚠️  Could not refresh gold materialized views: %s", e)
+        conn.rollback()
+        return False
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def verify_bronze_data(exact=False):
+    """Verify bronze layer data - shows raw/dirty data as-is.
+
+    Record counts come from pg_class.reltuples (kept fresh by the ANALYZE
+    after each load); pass ``exact=True`` to run a full COUNT(*) instead.
+    """
     conn = get_db_connection()
     if not conn:
         return False
@@ -775,13 +844,25 @@ def verify_bronze_data():
 
         tables = ['suppliers', 'products', 'warehouses', 'inventory', 'retail_stores', 'supply_orders']
 
-        for table in tables:
-            cursor.execute(f"SELECT COUNT(*) FROM bronze.{table}")
-            count = cursor.fetchone()[0]
-            logger.info(f"📊 bronze.{table:<15}: {count:>8,} records")
+        if exact:
+            count_query = sql.SQL("SELECT COUNT(*) FROM {}")
+            for table in tables:
+                cursor.execute(count_query.format(sql.Identifier('bronze', table)))
+                count = cursor.fetchone()[0]
+                logger.info("📊 bronze.%-15s: %8d records", table, count)
+        else:
+            cursor.execute("""
+                SELECT relname, reltuples::bigint
+                FROM pg_class
+                WHERE relnamespace = 'bronze'::regnamespace AND relkind = 'r'
+            """)
+            estimates = dict(cursor.fetchall())
+            for table in tables:
+                count = max(estimates.get(table, 0), 0)
+                logger.info("📊 bronze.%-15s: ~%7d records (estimate)", table, count)
 
         # Show sample of dirty data
-        logger.info(f"\n🔍 Sample Raw Data (showing data quality issues):")
+        logger.info("\n🔍 Sample Raw Data (showing data quality issues):")
         logger.info("-" * 60)
 
         # Show sample suppliers with potential issues
@@ -789,30 +870,38 @@ def verify_bronze_data():
         suppliers = cursor.fetchall()
         logger.info("Suppliers (raw):")
         for supplier in suppliers:
-            logger.info(f"  - {supplier[0]} | {supplier[1]} | {supplier[2]}")
+            logger.info("  - %s | %s | %s", supplier[0], supplier[1], supplier[2])
 
         # Show sample products with potential price issues
         cursor.execute("SELECT product_name, unit_cost, selling_price, product_category FROM bronze.products LIMIT 5")
         products = cursor.fetchall()
         logger.info("\nProducts (raw):")
         for product in products:
-            logger.info(f"  - {product[0]} | Cost: {product[1]} | Price: {product[2]} | Cat: {product[3]}")
+            logger.info("  - %s | Cost: %s | Price: %s | Cat: %s", product[0], product[1], product[2], product[3])
 
         cursor.close()
         conn.close()
 
-        logger.info(f"\n✅ Bronze layer verification completed")
+        logger.info("\n✅ Bronze layer verification completed")
         logger.info("Note: Data shown above is RAW and may contain quality issues")
         logger.info("Silver layer will handle data cleaning and validation")
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"Error during verification: {e}")
+        logger.error("Error during verification: %s", e)
         return False
 
 
 def main():
     """Main function to load all data to bronze layer - HANDLES DIRTY DATA."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Load Google Sheets data into the bronze layer')
+    parser.add_argument('--exact', action='store_true',
+                        help='Use exact COUNT(*) instead of planner estimates when verifying')
+    args = parser.parse_args()
+
+    setup_logging('data_loader.log')
     logger.info("🏗️  Medallion Architecture - Bronze Layer Data Loader")
     logger.info("🔥 LOADING RAW/UNCLEAN DATA - NO VALIDATION/CLEANING")
     logger.info("=" * 60)
@@ -823,7 +912,7 @@ def main():
 
         # Verify what was loaded
         logger.info("\n🔍 Verifying loaded data...")
-        verify_bronze_data()
+        verify_bronze_data(exact=args.exact)
 
         # Final summary
         logger.info("=" * 60)
@@ -844,7 +933,7 @@ def main():
         logger.info("\n❌ Process interrupted by user")
         return False
     except Exception as e:
-        logger.error(f"❌ Unexpected error during bronze loading: {e}")
+        logger.error("❌ Unexpected error during bronze loading: %s", e)
         return False
 
 
@@ -1,35 +1,123 @@
 import psycopg2
+from psycopg2 import sql
 import sys
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG, LOG_CONFIG
-
-# Set up logging
-log_dir = Path(__file__).parent.parent / LOG_CONFIG['log_dir']
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=getattr(logging, LOG_CONFIG['level']),
-    format=LOG_CONFIG['format'],
-    handlers=[
-        logging.FileHandler(log_dir / 'database_setup.log'),
-        logging.StreamHandler()
-    ]
-)
+from config import setup_logging, DB_CONFIG, DB_DSN, GOLD_MATERIALIZED_VIEWS
+
 logger = logging.getLogger(__name__)
 
+# Objects created by create_bronze_schema, used to skip the DDL on a warm schema
+BRONZE_TABLES = ['suppliers', 'products', 'warehouses', 'inventory', 'retail_stores', 'supply_orders']
+# Written as the database comment once setup has fully succeeded; bump it when
+# the DDL in this file changes so existing databases are set up again
+SCHEMA_VERSION_COMMENT = 'schema_version=2'
+
+BRONZE_INDEX_DEFINITIONS = {
+    'idx_products_supplier_id': 'bronze.products(supplier_id)',
+    'idx_inventory_product_id': 'bronze.inventory(product_id)',
+    # Covers the inventory side of gold.inventory_summary (join on warehouse_id,
+    # product_id, sum quantity_on_hand) so it can be read with an index-only
+    # scan; it also serves plain warehouse_id lookups, replacing the old index
+    'idx_inventory_wh_prod_qty': 'bronze.inventory(warehouse_id, product_id) INCLUDE (quantity_on_hand)',
+    'idx_supply_orders_product_id': 'bronze.supply_orders(product_id)',
+    'idx_supply_orders_warehouse_id': 'bronze.supply_orders(warehouse_id)',
+    'idx_supply_orders_retail_store_id': 'bronze.supply_orders(retail_store_id)',
+    'idx_supply_orders_order_date': 'bronze.supply_orders(order_date)',
+    'idx_supply_orders_status': 'bronze.supply_orders(status)'
+}
+BRONZE_INDEXES = list(BRONZE_INDEX_DEFINITIONS)
+
+
+def bronze_index_statements(concurrently=True):
+    """CREATE INDEX IF NOT EXISTS statements for every bronze index.
+
+    ``concurrently`` builds without blocking writers but must then be run
+    statement by statement in autocommit mode; plain builds can be sent
+    inside a transaction, e.g. to restore indexes on freshly emptied tables.
+    """
+    keyword = "CONCURRENTLY " if concurrently else ""
+    return [
+        f"CREATE INDEX {keyword}IF NOT EXISTS {index_name} ON {definition}"
+        for index_name, definition in BRONZE_INDEX_DEFINITIONS.items()
+    ]
+
+
+@contextmanager
+def bulk_load_mode(conn, tables=None):
+    """Switch autovacuum off for bronze tables while a bulk load runs.
+
+    Without this, autovacuum can start on a table halfway through a load and
+    compete with it for I/O, only to be made stale by the rest of the load.
+    The setting is reset on exit even if the load fails; the loader runs
+    ANALYZE on each table itself. Session settings for the load connections
+    (synchronous_commit, work_mem, ...) are set in bronze/data_loader.py.
+    """
+    tables = tables or BRONZE_TABLES
+    cursor = conn.cursor()
+    cursor.execute(";\n".join(
+        f"ALTER TABLE bronze.{table} SET (autovacuum_enabled = false)" for table in tables
+    ))
+    conn.commit()
+    try:
+        yield conn
+    finally:
+        conn.rollback()
+        cursor.execute(";\n".join(
+            f"ALTER TABLE bronze.{table} RESET (autovacuum_enabled)" for table in tables
+        ))
+        conn.commit()
+        cursor.close()
+
+
+def get_schema_version():
+    """Return the setup stamp on the supply_chain database, or None.
+
+    Read from pg_database via the postgres database, so it also works
+    before supply_chain exists.
+    """
+    try:
+        conn = psycopg2.connect(DB_DSN, dbname='postgres')
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT shobj_description(oid, 'pg_database')
+                FROM pg_database
+                WHERE datname = 'supply_chain'
+            """)
+            row = cursor.fetchone()
+            cursor.close()
+            return row[0] if row else None
+        finally:
+            conn.close()
+    except psycopg2.Error as e:
+        logger.warning("⚠️  Could not read schema version: %s", e)
+        return None
+
+
+def stamp_schema_version(conn):
+    """Record on the database that setup completed for SCHEMA_VERSION_COMMENT."""
+    try:
+        cursor = conn.cursor()
+        cursor.execute("COMMENT ON DATABASE supply_chain IS %s", (SCHEMA_VERSION_COMMENT,))
+        conn.commit()
+        cursor.close()
+        return True
+    except psycopg2.Error as e:
+        conn.rollback()
+        logger.warning("⚠️  Could not record schema version: %s", e)
+        return False
+
 
 def create_database():
     """Create the supply_chain database if it doesn't exist."""
     # Connect to default postgres database to create our database
-    default_config = DB_CONFIG.copy()
-    default_config['database'] = 'postgres'
-
     try:
-        conn = psycopg2.connect(**default_config)
+        conn = psycopg2.connect(DB_DSN, dbname='postgres')
         conn.autocommit = True
         cursor = conn.cursor()
 
@@ -48,22 +136,51 @@ def create_database():
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"❌ Error creating database: {e}")
+        logger.error("❌ Error creating database: %s", e)
         return False
 
 
-def create_bronze_schema():
+def bronze_schema_exists(cursor):
+    """Return True if every bronze table and index is already in place."""
+    # to_regnamespace() is NULL for a missing schema, where a ::regnamespace
+    # cast would raise on a fresh database
+    cursor.execute("""
+        SELECT
+            (SELECT count(*) FROM information_schema.tables
+             WHERE table_schema = 'bronze' AND table_name = ANY(%s)),
+            (SELECT count(*) FROM pg_index x
+             JOIN pg_class c ON c.oid = x.indexrelid
+             WHERE c.relnamespace = to_regnamespace('bronze')
+             AND c.relname = ANY(%s)
+             AND x.indisvalid)
+    """, (BRONZE_TABLES, BRONZE_INDEXES))
+    table_count, index_count = cursor.fetchone()
+    return table_count == len(BRONZE_TABLES) and index_count == len(BRONZE_INDEXES)
+
+
+def create_bronze_schema(conn=None):
     """Create bronze schema and tables."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
+        # One catalog probe instead of re-running every CREATE ... IF NOT EXISTS,
+        # each of which briefly takes a lock on an already-built schema
+        if bronze_schema_exists(cursor):
+            logger.info("✓ Bronze schema, tables and indexes already present")
+            cursor.close()
+            return True
+
+        # All DDL goes to the server as one multi-statement string (one round-trip)
+        statements = []
+
         # Create bronze schema
-        cursor.execute("CREATE SCHEMA IF NOT EXISTS bronze")
-        logger.info("✓ Bronze schema created/verified")
+        statements.append("CREATE SCHEMA IF NOT EXISTS bronze")
 
         # Create suppliers table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.suppliers (
                 supplier_id INT PRIMARY KEY,
                 supplier_name TEXT,
@@ -71,10 +188,9 @@ def create_bronze_schema():
                 phone_number TEXT
             )
         """)
-        logger.info("✓ Table 'bronze.suppliers' created/verified")
 
         # Create products table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.products (
                 product_id INT PRIMARY KEY,
                 product_name TEXT,
@@ -85,10 +201,9 @@ def create_bronze_schema():
                 status TEXT
             )
         """)
-        logger.info("✓ Table 'bronze.products' created/verified")
 
         # Create warehouses table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.warehouses (
                 warehouse_id INT PRIMARY KEY,
                 warehouse_name TEXT,
@@ -97,10 +212,9 @@ def create_bronze_schema():
                 storage_capacity INT
             )
         """)
-        logger.info("✓ Table 'bronze.warehouses' created/verified")
 
         # Create inventory table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.inventory (
                 inventory_id INT PRIMARY KEY,
                 product_id INT,
@@ -109,10 +223,9 @@ def create_bronze_schema():
                 last_stocked_date DATE
             )
         """)
-        logger.info("✓ Table 'bronze.inventory' created/verified")
 
         # Create retail_stores table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.retail_stores (
                 retail_store_id INT PRIMARY KEY,
                 store_name TEXT,
@@ -122,10 +235,9 @@ def create_bronze_schema():
                 store_status TEXT
             )
         """)
-        logger.info("✓ Table 'bronze.retail_stores' created/verified")
 
         # Create supply_orders table
-        cursor.execute("""
+        statements.append("""
             CREATE TABLE IF NOT EXISTS bronze.supply_orders (
                 supply_order_id INT PRIMARY KEY,
                 product_id TEXT,
@@ -140,42 +252,95 @@ def create_bronze_schema():
                 status TEXT
             )
         """)
-        logger.info("✓ Table 'bronze.supply_orders' created/verified")
-
-        # Create indexes for better performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_supplier_id ON bronze.products(supplier_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_inventory_product_id ON bronze.inventory(product_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_inventory_warehouse_id ON bronze.inventory(warehouse_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_orders_product_id ON bronze.supply_orders(product_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_orders_warehouse_id ON bronze.supply_orders(warehouse_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_orders_retail_store_id ON bronze.supply_orders(retail_store_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_orders_order_date ON bronze.supply_orders(order_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_supply_orders_status ON bronze.supply_orders(status)")
-        logger.info("✓ Database indexes created/verified")
 
+        cursor.execute(";\n".join(statements))
         conn.commit()
+        logger.info("✓ Bronze schema created/verified")
+        logger.info("\n".join(f"✓ Table 'bronze.{table}' created/verified" for table in BRONZE_TABLES))
+
+        # Indexes are built CONCURRENTLY so a rerun against a populated database
+        # never blocks writers. CONCURRENTLY cannot run inside a transaction
+        # block, so each statement is sent on its own in autocommit mode.
+        index_statements = [
+            # Superseded by idx_inventory_wh_prod_qty
+            "DROP INDEX CONCURRENTLY IF EXISTS bronze.idx_inventory_warehouse_id",
+            # order_date is raw sheet text loaded by upsert, so neither its physical
+            # nor its sort order follows the dates and a BRIN index never pruned;
+            # drop the one earlier setups built; the B-tree in BRONZE_INDEX_DEFINITIONS replaces it
+            "DROP INDEX CONCURRENTLY IF EXISTS bronze.idx_supply_orders_order_date_brin"
+        ] + bronze_index_statements()
+
+        # A CONCURRENTLY build that failed earlier leaves an INVALID index behind,
+        # which IF NOT EXISTS would skip; drop those so they are rebuilt
+        cursor.execute("""
+            SELECT c.relname
+            FROM pg_index x
+            JOIN pg_class c ON c.oid = x.indexrelid
+            WHERE c.relnamespace = to_regnamespace('bronze')
+            AND c.relname = ANY(%s)
+            AND NOT x.indisvalid
+        """, (BRONZE_INDEXES,))
+        invalid_indexes = [index_name for (index_name,) in cursor.fetchall()]
+        conn.commit()
+        index_statements = [
+            f"DROP INDEX CONCURRENTLY IF EXISTS bronze.{index_name}" for index_name in invalid_indexes
+        ] + index_statements
+
+        conn.autocommit = True
+        try:
+            # Give B-tree builds more memory and let them use parallel workers
+            cursor.execute("SET maintenance_work_mem = '1GB'")
+            cursor.execute("SET max_parallel_maintenance_workers = 4")
+            for statement in index_statements:
+                cursor.execute(statement)
+            cursor.execute("RESET maintenance_work_mem")
+            cursor.execute("RESET max_parallel_maintenance_workers")
+        finally:
+            conn.autocommit = False
+        logger.info("✓ Database indexes created/verified")
+
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"❌ Error creating bronze schema/tables: {e}")
+        if conn is not None:
+            conn.rollback()
+        logger.error("❌ Error creating bronze schema/tables: %s", e)
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def create_silver_gold_views():
+def create_silver_gold_views(conn=None):
     """Create views and tables for Silver and Gold layers."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
+        # Gold aggregates are materialized so reads don't re-run the join/aggregation;
+        # plain views left behind by older setups are found first so they can be
+        # dropped in the same batch as the rest of the DDL
+        cursor.execute("""
+            SELECT n.nspname || '.' || c.relname
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relkind = 'v'
+            AND n.nspname || '.' || c.relname = ANY(%s)
+        """, (GOLD_MATERIALIZED_VIEWS,))
+        stale_views = [view_name for (view_name,) in cursor.fetchall()]
+
+        # All DDL goes to the server as one multi-statement string (one round-trip)
+        statements = []
+
         # Create silver and gold schemas
-        cursor.execute("CREATE SCHEMA IF NOT EXISTS silver")
-        cursor.execute("CREATE SCHEMA IF NOT EXISTS gold")
-        logger.info("✓ Silver and Gold schemas created/verified")
+        statements.append("CREATE SCHEMA IF NOT EXISTS silver")
+        statements.append("CREATE SCHEMA IF NOT EXISTS gold")
 
         # Silver layer - cleaned and validated data
-        cursor.execute("""
+        statements.append("""
             CREATE OR REPLACE VIEW silver.suppliers_clean AS
             SELECT
                 supplier_id,
@@ -188,7 +353,7 @@ def create_silver_gold_views():
             AND phone_number IS NOT NULL
         """)
 
-        cursor.execute("""
+        statements.append("""
             CREATE OR REPLACE VIEW silver.products_clean AS
             SELECT
                 p.product_id,
@@ -203,9 +368,13 @@ def create_silver_gold_views():
         """)
 
         # Gold layer - business metrics and aggregations
-        cursor.execute("""
-            CREATE OR REPLACE VIEW gold.inventory_summary AS
+        for view_name in stale_views:
+            statements.append(f"DROP VIEW {view_name} CASCADE")
+
+        statements.append("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS gold.inventory_summary AS
             SELECT
+                w.warehouse_id,
                 w.warehouse_name,
                 w.city,
                 w.region,
@@ -218,9 +387,11 @@ def create_silver_gold_views():
             LEFT JOIN bronze.products p ON i.product_id = p.product_id
             GROUP BY w.warehouse_id, w.warehouse_name, w.city, w.region
         """)
+        # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        statements.append("CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_summary_warehouse_id ON gold.inventory_summary(warehouse_id)")
 
-        cursor.execute("""
-            CREATE OR REPLACE VIEW gold.supply_order_metrics AS
+        statements.append("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS gold.supply_order_metrics AS
             SELECT
                 so.order_date,
                 so.status,
@@ -235,10 +406,12 @@ def create_silver_gold_views():
             GROUP BY so.order_date, so.status
             ORDER BY so.order_date DESC
         """)
+        statements.append("CREATE UNIQUE INDEX IF NOT EXISTS idx_supply_order_metrics_date_status ON gold.supply_order_metrics(order_date, status)")
 
-        cursor.execute("""
-            CREATE OR REPLACE VIEW gold.retail_store_performance AS
+        statements.append("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS gold.retail_store_performance AS
             SELECT
+                rs.retail_store_id,
                 rs.store_name,
                 rs.city,
                 rs.region,
@@ -255,23 +428,40 @@ def create_silver_gold_views():
             GROUP BY rs.retail_store_id, rs.store_name, rs.city, rs.region, rs.store_type
             ORDER BY total_revenue DESC NULLS LAST
         """)
+        statements.append("CREATE UNIQUE INDEX IF NOT EXISTS idx_retail_store_performance_store_id ON gold.retail_store_performance(retail_store_id)")
 
+        cursor.execute(";\n".join(statements))
+        logger.info("✓ Silver and Gold schemas created/verified")
+        if stale_views:
+            logger.info("\n".join(f"✓ Dropped plain view {view_name} (replaced by materialized view)"
+                                  for view_name in stale_views))
         logger.info("✓ Silver and Gold layer views created")
 
         conn.commit()
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"❌ Error creating Silver/Gold views: {e}")
+        if conn is not None:
+            conn.rollback()
+        logger.error("❌ Error creating Silver/Gold views: %s", e)
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def test_connection():
-    """Test the database connection and verify table structure."""
+def test_connection(exact=False, conn=None):
+    """Test the database connection and verify table structure.
+
+    Tables and materialized views in bronze, silver and gold are listed from
+    one pg_class query with their reltuples estimates; pass ``exact=True`` to
+    run a full COUNT(*) per relation instead.
+    """
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         # Test basic connection
@@ -279,93 +469,186 @@ def test_connection():
         version = cursor.fetchone()[0]
         logger.info("✓ Successfully connected to PostgreSQL")
 
-        # Test table access and show record counts
-        tables = ['suppliers', 'products', 'warehouses', 'inventory', 'retail_stores', 'supply_orders']
-        logger.info("\n📊 Bronze Layer Tables:")
-        logger.info("-" * 40)
+        # One catalog lookup lists every table and materialized view in the
+        # three layers together with its planner row estimate
+        cursor.execute("""
+            SELECT n.nspname, c.relname, c.reltuples::bigint
+            FROM pg_class c
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            WHERE n.nspname IN ('bronze', 'silver', 'gold') AND c.relkind IN ('r', 'm')
+            ORDER BY n.nspname, c.relname
+        """)
+        relations = {(schema, name): estimate for schema, name, estimate in cursor.fetchall()}
+        # Staging tables used by the loader are not part of the layer
+        relations = {key: value for key, value in relations.items() if not key[1].endswith('_stage')}
 
-        for table in tables:
+        missing = [table for table in BRONZE_TABLES if ('bronze', table) not in relations]
+        for table in missing:
+            logger.error("  ❌ Table bronze.%s not found", table)
+
+        if exact and relations:
+            # All exact counts in one UNION ALL round-trip
             try:
-                cursor.execute(f"SELECT COUNT(*) FROM bronze.{table}")
-                count = cursor.fetchone()[0]
-                logger.info(f"  ✓ {table:<15}: {count:>8,} records")
+                cursor.execute(sql.SQL(" UNION ALL ").join(
+                    sql.SQL("SELECT {}, {}, COUNT(*) FROM {}").format(
+                        sql.Literal(schema), sql.Literal(name), sql.Identifier(schema, name)
+                    )
+                    for schema, name in relations
+                ))
+                relations.update({(schema, name): count for schema, name, count in cursor.fetchall()})
             except psycopg2.Error as e:
-                logger.error(f"  ❌ Error accessing bronze.{table}: {e}")
+                logger.error("  ❌ Error counting tables: %s", e)
+                conn.rollback()
+                return False
+        elif not exact:
+            logger.info("ℹ️  Record counts are pg_class.reltuples estimates; use --exact for COUNT(*)")
+
+        lines = []
+        for layer in ('bronze', 'silver', 'gold'):
+            lines.append(f"\n📊 {layer.capitalize()} Layer Tables:")
+            lines.append("-" * 40)
+            names = [name for schema, name in relations if schema == layer]
+            if not names:
+                lines.append("  - none found")
+            for name in names:
+                count = relations[(layer, name)]
+                if exact:
+                    lines.append(f"  ✓ {name:<30}: {count:>8} records")
+                elif count < 0:
+                    # reltuples is -1 until the table has been vacuumed or analyzed
+                    lines.append(f"  ✓ {name:<30}: not yet analyzed")
+                else:
+                    lines.append(f"  ✓ {name:<30}: ~{count:>7} records (estimate)")
+        logger.info("\n".join(lines))
 
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"❌ Connection test failed: {e}")
+        if conn is not None:
+            conn.rollback()
+        logger.error("❌ Connection test failed: %s", e)
         logger.info("\n🔧 Troubleshooting tips:")
         logger.info("1. Make sure PostgreSQL is running")
         logger.info("2. Check your database credentials in config.py")
         logger.info("3. Ensure the user has necessary permissions")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def drop_all_tables():
+def drop_all_tables(conn=None):
     """Drop all tables and schemas - USE WITH CAUTION!"""
     logger.warning("⚠️  WARNING: This will delete ALL data!")
 
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         # Drop tables in reverse order to avoid foreign key conflicts
         tables = ['supply_orders', 'inventory', 'retail_stores', 'products', 'warehouses', 'suppliers']
+        schemas = ['gold', 'silver', 'bronze']
 
-        for table in tables:
-            cursor.execute(f"DROP TABLE IF EXISTS bronze.{table} CASCADE")
-            logger.info(f"✓ Dropped table bronze.{table}")
+        # Send every DROP in one multi-statement round-trip
+        statements = [f"DROP TABLE IF EXISTS bronze.{table} CASCADE" for table in tables]
+        statements += [f"DROP SCHEMA IF EXISTS {schema} CASCADE" for schema in schemas]
+        # The setup stamp no longer describes the database
+        statements.append("COMMENT ON DATABASE supply_chain IS NULL")
+        cursor.execute(";\n".join(statements))
 
-        # Drop schemas
-        schemas = ['gold', 'silver', 'bronze']
-        for schema in schemas:
-            cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
-            logger.info(f"✓ Dropped schema {schema}")
+        logger.info("\n".join([f"✓ Dropped table bronze.{table}" for table in tables] +
+                              [f"✓ Dropped schema {schema}" for schema in schemas]))
 
         conn.commit()
         cursor.close()
-        conn.close()
 
         logger.info("✅ All tables and schemas dropped successfully")
         return True
 
     except psycopg2.Error as e:
-        logger.error(f"❌ Error dropping tables: {e}")
+        if conn is not None:
+            conn.rollback()
+        logger.error("❌ Error dropping tables: %s", e)
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
 def main():
     """Main setup function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Set up the Medallion database')
+    parser.add_argument('--exact', action='store_true',
+                        help='Use exact COUNT(*) instead of planner estimates when reporting table sizes')
+    parser.add_argument('--force', action='store_true',
+                        help='Run every setup step even if the database is already stamped as set up')
+    args = parser.parse_args()
+
+    setup_logging('database_setup.log')
     logger.info("🚀 Setting up Medallion Database - Bronze Layer")
     logger.info("=" * 60)
 
+    # A database stamped by a previous successful run only needs the connection test
+    if not args.force and get_schema_version() == SCHEMA_VERSION_COMMENT:
+        logger.info("✓ Database already set up (%s); skipping steps 1-3 (use --force to rerun)",
+                    SCHEMA_VERSION_COMMENT)
+        try:
+            conn = psycopg2.connect(DB_DSN)
+        except psycopg2.Error as e:
+            logger.error("❌ Database connection failed: %s", e)
+            sys.exit(1)
+        try:
+            logger.info("4. Testing connection...")
+            if not test_connection(exact=args.exact, conn=conn):
+                logger.error("❌ Connection test failed")
+                sys.exit(1)
+        finally:
+            conn.close()
+        return
+
     logger.info("1. Creating database...")
     if not create_database():
         logger.error("❌ Failed to create database")
         sys.exit(1)
 
-    logger.info("2. Creating bronze schema and tables...")
-    if not create_bronze_schema():
-        logger.error("❌ Failed to create bronze schema")
+    # The remaining steps all run against supply_chain, so they share one connection
+    try:
+        conn = psycopg2.connect(DB_DSN)
+    except psycopg2.Error as e:
+        logger.error("❌ Database connection failed: %s", e)
         sys.exit(1)
 
-    logger.info("3. Creating silver and gold views...")
-    if not create_silver_gold_views():
-        logger.warning("⚠️  Failed to create views, but continuing...")
-
-    logger.info("4. Testing connection...")
-    if not test_connection():
-        logger.error("❌ Connection test failed")
-        sys.exit(1)
+    try:
+        logger.info("2. Creating bronze schema and tables...")
+        if not create_bronze_schema(conn=conn):
+            logger.error("❌ Failed to create bronze schema")
+            sys.exit(1)
+
+        logger.info("3. Creating silver and gold views...")
+        views_ok = create_silver_gold_views(conn=conn)
+        if not views_ok:
+            logger.warning("⚠️  Failed to create views, but continuing...")
+
+        logger.info("4. Testing connection...")
+        if not test_connection(exact=args.exact, conn=conn):
+            logger.error("❌ Connection test failed")
+            sys.exit(1)
+
+        # Only a fully successful run is stamped, so a partial one is retried next time
+        if views_ok:
+            stamp_schema_version(conn)
+    finally:
+        conn.close()
 
     logger.info("\n🎉 Bronze Layer Database Setup Completed Successfully!")
     logger.info("=" * 60)
     logger.info("Next step: Run bronze/data_loader.py to load data")
-    logger.info(f"Database: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}")
+    logger.info("Database: %s:%s/%s", DB_CONFIG.host, DB_CONFIG.port, DB_CONFIG.database)
 
 
 if __name__ == "__main__":
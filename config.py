@@ -1,13 +1,47 @@
 import os
+import logging
+import logging.handlers
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote
+
+from psycopg2.extensions import make_dsn
+
+
+@dataclass(frozen=True, slots=True)
+class DbCfg:
+    """Immutable PostgreSQL connection settings."""
+    host: str
+    database: str
+    user: str
+    password: str
+    port: int
+
+    @property
+    def dsn(self):
+        """libpq connection string for these settings (values quoted by libpq's rules)."""
+        return make_dsn(host=self.host, dbname=self.database, user=self.user,
+                        password=self.password, port=self.port)
+
+    @property
+    def url(self):
+        """postgresql:// URL for these settings (for clients that take a URL, e.g. connectorx)."""
+        return (f"postgresql://{quote(self.user, safe='')}:{quote(self.password, safe='')}"
+                f"@{self.host}:{self.port}/{self.database}")
+
 
 # Database Configuration
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'database': os.getenv('DB_NAME', 'supply_chain'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', 'password123'),
-    'port': int(os.getenv('DB_PORT', '5432'))
-}
+DB_CONFIG = DbCfg(
+    host=os.getenv('DB_HOST', 'localhost'),
+    database=os.getenv('DB_NAME', 'supply_chain'),
+    user=os.getenv('DB_USER', 'postgres'),
+    password=os.getenv('DB_PASSWORD', 'password123'),
+    port=int(os.getenv('DB_PORT', '5432'))
+)
+
+# Connection string built once; pass to psycopg2.connect(DB_DSN)
+DB_DSN = DB_CONFIG.dsn
+DB_URL = DB_CONFIG.url
 
 # Google Sheets Configuration
 GOOGLE_SHEETS_CONFIG = {
@@ -26,9 +60,44 @@ SHEET_RANGES = {
     'supply_orders': 'SupplyOrders!A:L'
 }
 
+# Gold layer materialized views refreshed after each bronze load
+GOLD_MATERIALIZED_VIEWS = [
+    'gold.inventory_summary',
+    'gold.supply_order_metrics',
+    'gold.retail_store_performance'
+]
+
 # Logging Configuration
 LOG_CONFIG = {
     'level': 'INFO',
     'format': '%(asctime)s - %(levelname)s - %(message)s',
     'log_dir': 'logs'
 }
+
+
+def setup_logging(log_file):
+    """Configure root logging (file + console) once per process.
+
+    Later calls are no-ops, so a script imported by another entry point
+    keeps the caller's handlers instead of stacking its own. File output is
+    buffered in a MemoryHandler and written in batches (immediately for
+    errors, and at exit).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_dir = Path(__file__).parent / LOG_CONFIG['log_dir']
+    log_dir.mkdir(exist_ok=True)
+
+    file_handler = logging.FileHandler(log_dir / log_file)
+    file_handler.setFormatter(logging.Formatter(LOG_CONFIG['format']))
+
+    logging.basicConfig(
+        level=getattr(logging, LOG_CONFIG['level']),
+        format=LOG_CONFIG['format'],
+        handlers=[
+            logging.handlers.MemoryHandler(capacity=1024, target=file_handler),
+            logging.StreamHandler()
+        ]
+    )
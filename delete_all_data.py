@@ -1,107 +1,221 @@
 import psycopg2
+from psycopg2 import sql
 import sys
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.pool import ThreadedConnectionPool
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent))
-from config import DB_CONFIG, LOG_CONFIG
-
-# Set up logging
-log_dir = Path(__file__).parent / LOG_CONFIG['log_dir']
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=getattr(logging, LOG_CONFIG['level']),
-    format=LOG_CONFIG['format'],
-    handlers=[
-        logging.FileHandler(log_dir / 'delete_all_data.log'),
-        logging.StreamHandler()
-    ]
-)
+from config import setup_logging, DB_DSN, GOLD_MATERIALIZED_VIEWS
+from bronze.database_setup import BRONZE_INDEXES, bronze_index_statements
+
+# Handlers are attached in main(), so importing this module opens no log file
 logger = logging.getLogger(__name__)
 
+# Silver/gold BASE TABLE names, looked up once per run by list_base_tables
+_base_tables_cache = None
+
+
+def list_base_tables(cursor, schema):
+    """Return the BASE TABLE names in the silver or gold schema.
+
+    Both schemas are read with one information_schema query on first use and
+    cached for the rest of the run; call clear_base_tables_cache() after
+    creating or dropping tables.
+    """
+    global _base_tables_cache
+    if _base_tables_cache is None:
+        cursor.execute("""
+            SELECT table_schema, table_name
+            FROM information_schema.tables
+            WHERE table_schema IN ('silver', 'gold') AND table_type = 'BASE TABLE'
+            ORDER BY table_schema, table_name
+        """)
+        tables = {'silver': [], 'gold': []}
+        for table_schema, table_name in cursor.fetchall():
+            tables[table_schema].append(table_name)
+        _base_tables_cache = tables
+    return _base_tables_cache[schema]
+
+
+def clear_base_tables_cache():
+    """Forget the cached silver/gold table list so the next lookup re-reads it."""
+    global _base_tables_cache
+    _base_tables_cache = None
 
-def get_table_counts():
-    """Get record counts for all tables before deletion."""
+
+def list_gold_materialized_views(cursor):
+    """Return the GOLD_MATERIALIZED_VIEWS that exist as materialized views."""
+    cursor.execute("""
+        SELECT n.nspname || '.' || c.relname
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind = 'm'
+        AND n.nspname || '.' || c.relname = ANY(%s)
+    """, (GOLD_MATERIALIZED_VIEWS,))
+    return [view_name for (view_name,) in cursor.fetchall()]
+
+
+def refresh_gold_materialized_views(cursor):
+    """Rebuild the gold materialized views so they drop the deleted bronze rows.
+
+    A plain (non-concurrent) REFRESH is used: it runs inside the caller's
+    transaction and rewrites the view in one pass, where CONCURRENTLY would
+    diff the old contents row by row.
+    """
+    views = list_gold_materialized_views(cursor)
+    for view_name in views:
+        cursor.execute(sql.SQL("REFRESH MATERIALIZED VIEW {}").format(table_identifier(view_name)))
+    return views
+
+
+def table_identifier(table):
+    """Quoted identifier for a schema-qualified table name such as 'bronze.products'."""
+    return sql.Identifier(*table.split('.'))
+
+
+def count_rows(cursor, tables):
+    """Exact row counts for several schema-qualified tables in one UNION ALL round-trip."""
+    if not tables:
+        return {}
+    cursor.execute(sql.SQL(" UNION ALL ").join(
+        sql.SQL("SELECT {}, COUNT(*) FROM {}").format(sql.Literal(table), table_identifier(table))
+        for table in tables
+    ))
+    return dict(cursor.fetchall())
+
+
+def tables_with_rows(cursor, tables):
+    """Return the schema-qualified tables that still contain at least one row.
+
+    Uses EXISTS instead of COUNT(*), so each table stops at its first row.
+    """
+    if not tables:
+        return []
+    cursor.execute(sql.SQL(" UNION ALL ").join(
+        sql.SQL("SELECT {}, EXISTS (SELECT 1 FROM {})").format(sql.Literal(table), table_identifier(table))
+        for table in tables
+    ))
+    return [table for table, has_rows in cursor.fetchall() if has_rows]
+
+
+def delete_all_rows(cursor, tables):
+    """DELETE every row from several schema-qualified tables in one round-trip.
+
+    Each DELETE runs as a data-modifying CTE of a single statement, which
+    still reports how many rows were removed from each table.
+    """
+    if not tables:
+        return {}
+    ctes = sql.SQL(",\n").join(
+        sql.SQL("{} AS (DELETE FROM {} RETURNING 1)").format(sql.Identifier(f"d{i}"), table_identifier(table))
+        for i, table in enumerate(tables)
+    )
+    counts = sql.SQL(", ").join(
+        sql.SQL("(SELECT COUNT(*) FROM {})").format(sql.Identifier(f"d{i}")) for i in range(len(tables))
+    )
+    cursor.execute(sql.SQL("WITH {}\nSELECT {}").format(ctes, counts))
+    return dict(zip(tables, cursor.fetchone()))
+
+
+def estimate_rows(cursor, tables):
+    """Live-row estimates for schema-qualified tables from pg_stat_user_tables.
+
+    One catalog query with no table scans; tables without statistics are
+    reported as 'N/A'.
+    """
+    cursor.execute("""
+        SELECT schemaname || '.' || relname, n_live_tup
+        FROM pg_stat_user_tables
+        WHERE schemaname IN ('bronze', 'silver', 'gold')
+    """)
+    estimates = dict(cursor.fetchall())
+    return {table: estimates.get(table, 'N/A') for table in tables}
+
+
+def get_table_counts(conn=None, exact=False):
+    """Get record counts for all tables before deletion.
+
+    Counts are pg_stat_user_tables estimates unless ``exact`` is set, in
+    which case every table is counted with one UNION ALL query.
+    """
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
-        counts = {}
-
         # Bronze tables
         bronze_tables = ['suppliers', 'products', 'warehouses', 'inventory', 'retail_stores', 'supply_orders']
-        logger.info("📊 Current data counts:")
-        logger.info("-" * 40)
-
-        for table in bronze_tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM bronze.{table}")
-                count = cursor.fetchone()[0]
-                counts[f'bronze.{table}'] = count
-                logger.info(f"  bronze.{table:<15}: {count:>8,} records")
-            except psycopg2.Error as e:
-                logger.warning(f"  ⚠️  Could not count bronze.{table}: {e}")
-                counts[f'bronze.{table}'] = 'N/A'
 
         # Check for silver tables (not just views)
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'silver' AND table_type = 'BASE TABLE'
-        """)
-        silver_tables = cursor.fetchall()
+        silver_tables = list_base_tables(cursor, 'silver')
 
-        if silver_tables:
-            logger.info("\n  Silver tables:")
-            for (table_name,) in silver_tables:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name}")
-                    count = cursor.fetchone()[0]
-                    counts[f'silver.{table_name}'] = count
-                    logger.info(f"  silver.{table_name:<15}: {count:>8,} records")
-                except psycopg2.Error as e:
-                    logger.warning(f"  ⚠️  Could not count silver.{table_name}: {e}")
-                    counts[f'silver.{table_name}'] = 'N/A'
+        # Check for gold tables
+        gold_tables = list_base_tables(cursor, 'gold')
+
+        # Count every table in a single query
+        all_tables = ([f'bronze.{t}' for t in bronze_tables] +
+                      [f'silver.{t}' for t in silver_tables] +
+                      [f'gold.{t}' for t in gold_tables])
+        try:
+            if exact:
+                counts = count_rows(cursor, all_tables)
+            else:
+                counts = estimate_rows(cursor, all_tables)
+        except psycopg2.Error as e:
+            logger.warning(f"  ⚠️  Could not count tables: {e}")
+            conn.rollback()
+            counts = {table: 'N/A' for table in all_tables}
+
+        # The whole report is built first and logged as one record
+        def count_line(table, width):
+            count = counts[table]
+            if count == 'N/A':
+                return f"  ⚠️  Could not count {table}"
+            return f"  {table:<{width}}: {count:>8,} records"
+
+        if exact:
+            lines = ["📊 Current data counts:"]
         else:
-            logger.info("  No silver tables found (only views exist)")
+            lines = ["📊 Current data counts (estimated; use --exact for COUNT(*)):"]
+        lines.append("-" * 40)
+        lines.extend(count_line(f'bronze.{table}', 22) for table in bronze_tables)
 
-        # Check for gold tables
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'gold' AND table_type = 'BASE TABLE'
-        """)
-        gold_tables = cursor.fetchall()
+        if silver_tables:
+            lines.append("\n  Silver tables:")
+            lines.extend(count_line(f'silver.{table}', 22) for table in silver_tables)
+        else:
+            lines.append("  No silver tables found (only views exist)")
 
         if gold_tables:
-            logger.info("\n  Gold tables:")
-            for (table_name,) in gold_tables:
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM gold.{table_name}")
-                    count = cursor.fetchone()[0]
-                    counts[f'gold.{table_name}'] = count
-                    logger.info(f"  gold.{table_name:<20}: {count:>8,} records")
-                except psycopg2.Error as e:
-                    logger.warning(f"  ⚠️  Could not count gold.{table_name}: {e}")
-                    counts[f'gold.{table_name}'] = 'N/A'
+            lines.append("\n  Gold tables:")
+            lines.extend(count_line(f'gold.{table}', 25) for table in gold_tables)
         else:
-            logger.info("  No gold tables found")
+            lines.append("  No gold tables found")
+        logger.info("\n".join(lines))
 
         cursor.close()
-        conn.close()
         return counts
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error getting table counts: {e}")
         return {}
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def delete_bronze_data():
+def delete_bronze_data(conn=None):
     """Delete all data from bronze layer tables."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         # Tables in deletion order (reverse of creation to respect foreign keys)
@@ -117,320 +231,473 @@ def delete_bronze_data():
         logger.info("🗑️  Deleting bronze layer data...")
         total_deleted = 0
 
+        # Deleted rows would leave a dead entry in every index for VACUUM to
+        # clean up; instead the indexes are dropped first and rebuilt on the
+        # empty tables afterwards, all inside the same transaction.
+        # All DELETEs go out as one statement; per-table counts come back with it
+        try:
+            cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(
+                sql.SQL(", ").join(sql.Identifier('bronze', index_name) for index_name in BRONZE_INDEXES)
+            ))
+            deleted_counts = delete_all_rows(cursor, [f"bronze.{table}" for table in tables_to_delete])
+            cursor.execute(";\n".join(bronze_index_statements(concurrently=False)))
+        except psycopg2.Error as e:
+            logger.error(f"  ❌ Error deleting bronze layer data: {e}")
+            conn.rollback()
+            return False
+
+        lines = []
         for table in tables_to_delete:
-            try:
-                # Get count before deletion
-                cursor.execute(f"SELECT COUNT(*) FROM bronze.{table}")
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    # Delete all records
-                    cursor.execute(f"DELETE FROM bronze.{table}")
-                    deleted = cursor.rowcount
-                    total_deleted += deleted
-                    logger.info(f"  ✓ bronze.{table:<15}: {deleted:>8,} records deleted")
-                else:
-                    logger.info(f"  - bronze.{table:<15}: already empty")
-
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error deleting from bronze.{table}: {e}")
-                conn.rollback()
-                return False
-
-        # Commit all deletions
-        conn.commit()
+            deleted = deleted_counts[f"bronze.{table}"]
+            total_deleted += deleted
+            if deleted > 0:
+                lines.append(f"  ✓ bronze.{table:<15}: {deleted:>8,} records deleted")
+            else:
+                lines.append(f"  - bronze.{table:<15}: already empty")
+        logger.info("\n".join(lines))
+
+        # A shared connection is committed by the caller as one transaction
+        if own_conn:
+            conn.commit()
         logger.info(f"\n✅ Bronze layer cleanup completed: {total_deleted:,} total records deleted")
 
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error during bronze data deletion: {e}")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def delete_silver_data():
+def delete_silver_data(conn=None):
     """Delete all data from silver layer tables (if any exist)."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         # Find all silver tables (not views)
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'silver' AND table_type = 'BASE TABLE'
-            ORDER BY table_name
-        """)
-        silver_tables = cursor.fetchall()
+        silver_tables = list_base_tables(cursor, 'silver')
 
         if not silver_tables:
             logger.info("🔍 No silver tables found to delete (only views exist)")
             cursor.close()
-            conn.close()
             return True
 
         logger.info("🗑️  Deleting silver layer data...")
         total_deleted = 0
 
-        for (table_name,) in silver_tables:
-            try:
-                # Get count before deletion
-                cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name}")
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    # Delete all records
-                    cursor.execute(f"DELETE FROM silver.{table_name}")
-                    deleted = cursor.rowcount
-                    total_deleted += deleted
-                    logger.info(f"  ✓ silver.{table_name:<15}: {deleted:>8,} records deleted")
-                else:
-                    logger.info(f"  - silver.{table_name:<15}: already empty")
-
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error deleting from silver.{table_name}: {e}")
-                conn.rollback()
-                return False
-
-        # Commit all deletions
-        conn.commit()
+        # All DELETEs go out as one statement; per-table counts come back with it
+        try:
+            deleted_counts = delete_all_rows(cursor, [f"silver.{table_name}" for table_name in silver_tables])
+        except psycopg2.Error as e:
+            logger.error(f"  ❌ Error deleting silver layer data: {e}")
+            conn.rollback()
+            return False
+
+        lines = []
+        for table_name in silver_tables:
+            deleted = deleted_counts[f"silver.{table_name}"]
+            total_deleted += deleted
+            if deleted > 0:
+                lines.append(f"  ✓ silver.{table_name:<15}: {deleted:>8,} records deleted")
+            else:
+                lines.append(f"  - silver.{table_name:<15}: already empty")
+        logger.info("\n".join(lines))
+
+        # A shared connection is committed by the caller as one transaction
+        if own_conn:
+            conn.commit()
         logger.info(f"\n✅ Silver layer cleanup completed: {total_deleted:,} total records deleted")
 
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error during silver data deletion: {e}")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def delete_gold_data():
+def delete_gold_data(conn=None):
     """Delete all data from gold layer tables."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         # Find all gold tables
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'gold' AND table_type = 'BASE TABLE'
-            ORDER BY table_name
-        """)
-        gold_tables = cursor.fetchall()
+        gold_tables = list_base_tables(cursor, 'gold')
 
         if not gold_tables:
             logger.info("🔍 No gold tables found to delete")
             cursor.close()
-            conn.close()
             return True
 
         logger.info("🗑️  Deleting gold layer data...")
         total_deleted = 0
 
-        for (table_name,) in gold_tables:
-            try:
-                # Get count before deletion
-                cursor.execute(f"SELECT COUNT(*) FROM gold.{table_name}")
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    # Delete all records
-                    cursor.execute(f"DELETE FROM gold.{table_name}")
-                    deleted = cursor.rowcount
-                    total_deleted += deleted
-                    logger.info(f"  ✓ gold.{table_name:<20}: {deleted:>8,} records deleted")
-                else:
-                    logger.info(f"  - gold.{table_name:<20}: already empty")
-
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error deleting from gold.{table_name}: {e}")
-                conn.rollback()
-                return False
-
-        # Commit all deletions
-        conn.commit()
+        # All DELETEs go out as one statement; per-table counts come back with it
+        try:
+            deleted_counts = delete_all_rows(cursor, [f"gold.{table_name}" for table_name in gold_tables])
+        except psycopg2.Error as e:
+            logger.error(f"  ❌ Error deleting gold layer data: {e}")
+            conn.rollback()
+            return False
+
+        lines = []
+        for table_name in gold_tables:
+            deleted = deleted_counts[f"gold.{table_name}"]
+            total_deleted += deleted
+            if deleted > 0:
+                lines.append(f"  ✓ gold.{table_name:<20}: {deleted:>8,} records deleted")
+            else:
+                lines.append(f"  - gold.{table_name:<20}: already empty")
+        logger.info("\n".join(lines))
+
+        # A shared connection is committed by the caller as one transaction
+        if own_conn:
+            conn.commit()
         logger.info(f"\n✅ Gold layer cleanup completed: {total_deleted:,} total records deleted")
 
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error during gold data deletion: {e}")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
+
 
+def truncate_all_data(conn=None):
+    """Empty every bronze, silver and gold table with a single TRUNCATE.
 
-def reset_sequences():
-    """Reset auto-increment sequences for primary keys."""
+    TRUNCATE drops the table files instead of deleting and WAL-logging each
+    row, and RESTART IDENTITY resets owned sequences in the same statement,
+    so no separate reset_sequences pass is needed.
+    """
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
-        logger.info("🔄 Resetting sequences...")
+        bronze_tables = ['supply_orders', 'inventory', 'retail_stores', 'products', 'warehouses', 'suppliers']
 
-        # List of tables with auto-increment primary keys
-        tables_with_sequences = [
-            'suppliers',
-            'products',
-            'warehouses',
-            'inventory',
-            'retail_stores',
-            'supply_orders'
-        ]
+        # Silver and gold tables are created by their builders, so look them up
+        all_tables = ([f'bronze.{t}' for t in bronze_tables] +
+                      [f'silver.{t}' for t in list_base_tables(cursor, 'silver')] +
+                      [f'gold.{t}' for t in list_base_tables(cursor, 'gold')])
+
+        logger.info("🗑️  Truncating bronze, silver and gold layer data...")
+        cursor.execute(sql.SQL("TRUNCATE {} RESTART IDENTITY CASCADE").format(
+            sql.SQL(", ").join(table_identifier(table) for table in all_tables)
+        ))
+        # The gold aggregates are materialized views over bronze, which
+        # TRUNCATE does not touch; rebuild them in the same transaction
+        refreshed_views = refresh_gold_materialized_views(cursor)
+        if own_conn:
+            conn.commit()
 
-        for table in tables_with_sequences:
-            try:
-                # Check if sequence exists and reset it
-                cursor.execute(f"""
-                    SELECT pg_get_serial_sequence('bronze.{table}', '{table.rstrip('s')}_id')
-                """)
-                sequence_name = cursor.fetchone()[0]
+        logger.info("\n".join(f"  ✓ {table:<25}: truncated" for table in all_tables))
+        if refreshed_views:
+            logger.info("\n".join(f"  ✓ {view_name:<25}: refreshed" for view_name in refreshed_views))
+        logger.info(f"\n✅ Truncated {len(all_tables)} tables")
 
-                if sequence_name:
-                    cursor.execute(f"ALTER SEQUENCE {sequence_name} RESTART WITH 1")
-                    logger.info(f"  ✓ Reset sequence for bronze.{table}")
+        cursor.close()
+        return True
+
+    except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
+        logger.error(f"❌ Error truncating data: {e}")
+        return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
-            except psycopg2.Error as e:
-                logger.warning(f"  ⚠️  Could not reset sequence for bronze.{table}: {e}")
 
-        conn.commit()
+def reset_sequences(conn=None):
+    """Reset every sequence in the bronze schema back to 1."""
+    own_conn = conn is None
+    try:
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
+        cursor = conn.cursor()
+
+        logger.info("🔄 Resetting sequences...")
+
+        # Find the sequences straight from the catalog instead of guessing
+        # column names per table for pg_get_serial_sequence
+        cursor.execute("""
+            SELECT n.nspname, c.relname
+            FROM pg_class c
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            WHERE c.relkind = 'S' AND n.nspname = 'bronze'
+            ORDER BY c.relname
+        """)
+        sequences = [f"{schema}.{name}" for schema, name in cursor.fetchall()]
+
+        if not sequences:
+            logger.info("  - No sequences found in bronze schema")
+        else:
+            # Restart them all in one multi-statement round-trip
+            cursor.execute(sql.SQL(";\n").join(
+                sql.SQL("ALTER SEQUENCE {} RESTART WITH 1").format(table_identifier(sequence))
+                for sequence in sequences
+            ))
+            logger.info("\n".join(f"  ✓ Reset sequence {sequence}" for sequence in sequences))
+
+        if own_conn:
+            conn.commit()
         cursor.close()
-        conn.close()
         return True
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error resetting sequences: {e}")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def verify_deletion():
+def verify_deletion(conn=None):
     """Verify that all data has been deleted."""
+    own_conn = conn is None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if own_conn:
+            conn = psycopg2.connect(DB_DSN)
         cursor = conn.cursor()
 
         logger.info("🔍 Verifying deletion...")
 
         bronze_tables = ['suppliers', 'products', 'warehouses', 'inventory', 'retail_stores', 'supply_orders']
-        all_empty = True
-
-        for table in bronze_tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM bronze.{table}")
-                count = cursor.fetchone()[0]
-                if count > 0:
-                    logger.error(f"  ❌ bronze.{table} still has {count} records")
-                    all_empty = False
-                else:
-                    logger.info(f"  ✓ bronze.{table} is empty")
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error checking bronze.{table}: {e}")
-                all_empty = False
 
         # Check silver tables
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'silver' AND table_type = 'BASE TABLE'
-        """)
-        silver_tables = cursor.fetchall()
-
-        for (table_name,) in silver_tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name}")
-                count = cursor.fetchone()[0]
-                if count > 0:
-                    logger.error(f"  ❌ silver.{table_name} still has {count} records")
-                    all_empty = False
-                else:
-                    logger.info(f"  ✓ silver.{table_name} is empty")
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error checking silver.{table_name}: {e}")
-                all_empty = False
+        silver_tables = list_base_tables(cursor, 'silver')
 
         # Check gold tables
-        cursor.execute("""
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = 'gold' AND table_type = 'BASE TABLE'
-        """)
-        gold_tables = cursor.fetchall()
-
-        for (table_name,) in gold_tables:
-            try:
-                cursor.execute(f"SELECT COUNT(*) FROM gold.{table_name}")
-                count = cursor.fetchone()[0]
-                if count > 0:
-                    logger.error(f"  ❌ gold.{table_name} still has {count} records")
-                    all_empty = False
-                else:
-                    logger.info(f"  ✓ gold.{table_name} is empty")
-            except psycopg2.Error as e:
-                logger.error(f"  ❌ Error checking gold.{table_name}: {e}")
-                all_empty = False
+        gold_tables = list_base_tables(cursor, 'gold')
+
+        # Materialized views keep their rows until refreshed, so check them too
+        all_tables = ([f'bronze.{t}' for t in bronze_tables] +
+                      [f'silver.{t}' for t in silver_tables] +
+                      [f'gold.{t}' for t in gold_tables] +
+                      list_gold_materialized_views(cursor))
+
+        # One emptiness probe for every table
+        try:
+            non_empty = set(tables_with_rows(cursor, all_tables))
+        except psycopg2.Error as e:
+            logger.error(f"  ❌ Error checking tables: {e}")
+            conn.rollback()
+            return False
+
+        empty_lines = [f"  ✓ {table} is empty" for table in all_tables if table not in non_empty]
+        if empty_lines:
+            logger.info("\n".join(empty_lines))
+        if non_empty:
+            logger.error("\n".join(f"  ❌ {table} still has records" for table in all_tables if table in non_empty))
 
         cursor.close()
-        conn.close()
-        return all_empty
+        return not non_empty
 
     except psycopg2.Error as e:
+        if conn is not None:
+            conn.rollback()
         logger.error(f"❌ Error during verification: {e}")
         return False
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 
-def main():
-    """Main function to delete all bronze, silver, and gold data."""
-    logger.info("🚀 Starting Complete Data Deletion (Bronze, Silver, Gold)")
-    logger.info("=" * 70)
+def delete_upper_layers_concurrently(conn):
+    """DELETE gold and silver data at the same time on two pooled connections.
 
-    # Show current data counts
-    initial_counts = get_table_counts()
+    The two layers have no foreign keys into each other, so each runs and
+    commits in its own transaction. Returns True only if both succeeded.
+    """
+    # Fill the table-list cache once so the worker threads only read it
+    list_base_tables(conn.cursor(), 'gold')
+    conn.rollback()
 
-    # Confirm deletion
-    logger.info("\n⚠️  WARNING: This will delete ALL data from bronze, silver, and gold layers!")
-    logger.info("This action cannot be undone.")
+    pool = ThreadedConnectionPool(2, 2, DB_DSN)
+
+    def run_on_pooled_connection(delete_fn):
+        pooled_conn = pool.getconn()
+        try:
+            with pooled_conn:
+                return delete_fn(conn=pooled_conn)
+        finally:
+            pool.putconn(pooled_conn)
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gold_future = executor.submit(run_on_pooled_connection, delete_gold_data)
+            silver_future = executor.submit(run_on_pooled_connection, delete_silver_data)
+            gold_ok = gold_future.result()
+            silver_ok = silver_future.result()
+    finally:
+        pool.closeall()
+
+    if not gold_ok:
+        logger.error("❌ Failed to delete gold data")
+    if not silver_ok:
+        logger.error("❌ Failed to delete silver data")
+    return gold_ok and silver_ok
+
+
+def delete_layers(conn, serial=False):
+    """DELETE gold, silver and bronze data layer by layer, then reset sequences.
+
+    Gold and silver are deleted concurrently on their own connections, then
+    bronze, the sequence reset and the gold materialized view refresh run in
+    one transaction on ``conn``. With ``serial`` every step shares that
+    transaction: it commits once at the end, and a failure in any step leaves
+    every layer untouched.
+    """
+    if not serial:
+        logger.info("\n1-2. Deleting gold and silver layer data concurrently...")
+        if not delete_upper_layers_concurrently(conn):
+            sys.exit(1)
+
+    with conn:
+        if serial:
+            # Delete gold data first (dependencies)
+            logger.info("\n1. Deleting gold layer data...")
+            if not delete_gold_data(conn=conn):
+                logger.error("❌ Failed to delete gold data")
+                sys.exit(1)
+
+            # Delete silver data
+            logger.info("\n2. Deleting silver layer data...")
+            if not delete_silver_data(conn=conn):
+                logger.error("❌ Failed to delete silver data")
+                sys.exit(1)
+
+        # Delete bronze data
+        logger.info("\n3. Deleting bronze layer data...")
+        if not delete_bronze_data(conn=conn):
+            logger.error("❌ Failed to delete bronze data")
+            sys.exit(1)
+
+        # Reset sequences
+        logger.info("\n4. Resetting sequences...")
+        if not reset_sequences(conn=conn):
+            logger.warning("⚠️  Some sequences could not be reset")
+
+        # The gold materialized views still hold the pre-delete aggregates
+        logger.info("\n5. Refreshing gold materialized views...")
+        try:
+            refreshed_views = refresh_gold_materialized_views(conn.cursor())
+        except psycopg2.Error as e:
+            logger.error(f"❌ Failed to refresh gold materialized views: {e}")
+            conn.rollback()
+            sys.exit(1)
+        if refreshed_views:
+            logger.info("\n".join(f"  ✓ Refreshed {view_name}" for view_name in refreshed_views))
+        else:
+            logger.info("  - No gold materialized views found")
+
+
+def confirm_deletion(assume_yes=False):
+    """Return True if the deletion may go ahead.
+
+    ``assume_yes`` skips the prompt. Without it the user is only asked when
+    stdin is a terminal; under cron, Airflow or Docker there is nobody to
+    answer, so the run is refused instead of blocking on input().
+    """
+    if assume_yes:
+        logger.info("✓ Confirmation skipped (--yes)")
+        return True
+
+    if not sys.stdin.isatty():
+        logger.error("❌ stdin is not a terminal; pass --yes to delete without a prompt")
+        return False
 
     try:
         confirm = input("\nDo you want to continue? (yes/no): ").strip().lower()
-        if confirm not in ['yes', 'y']:
-            logger.info("❌ Deletion cancelled by user")
-            return
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         logger.info("\n❌ Deletion cancelled by user")
-        return
+        return False
 
-    logger.info("\n🗑️  Starting data deletion process...")
+    if confirm not in ['yes', 'y']:
+        logger.info("❌ Deletion cancelled by user")
+        return False
+    return True
 
-    # Delete gold data first (dependencies)
-    logger.info("\n1. Deleting gold layer data...")
-    if not delete_gold_data():
-        logger.error("❌ Failed to delete gold data")
-        sys.exit(1)
 
-    # Delete silver data
-    logger.info("\n2. Deleting silver layer data...")
-    if not delete_silver_data():
-        logger.error("❌ Failed to delete silver data")
-        sys.exit(1)
+def log_deletion_plan(tables, soft_delete=False):
+    """Log what a deletion run would do, without touching any data."""
+    logger.info("\n📝 Dry run - no data will be deleted")
+    if soft_delete:
+        logger.info("Method: DELETE per layer (gold, silver, bronze), then reset bronze sequences "
+                    "and refresh gold materialized views")
+    else:
+        logger.info("Method: one TRUNCATE ... RESTART IDENTITY CASCADE, then refresh gold materialized views")
+    for table in tables:
+        logger.info(f"  - would empty {table}")
+    logger.info(f"\n{len(tables)} tables would be emptied")
 
-    # Delete bronze data
-    logger.info("\n3. Deleting bronze layer data...")
-    if not delete_bronze_data():
-        logger.error("❌ Failed to delete bronze data")
-        sys.exit(1)
 
-    # Reset sequences
-    logger.info("\n4. Resetting sequences...")
-    if not reset_sequences():
-        logger.warning("⚠️  Some sequences could not be reset")
+def run_deletion(conn, soft_delete=False, exact=False, assume_yes=False, dry_run=False, serial=False):
+    """Count, confirm, delete and verify using the given connection.
+
+    By default all tables are emptied with one TRUNCATE; ``soft_delete``
+    uses per-table DELETE (row-level triggers fire) plus reset_sequences.
+    ``dry_run`` stops after logging the plan; ``assume_yes`` skips the prompt.
+    ``serial`` runs the soft-delete layers one after another in one transaction.
+    """
+    # Show current data counts
+    initial_counts = get_table_counts(conn=conn, exact=exact)
+    # End the read-only transaction so no locks are held while waiting for input
+    conn.rollback()
+
+    if dry_run:
+        log_deletion_plan(list(initial_counts), soft_delete=soft_delete)
+        return
+
+    # Confirm deletion
+    logger.info("\n⚠️  WARNING: This will delete ALL data from bronze, silver, and gold layers!")
+    logger.info("This action cannot be undone.")
+
+    if not confirm_deletion(assume_yes=assume_yes):
+        return
+
+    logger.info("\n🗑️  Starting data deletion process...")
+
+    if soft_delete:
+        delete_layers(conn, serial=serial)
+        verify_step = 6
+    else:
+        logger.info("\n1. Truncating all layers...")
+        with conn:
+            if not truncate_all_data(conn=conn):
+                logger.error("❌ Failed to truncate data")
+                sys.exit(1)
+        verify_step = 2
 
     # Verify deletion
-    logger.info("\n5. Verifying deletion...")
-    if verify_deletion():
+    logger.info(f"\n{verify_step}. Verifying deletion...")
+    if verify_deletion(conn=conn):
         logger.info("✅ All data successfully deleted and verified")
     else:
         logger.error("❌ Verification failed - some data may remain")
@@ -441,5 +708,40 @@ def main():
     logger.info("The table structures remain intact for future data loading.")
 
 
+def main():
+    """Main function to delete all bronze, silver, and gold data."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Delete all bronze, silver and gold data')
+    parser.add_argument('--soft-delete', action='store_true',
+                        help='Use DELETE per table instead of TRUNCATE ... RESTART IDENTITY CASCADE')
+    parser.add_argument('--exact', action='store_true',
+                        help='Show exact COUNT(*) row counts instead of statistics estimates')
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='Delete without asking for confirmation (for cron/Airflow/Docker runs)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Show the current counts and deletion plan without deleting anything')
+    parser.add_argument('--serial', action='store_true',
+                        help='With --soft-delete, delete gold and silver one after another in a single transaction')
+    args = parser.parse_args()
+
+    setup_logging('delete_all_data.log')
+    logger.info("🚀 Starting Complete Data Deletion (Bronze, Silver, Gold)")
+    logger.info("=" * 70)
+
+    # Every step runs over one connection instead of reconnecting per function
+    try:
+        conn = psycopg2.connect(DB_DSN)
+    except psycopg2.Error as e:
+        logger.error(f"❌ Database connection failed: {e}")
+        sys.exit(1)
+
+    try:
+        run_deletion(conn, soft_delete=args.soft_delete, exact=args.exact,
+                     assume_yes=args.yes, dry_run=args.dry_run, serial=args.serial)
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     main()
@@ -5,15 +5,29 @@ Comprehensive analysis of Bronze, Silver, and Gold layer data with insights gene
 
 import pandas as pd
 import numpy as np
+import polars as pl
+import matplotlib
+matplotlib.use('Agg')  # batch script: charts are only written to files
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import register_default_json, register_default_jsonb
+from psycopg2.pool import ThreadedConnectionPool
+from concurrent.futures import ThreadPoolExecutor
+import connectorx as cx
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import csv
+import itertools
 import warnings
 from datetime import datetime, timedelta
 import os
+import threading
 from pathlib import Path
 import sys
 
@@ -22,16 +36,508 @@ warnings.filterwarnings('ignore')
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG
+from config import DB_DSN, DB_URL
 
 # Set up plotting style
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
+# Large tables are read in parallel partitions split on their integer primary key
+PARTITIONED_TABLES = {
+    'inventory': 'inventory_id',
+    'supply_orders': 'supply_order_id'
+}
+READ_PARTITIONS = 8
+
+# Audit tables grow without bound and are streamed in batches of this many rows
+AUDIT_BATCH_ROWS = 50_000
+
+# Number of tables profiled / read at the same time by load_data
+LOAD_WORKERS = 8
+
+# String columns with fewer distinct values than this share of rows become 'category'
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Write buffer for the exported CSV files
+CSV_BUFFER_BYTES = 1 << 20
+
+# Resolution of the PNG charts; plenty for report-sized figures
+CHART_DPI = 150
+
+# Parquet footer key holding the source table fingerprint of a cached read
+CACHE_FINGERPRINT_KEY = b'source_fingerprint'
+
+
+def arrow_string_dtype(arrow_type):
+    """types_mapper for Table.to_pandas: keep Arrow strings, numpy for everything else.
+
+    Text stays in Arrow's contiguous UTF-8 buffers (nunique/value_counts/isna
+    run as Arrow kernels, no Python str objects); numeric columns stay numpy
+    so np.number selections and numpy math work unchanged.
+    """
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+def to_categories(df):
+    """Convert low-cardinality string columns of df to the 'category' dtype in place.
+
+    value_counts/groupby/duplicated on a categorical hash small integer codes
+    instead of Python strings, and the column takes a fraction of the memory.
+    """
+    if df.empty:
+        return df
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        values = df[col]
+        if pd.api.types.infer_dtype(values, skipna=True) != 'string':
+            continue
+        if values.nunique() / len(values) < CATEGORY_MAX_UNIQUE_RATIO:
+            df[col] = values.astype('category')
+    return df
+
+
+def memory_usage_mb(df, sample_rows=10_000):
+    """Estimate the in-memory size of df in MB without walking every string.
+
+    memory_usage(deep=True) sizes each Python string object, which is O(rows)
+    per object column. Fixed-width and Arrow-backed columns are measured
+    exactly; for object columns only the first sample_rows values are sized
+    and scaled up.
+    """
+    usage = df.memory_usage(index=True, deep=False)
+    n = len(df)
+    if n > sample_rows:
+        # Arrow-backed string columns already report their exact buffer size
+        text_cols = df.select_dtypes(include=['object']).columns
+        if len(text_cols):
+            sampled = df[text_cols].iloc[:sample_rows].memory_usage(index=False, deep=True)
+            usage[text_cols] = sampled * (n / sample_rows)
+    else:
+        usage = df.memory_usage(index=True, deep=True)
+    return usage.sum() / 1024 ** 2
+
+
+def shrink_numeric(df):
+    """Downcast the numeric columns of df to the smallest dtype holding their values.
+
+    Postgres integer and numeric columns arrive as int64/float64; most fit in
+    32 bits or less, which halves the bytes every later aggregation reads.
+    Non-negative *_id columns become unsigned. Floats go to float32, which is
+    enough precision for the displayed figures.
+    """
+    int_cols = df.select_dtypes(include='integer').columns
+    id_cols = [col for col in int_cols if col.endswith('_id')]
+    other_int_cols = [col for col in int_cols if not col.endswith('_id')]
+    float_cols = df.select_dtypes(include='floating').columns
+    if id_cols:
+        df[id_cols] = df[id_cols].apply(pd.to_numeric, downcast='unsigned')
+    if other_int_cols:
+        df[other_int_cols] = df[other_int_cols].apply(pd.to_numeric, downcast='integer')
+    if len(float_cols):
+        df[float_cols] = df[float_cols].apply(pd.to_numeric, downcast='float')
+    return df
+
+
+def top_k_sums(keys, values, k):
+    """Return the k largest per-key sums of values as a Series, largest first.
+
+    Same result as values.groupby(keys).sum().nlargest(k), but the sums are
+    accumulated by one np.bincount over the factorized keys and only the top
+    k are selected (np.argpartition) instead of sorting every group.
+    """
+    codes, uniques = pd.factorize(keys)
+    weights = np.nan_to_num(values.to_numpy(dtype=np.float64))
+    valid = codes >= 0
+    sums = np.bincount(codes[valid], weights=weights[valid], minlength=len(uniques))
+    k = min(k, len(sums))
+    if k == 0:
+        return pd.Series(dtype=np.float64)
+    top = np.argpartition(-sums, k - 1)[:k]
+    top = top[np.argsort(-sums[top], kind='stable')]
+    return pd.Series(sums[top], index=uniques[top])
+
+
+def count_duplicate_rows(df, lf=None):
+    """Count rows of df that repeat an earlier row, like df.duplicated().sum().
+
+    The rows are hashed by Polars' multi-threaded unique() instead of pandas'
+    single-threaded row hashing; lf, when given, is an existing LazyFrame
+    over the same data so no conversion is needed. Frames Polars cannot
+    convert fall back to pandas.
+    """
+    if lf is None:
+        try:
+            lf = pl.from_pandas(df, rechunk=False).lazy()
+        except Exception:
+            return int(df.duplicated().sum())
+    return len(df) - lf.unique().select(pl.len()).collect().item()
+
+
+def fast_hist(ax, values, bins=50, **kwargs):
+    """Draw a histogram of values on ax from counts binned by np.histogram.
+
+    NaNs are dropped once up front and the bins are computed in one numpy
+    pass; ax.bar then only draws the precomputed bars.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **kwargs)
+
+
+def numeric_summary(lf, columns):
+    """Describe the numeric columns of a LazyFrame in one multi-threaded Polars pass.
+
+    Returns a float DataFrame indexed by column with count, mean, std, min,
+    q25, median, q75, max, skew, kurt, unique and mode. Every statistic
+    ignores nulls and follows pandas' conventions (linear quantiles, ddof=1,
+    bias-corrected skew and excess kurtosis, smallest mode).
+
+    The quartiles are taken in numpy from one partition per column. std,
+    skew and kurt all come from the second, third and fourth central
+    moments, aggregated together over one shared deviation expression; the
+    bias corrections are then applied to all columns at once in numpy.
+    """
+    cols = pl.col(columns).cast(pl.Float64)
+    deviation = cols - cols.mean()
+    stats = {
+        'count': cols.count(),
+        'mean': cols.mean(),
+        'min': cols.min(),
+        'max': cols.max(),
+        'm2': deviation.pow(2).mean(),
+        'm3': deviation.pow(3).mean(),
+        'm4': deviation.pow(4).mean(),
+        'unique': cols.drop_nulls().n_unique(),
+        'mode': cols.drop_nulls().mode().min(),
+    }
+    # The aggregates and the float matrix for the quartiles are collected
+    # together, so Polars scans the source once and runs both in parallel
+    aggregated, values = pl.collect_all([
+        lf.select([expr.cast(pl.Float64).name.suffix(f'__{name}') for name, expr in stats.items()]),
+        lf.select(cols),
+    ])
+    row = aggregated.row(0, named=True)
+    summary = pd.DataFrame({name: [row[f'{col}__{name}'] for col in columns] for name in stats},
+                           index=columns, dtype=float)
+
+    # All three quartiles from one selection per column (np.nanquantile
+    # partitions once for the whole list) instead of one sort per quantile.
+    # The matrix is column-major so each axis=0 reduction walks one
+    # contiguous column (a no-op for Polars' usual Fortran-ordered export)
+    matrix = np.asfortranarray(values.to_numpy())
+    quartiles = np.nanquantile(matrix, [0.25, 0.5, 0.75], axis=0)
+    max_loc = summary.columns.get_loc('max')
+    for offset, name in enumerate(['q25', 'median', 'q75']):
+        summary.insert(max_loc + offset, name, quartiles[offset])
+
+    n = summary['count'].to_numpy()
+    m2, m3, m4 = (summary.pop(name).to_numpy() for name in ('m2', 'm3', 'm4'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt(m2 * n / (n - 1))
+        # Adjusted Fisher-Pearson skewness and unbiased excess kurtosis (pandas'
+        # skew()/kurt()); constant columns get 0, too-short ones NaN
+        skew = m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+        kurt = ((n + 1) * (m4 / m2 ** 2 - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
+    skew = np.where(m2 == 0, 0.0, skew)
+    kurt = np.where(m2 == 0, 0.0, kurt)
+    summary.insert(summary.columns.get_loc('min'), 'std', np.where(n > 1, std, np.nan))
+    summary['skew'] = np.where(n > 2, skew, np.nan)
+    summary['kurt'] = np.where(n > 3, kurt, np.nan)
+    return summary
+
+
+def bucket_counts(values, edges):
+    """Count values falling in each right-closed interval (edges[i], edges[i + 1]].
+
+    Matches pd.cut(values, edges).value_counts() (values outside the edges and
+    NaN are not counted) with a single np.searchsorted pass and no Categorical.
+    """
+    positions = np.searchsorted(edges, values.to_numpy(dtype=np.float64), side='left')
+    return np.bincount(positions, minlength=len(edges) + 1)[1:len(edges)]
+
+
+# Columns of statistical_summary.csv and the dtype each is stored with
+STATISTICS_DTYPES = {
+    'table': 'object',
+    'layer': 'object',
+    'column': 'object',
+    'data_type': 'object',
+    'count': 'int64',
+    'nulls': 'int64',
+    'null_pct': 'float64',
+    'mean': 'float64',
+    'median': 'float64',
+    'mode': 'object',
+    'std': 'float64',
+    'min': 'float64',
+    'max': 'float64',
+    'q25': 'float64',
+    'q75': 'float64',
+    'iqr': 'float64',
+    'skewness': 'float64',
+    'kurtosis': 'float64',
+    'unique_values': 'int64',
+    'unique_pct': 'float64'
+}
+
+# Decimal places statistical_summary.csv shows for its rounded statistics;
+# the values themselves are kept unrounded
+STATISTICS_DECIMALS = {
+    'null_pct': 2,
+    'mean': 3,
+    'median': 3,
+    'std': 3,
+    'q25': 3,
+    'q75': 3,
+    'iqr': 3,
+    'skewness': 3,
+    'kurtosis': 3,
+    'unique_pct': 2
+}
+
+
+def csv_cells(name, values):
+    """Render one statistics column for statistical_summary.csv.
+
+    Missing values become empty cells, the STATISTICS_DECIMALS columns are
+    formatted to their decimal places and the int64 columns as integers
+    (numeric_summary hands count/unique_values over as floats).
+    """
+    if STATISTICS_DTYPES[name] == 'int64':
+        return ['' if pd.isna(value) else int(value) for value in values]
+    decimals = STATISTICS_DECIMALS.get(name)
+    if decimals is None:
+        return ['' if pd.isna(value) else value for value in values]
+    return ['' if pd.isna(value) else f'{value:.{decimals}f}' for value in values]
+
+
+def analyze_table(table_key, df, lf=None, numerical_cols=None, categorical_cols=None):
+    """Compute the statistical summary rows of one loaded table.
+
+    Returns (stats, report): a dict of column name -> list of values with
+    one entry per summarised column (the STATISTICS_DTYPES layout) and the
+    lines to print for the table. lf is an optional LazyFrame over the same data;
+    numerical_cols/categorical_cols are the column lists kept at load time
+    (derived from the dtypes when not given).
+    Tables are independent, so statistical_summary_analysis runs this for
+    several of them at once.
+    """
+    table_name = table_key.replace('bronze_', '').replace('silver_', '').replace('gold_', '')
+    layer = 'bronze' if 'bronze_' in table_key else 'silver' if 'silver_' in table_key else 'gold'
+
+    report = [f"\n📋 Analyzing {table_name} ({layer} layer)"]
+
+    # Rows are collected column-wise; statistics a column type does not have stay None
+    stats = {name: [] for name in STATISTICS_DTYPES}
+
+    def add_rows(n, **values):
+        values.update(table=[table_name] * n, layer=[layer] * n)
+        for name, column_values in stats.items():
+            column_values.extend(values.get(name, [None] * n))
+
+    # Basic statistics
+    total_records = len(df)
+    total_columns = len(df.columns)
+
+    # Numerical columns analysis
+    if numerical_cols is None:
+        numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    if categorical_cols is None:
+        categorical_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+
+    # Memory usage (text columns estimated from a sample)
+    memory_usage = memory_usage_mb(df)
+
+    # Missing values: one isna() pass gives both the per-column and table totals
+    null_counts = df.isna().sum()
+    null_pcts = null_counts / max(total_records, 1) * 100
+    total_nulls = int(null_counts.sum())
+    total_cells = total_records * total_columns
+    null_percentage = (total_nulls / total_cells * 100) if total_cells > 0 else 0
+
+    # Duplicates
+    duplicate_count = count_duplicate_rows(df, lf)
+    duplicate_percentage = (duplicate_count / total_records * 100) if total_records > 0 else 0
+
+    # Statistical summary for numerical columns: every statistic of every
+    # numeric column comes out of one fused Polars aggregation
+    if len(numerical_cols) > 0:
+        numerical_lf = lf
+        if numerical_lf is None:
+            numerical_lf = pl.from_pandas(df[numerical_cols]).lazy()
+        described = numeric_summary(numerical_lf, numerical_cols)
+        described = described[described['count'] > 0]
+        cols = described.index
+        add_rows(len(cols),
+                 column=cols.tolist(),
+                 data_type=df.dtypes[cols].astype(str).tolist(),
+                 count=described['count'].tolist(),
+                 nulls=null_counts[cols].tolist(),
+                 null_pct=null_pcts[cols].tolist(),
+                 mean=described['mean'].tolist(),
+                 median=described['median'].tolist(),
+                 mode=described['mode'].tolist(),
+                 std=described['std'].tolist(),
+                 min=described['min'].tolist(),
+                 max=described['max'].tolist(),
+                 q25=described['q25'].tolist(),
+                 q75=described['q75'].tolist(),
+                 iqr=(described['q75'] - described['q25']).tolist(),
+                 skewness=described['skew'].tolist(),
+                 kurtosis=described['kurt'].tolist(),
+                 unique_values=described['unique'].tolist(),
+                 unique_pct=(described['unique'] / described['count'] * 100).tolist())
+
+    # Summary for categorical columns: non-null counts, distinct counts
+    # and modes come from one frame-wide call each
+    if len(categorical_cols) > 0:
+        categorical = df[categorical_cols]
+        cat_counts = categorical.count()
+        cat_unique = categorical.nunique()
+        cat_modes = categorical.mode()
+        # mode() has no rows when every categorical column is all null
+        cat_modes = cat_modes.iloc[0] if len(cat_modes) else pd.Series(index=categorical_cols, dtype=object)
+        cols = cat_counts.index[cat_counts > 0]
+        add_rows(len(cols),
+                 column=cols.tolist(),
+                 data_type=df.dtypes[cols].astype(str).tolist(),
+                 count=cat_counts[cols].tolist(),
+                 nulls=null_counts[cols].tolist(),
+                 null_pct=null_pcts[cols].tolist(),
+                 mode=cat_modes[cols].tolist(),
+                 unique_values=cat_unique[cols].tolist(),
+                 unique_pct=(cat_unique[cols] / cat_counts[cols] * 100).tolist())
+
+    report += [
+        f"  📊 Records: {total_records:,}",
+        f"  📈 Columns: {total_columns} ({len(numerical_cols)} numerical, {len(categorical_cols)} categorical)",
+        f"  💾 Memory: {memory_usage:.2f} MB",
+        f"  ❌ Nulls: {total_nulls:,} ({null_percentage:.2f}%)",
+        f"  🔄 Duplicates: {duplicate_count:,} ({duplicate_percentage:.2f}%)"
+    ]
+    return stats, report
+
+
+def profile_statistics(table_key, profile):
+    """Statistical summary rows of a table profiled in SQL (see profile_tables).
+
+    Same (stats, report) layout as analyze_table; every column is summarised
+    like a categorical one (count, nulls, mode, distinct values), which is
+    what analyze_table reports for the all-text Bronze tables.
+    """
+    schema, table_name = table_key.split('_', 1)
+    columns = profile['columns']
+    total_records = profile['rows']
+    counts = total_records - columns['nulls']
+    summarised = columns[counts > 0]
+    counts = counts[counts > 0]
+    n = len(summarised)
+
+    stats = {name: [None] * n for name in STATISTICS_DTYPES}
+    stats.update(
+        table=[table_name] * n,
+        layer=[schema] * n,
+        column=summarised['column'].tolist(),
+        # Text columns come out of pandas as 'object'; keep the summary's labels
+        data_type=['object' if dtype in ('text', 'character varying', 'character') else dtype
+                   for dtype in summarised['dtype']],
+        count=counts.tolist(),
+        nulls=summarised['nulls'].tolist(),
+        null_pct=(summarised['nulls'] / max(total_records, 1) * 100).tolist(),
+        mode=summarised['mode'].tolist() if 'mode' in summarised else [None] * n,
+        unique_values=summarised['unique'].tolist(),
+        unique_pct=(summarised['unique'] / counts * 100).tolist()
+    )
+
+    total_nulls = int(columns['nulls'].sum())
+    total_cells = total_records * len(columns)
+    null_percentage = (total_nulls / total_cells * 100) if total_cells > 0 else 0
+    duplicate_percentage = (profile['duplicates'] / total_records * 100) if total_records > 0 else 0
+    report = [
+        f"\n📋 Analyzing {table_name} ({schema} layer)",
+        f"  📊 Records: {total_records:,}",
+        f"  📈 Columns: {len(columns)} (profiled in the database)",
+        f"  ❌ Nulls: {total_nulls:,} ({null_percentage:.2f}%)",
+        f"  🔄 Duplicates: {profile['duplicates']:,} ({duplicate_percentage:.2f}%)"
+    ]
+    return stats, report
+
+
+class LazyDataDict(dict):
+    """dict of loaded frames whose registered tables are only read on first access.
+
+    load(key, schema, table) returns the frame for a registered key, or None
+    when the table is missing or empty (the key is then dropped). Looking up
+    a key reads just that table; iterating the dict (items(), values(), iter)
+    first reads every table still pending, concurrently, and stores them in
+    registration order. Lookups are meant to come from one thread.
+    """
+
+    def __init__(self, load, max_workers=LOAD_WORKERS):
+        super().__init__()
+        self.load = load
+        self.max_workers = max_workers
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def register(self, key, schema, table):
+        """Record schema.table as the source of key without reading it."""
+        self.pending[key] = (schema, table)
+
+    def _claim(self, keys):
+        with self.lock:
+            return [(key, self.pending.pop(key)) for key in keys if key in self.pending]
+
+    def _store(self, key, df):
+        if df is not None:
+            super().__setitem__(key, df)
+
+    def materialize(self, key):
+        """Read key now if it is still pending."""
+        for key, (schema, table) in self._claim([key]):
+            self._store(key, self.load(key, schema, table))
+
+    def prefetch(self):
+        """Read every pending table, LOAD_WORKERS at a time."""
+        claimed = self._claim(list(self.pending))
+        if not claimed:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(claimed))) as executor:
+            futures = [(key, executor.submit(self.load, key, schema, table))
+                       for key, (schema, table) in claimed]
+            for key, future in futures:
+                self._store(key, future.result())
+
+    def __getitem__(self, key):
+        self.materialize(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.materialize(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.materialize(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.prefetch()
+        return super().__iter__()
+
+    def items(self):
+        self.prefetch()
+        return super().items()
+
+    def values(self):
+        self.prefetch()
+        return super().values()
+
+
 class SupplyChainEDA:
     """Comprehensive EDA for Supply Chain Data Pipeline"""
 
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.output_dir = Path(__file__).parent / 'outputs'
         self.output_dir.mkdir(exist_ok=True)
 
@@ -40,23 +546,317 @@ class SupplyChainEDA:
         (self.output_dir / 'csv').mkdir(exist_ok=True)
         (self.output_dir / 'reports').mkdir(exist_ok=True)
 
+        # Tables read from the database are kept as Parquet between runs
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / '_cache'
+        self.cache_dir.mkdir(exist_ok=True)
+
+        # PNG encoding runs in the background while the next analysis computes
+        self.chart_pool = ThreadPoolExecutor(max_workers=2)
+        self.chart_futures = []
+
         self.connection = None
-        self.data = {}
+        self.data = LazyDataDict(self.load_table)
+        self.fingerprints = {}
+        self.ldata = {}
+        # Column lists by kind, per self.data key, taken once at load time
+        self.numeric_cols = {}
+        self.categorical_cols = {}
+        self.datetime_cols = {}
+        self.profiles = {}
         self.insights = []
 
         print(f"📊 Supply Chain EDA initialized")
         print(f"📁 Output directory: {self.output_dir}")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Finish pending chart writes and close the database connection"""
+        self.chart_pool.shutdown(wait=True)
+        if self.connection is not None and not self.connection.closed:
+            self.connection.close()
+
     def get_connection(self):
-        """Get database connection"""
+        """Get database connection (kept open until close() for follow-up queries)"""
+        if self.connection is not None and not self.connection.closed:
+            return True
         try:
-            self.connection = psycopg2.connect(**DB_CONFIG)
+            self.connection = psycopg2.connect(DB_DSN)
+            # Read-only queries; autocommit keeps the long-lived connection
+            # from sitting idle in a transaction holding table locks
+            self.connection.autocommit = True
             print("✅ Database connection established")
             return True
         except psycopg2.Error as e:
             print(f"❌ Database connection error: {e}")
             return False
 
+    def _profile_table_sql(self, schema, table, columns, modes=False):
+        """Build one aggregate query profiling every column of schema.table.
+
+        The row is: row count, null count per column, distinct count per column,
+        with modes=True the most frequent value per column (the smallest on ties,
+        like DataFrame.mode()), and the number of fully duplicated rows (as
+        DataFrame.duplicated() counts them).
+        """
+        table_ref = sql.Identifier(schema, table)
+        column_refs = [sql.Identifier(col) for col in columns]
+        null_counts = sql.SQL(", ").join(sql.SQL("COUNT(*) - COUNT({})").format(col) for col in column_refs)
+        unique_counts = sql.SQL(", ").join(sql.SQL("COUNT(DISTINCT {})").format(col) for col in column_refs)
+        if modes:
+            unique_counts = sql.SQL(", ").join([unique_counts] + [
+                sql.SQL("MODE() WITHIN GROUP (ORDER BY {})").format(col) for col in column_refs
+            ])
+        return sql.SQL("""
+            SELECT COUNT(*), {null_counts}, {unique_counts},
+                   (SELECT COALESCE(SUM(n - 1), 0)
+                    FROM (SELECT COUNT(*) AS n FROM {table} GROUP BY {all_columns} HAVING COUNT(*) > 1) dup)
+            FROM {table}
+        """).format(
+            null_counts=null_counts,
+            unique_counts=unique_counts,
+            table=table_ref,
+            all_columns=sql.SQL(", ").join(column_refs)
+        )
+
+    def profile_tables(self, schemas, tables, mode_schemas=()):
+        """Profile tables in the database instead of pulling their rows.
+
+        Results go to self.profiles['<schema>_<table>'] as a dict with 'rows',
+        'duplicates' and a per-column 'columns' DataFrame (column, dtype, nulls,
+        unique, plus mode for tables in mode_schemas).
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT table_schema, table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = ANY(%s) AND table_name = ANY(%s)
+            ORDER BY table_schema, table_name, ordinal_position
+        """, (schemas, tables))
+        columns_info = pd.DataFrame(cursor.fetchall(), columns=['schema', 'table', 'column', 'dtype'])
+        cursor.close()
+
+        # Each profile is a full scan on the server, so they run side by side,
+        # one pooled connection per worker
+        pool = ThreadedConnectionPool(1, LOAD_WORKERS, DB_DSN)
+
+        def profile(schema, table, table_columns):
+            conn = pool.getconn()
+            try:
+                columns = table_columns['column'].tolist()
+                modes = schema in mode_schemas
+                with conn.cursor() as cursor:
+                    cursor.execute(self._profile_table_sql(schema, table, columns, modes=modes))
+                    row = cursor.fetchone()
+                conn.rollback()
+                n = len(columns)
+                profile_columns = pd.DataFrame({
+                    'column': columns,
+                    'dtype': table_columns['dtype'].tolist(),
+                    'nulls': row[1:1 + n],
+                    'unique': row[1 + n:1 + 2 * n]
+                })
+                if modes:
+                    profile_columns['mode'] = row[1 + 2 * n:1 + 3 * n]
+                return {
+                    'rows': row[0],
+                    'duplicates': row[-1],
+                    'columns': profile_columns
+                }
+            finally:
+                pool.putconn(conn)
+
+        try:
+            with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                futures = {
+                    f'{schema}_{table}': executor.submit(profile, schema, table, table_columns)
+                    for (schema, table), table_columns in columns_info.groupby(['schema', 'table'], sort=False)
+                }
+                for key, future in futures.items():
+                    self.profiles[key] = future.result()
+                    print(f"  ✅ {key.replace('_', '.', 1)}: {self.profiles[key]['rows']} rows profiled")
+        finally:
+            pool.closeall()
+
+    def read_table(self, schema, table):
+        """Read schema.table into an Arrow table with connectorx.
+
+        connectorx fetches columns natively instead of building a Python tuple
+        per row like pd.read_sql; the large tables are additionally split into
+        READ_PARTITIONS ranges that are fetched in parallel, each streamed with
+        COPY (...) TO STDOUT in binary format, so no value goes through text
+        parsing or per-row DB-API marshaling.
+        """
+        if schema == 'audit':
+            return self.stream_table(schema, table)
+        query = f"SELECT * FROM {schema}.{table}"
+        if table in PARTITIONED_TABLES:
+            return cx.read_sql(DB_URL, query, return_type="arrow",
+                               protocol="binary",
+                               partition_on=PARTITIONED_TABLES[table],
+                               partition_num=READ_PARTITIONS)
+        return cx.read_sql(DB_URL, query, return_type="arrow")
+
+    def table_fingerprints(self, schemas):
+        """Return {'schema.table': fingerprint} for every table and view in schemas.
+
+        The tables carry no updated_at column, so a table counts as unchanged
+        while its file node (replaced by TRUNCATE and a plain REFRESH
+        MATERIALIZED VIEW) and its cumulative insert/update/delete counters
+        are the same. Statistics are flushed asynchronously, so a write from
+        the last second or so may not be visible yet.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT s.schemaname || '.' || s.relname,
+                   concat_ws(':', c.relfilenode, s.n_tup_ins, s.n_tup_upd, s.n_tup_del)
+            FROM pg_stat_user_tables s
+            JOIN pg_class c ON c.oid = s.relid
+            WHERE s.schemaname = ANY(%s)
+        """, (list(schemas),))
+        fingerprints = dict(cursor.fetchall())
+        cursor.close()
+        return fingerprints
+
+    def stream_table(self, schema, table, batch_size=AUDIT_BATCH_ROWS):
+        """Read schema.table through a server-side cursor into an Arrow table.
+
+        The audit tables have no upper bound on size, so rows are pulled in
+        fixed batches of batch_size from a named cursor and each batch is
+        turned into Arrow columns straight away; at most one batch of Python
+        tuples is alive at a time. JSON columns are kept as text. Each call
+        uses its own connection, since a named cursor lives inside a
+        transaction and the audit tables are read concurrently.
+        """
+        conn = psycopg2.connect(DB_DSN)
+        cursor = conn.cursor(name=f'eda_{schema}_{table}')
+        cursor.itersize = batch_size
+        register_default_json(cursor, loads=lambda value: value)
+        register_default_jsonb(cursor, loads=lambda value: value)
+        try:
+            cursor.execute(sql.SQL("SELECT * FROM {}").format(sql.Identifier(schema, table)))
+            batches = []
+            columns = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if columns is None:
+                    columns = [desc[0] for desc in cursor.description]
+                if not rows:
+                    break
+                batches.append(pa.Table.from_arrays(
+                    [pa.array(values) for values in zip(*rows)], names=columns))
+        finally:
+            conn.close()
+
+        if not batches:
+            return pa.table({column: pa.array([], pa.null()) for column in columns})
+        # A column that is all NULL in one batch is typed null there; promote it
+        return pa.concat_tables(batches, promote_options='permissive')
+
+    def read_table_cached(self, schema, table, fingerprint):
+        """Read schema.table from the Parquet cache, or from the database on a miss.
+
+        A cached file is used only if the fingerprint stored in its footer
+        matches the current one; otherwise the table is read with read_table
+        and the cache file is rewritten.
+        """
+        if not (self.use_cache and fingerprint):
+            return self.read_table(schema, table)
+
+        path = self.cache_dir / f'{schema}_{table}.parquet'
+        if path.exists():
+            try:
+                metadata = pq.read_schema(path).metadata or {}
+                if metadata.get(CACHE_FINGERPRINT_KEY) == fingerprint.encode():
+                    return pq.read_table(path)
+            except Exception as e:
+                print(f"  ⚠️  Ignoring unreadable cache file {path.name}: {e}")
+
+        arrow_table = self.read_table(schema, table)
+        metadata = dict(arrow_table.schema.metadata or {})
+        metadata[CACHE_FINGERPRINT_KEY] = fingerprint.encode()
+        pq.write_table(arrow_table.replace_schema_metadata(metadata), path, compression='snappy')
+        return arrow_table
+
+    def save(self, df, stem, write_csv=True):
+        """Write df to csv/<stem>.csv plus a zstd-compressed csv/<stem>.parquet.
+
+        Both files are written from one Arrow table by Arrow's C++ writers
+        rather than DataFrame.to_csv's Python-level row formatter. Frames
+        Arrow cannot type (e.g. object columns mixing numbers and strings)
+        fall back to to_csv, without a Parquet copy. Either way the CSV goes
+        through a CSV_BUFFER_BYTES buffer, so it is flushed in a few large
+        writes instead of one per batch of rows. write_csv=False only writes
+        the Parquet file, for callers that stream the CSV themselves.
+        """
+        path = self.output_dir / 'csv' / stem
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except pa.ArrowException:
+            if not write_csv:
+                return
+            with open(path.with_suffix('.csv'), 'w', buffering=CSV_BUFFER_BYTES, newline='') as f:
+                df.to_csv(f, index=False, float_format='%.6g', quoting=csv.QUOTE_MINIMAL)
+            return
+        if write_csv:
+            with pa.output_stream(path.with_suffix('.csv'), buffer_size=CSV_BUFFER_BYTES) as sink:
+                pa_csv.write_csv(table, sink)
+        pq.write_table(table, path.with_suffix('.parquet'), compression='zstd')
+
+    def save_chart(self, filename, dpi=CHART_DPI):
+        """Detach the current pyplot figure and write it to charts/filename in the background."""
+        fig = plt.gcf()
+        plt.close(fig)
+        self.chart_futures.append(self.chart_pool.submit(
+            fig.savefig, self.output_dir / 'charts' / filename, dpi=dpi, bbox_inches='tight'))
+
+    def wait_for_charts(self):
+        """Block until every chart queued by save_chart has been written."""
+        for future in self.chart_futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠️  Failed to write chart: {e}")
+        self.chart_futures.clear()
+
+    def load_table(self, key, schema, table):
+        """Read schema.table into the frame stored as self.data[key].
+
+        Returns None for a missing or empty Gold/audit table; a Silver table
+        that cannot be read raises.
+        """
+        try:
+            arrow_table = self.read_table_cached(schema, table, self.fingerprints.get(f'{schema}.{table}'))
+        except Exception:
+            # Gold and audit tables are optional; a missing Silver table is an error
+            if schema == 'silver':
+                raise
+            print(f"  ⚠️  {schema}.{table}: Table not found or empty")
+            return None
+        if arrow_table.num_rows == 0 and schema != 'silver':
+            print(f"  ⚠️  {schema}.{table}: Table not found or empty")
+            return None
+
+        df = arrow_table.to_pandas(types_mapper=arrow_string_dtype)
+        mem_before = memory_usage_mb(df)
+        df = shrink_numeric(to_categories(df))
+        mem_after = memory_usage_mb(df)
+        # Silver tables also get a zero-copy Polars view for the
+        # heavy aggregations; pandas stays for plotting
+        if schema == 'silver':
+            self.ldata[key] = pl.from_arrow(arrow_table).lazy()
+        self.numeric_cols[key] = df.select_dtypes(include=[np.number]).columns.tolist()
+        self.categorical_cols[key] = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+        self.datetime_cols[key] = df.select_dtypes(include=['datetime', 'datetimetz']).columns.tolist()
+        print(f"  ✅ {schema}.{table}: {len(df)} rows "
+              f"({mem_before:.1f} MB -> {mem_after:.1f} MB)")
+        return df
+
     def load_data(self):
         """Load data from all layers (Bronze, Silver, Gold)"""
         if not self.get_connection():
@@ -70,48 +870,39 @@ class SupplyChainEDA:
         gold_tables = ['monthly_sales_performance', 'product_performance_metrics', 'supply_chain_kpis']
 
         try:
-            # Load Bronze layer data
-            print("📥 Loading Bronze layer data...")
-            for table in bronze_tables:
-                query = f"SELECT * FROM bronze.{table}"  # Load all data for complete analysis
-                self.data[f'bronze_{table}'] = pd.read_sql(query, self.connection)
-                print(f"  ✅ bronze.{table}: {len(self.data[f'bronze_{table}'])} rows")
-
-            # Load Silver layer data
+            # Data quality only needs counts, so Bronze (and the Silver side of the
+            # comparison) is profiled in SQL; Bronze rows are never pulled
+            print("📥 Profiling Bronze and Silver layer data...")
+            # Bronze modes are profiled too: the statistical summary reports bronze
+            # from these profiles
+            self.profile_tables(['bronze', 'silver'], sorted(set(bronze_tables) | set(silver_tables)),
+                                mode_schemas=['bronze'])
+
+            # Silver is used row by row by the business analyses and is read
+            # right away (all tables at once); Gold and audit tables are only
+            # registered and read when an analysis first touches them
+            reads = [(f'silver_{table}', 'silver', table) for table in silver_tables]
+            lazy_reads = [(f'gold_{table}', 'gold', table) for table in gold_tables]
+            lazy_reads += [
+                ('audit_rejected', 'audit', 'rejected_rows'),
+                ('audit_dq', 'audit', 'dq_results'),
+                ('audit_log', 'audit', 'etl_log')
+            ]
+            if self.use_cache:
+                self.fingerprints = self.table_fingerprints({schema for _, schema, _ in reads + lazy_reads})
+
             print("📥 Loading Silver layer data...")
-            for table in silver_tables:
-                query = f"SELECT * FROM silver.{table}"  # Load all data for complete analysis
-                self.data[f'silver_{table}'] = pd.read_sql(query, self.connection)
-                print(f"  ✅ silver.{table}: {len(self.data[f'silver_{table}'])} rows")
-
-            # Load Gold layer data (if available)
-            print("📥 Loading Gold layer data...")
-            for table in gold_tables:
-                try:
-                    query = f"SELECT * FROM gold.{table}"
-                    self.data[f'gold_{table}'] = pd.read_sql(query, self.connection)
-                    print(f"  ✅ gold.{table}: {len(self.data[f'gold_{table}'])} rows")
-                except:
-                    print(f"  ⚠️  gold.{table}: Table not found or empty")
-
-            # Load audit data
-            print("📥 Loading Audit data...")
-            try:
-                self.data['audit_rejected'] = pd.read_sql("SELECT * FROM audit.rejected_rows", self.connection)
-                self.data['audit_dq'] = pd.read_sql("SELECT * FROM audit.dq_results", self.connection)
-                self.data['audit_log'] = pd.read_sql("SELECT * FROM audit.etl_log", self.connection)
-                print(f"  ✅ Audit data loaded successfully")
-            except:
-                print(f"  ⚠️  Audit data: Not available")
+            for key, schema, table in reads:
+                self.data.register(key, schema, table)
+            self.data.prefetch()
+            for key, schema, table in lazy_reads:
+                self.data.register(key, schema, table)
 
             return True
 
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
-        finally:
-            if self.connection:
-                self.connection.close()
 
     def data_quality_analysis(self):
         """Comprehensive data quality analysis across Bronze and Silver layers"""
@@ -128,26 +919,28 @@ class SupplyChainEDA:
             bronze_key = f'bronze_{table}'
             silver_key = f'silver_{table}'
 
-            if bronze_key in self.data and silver_key in self.data:
-                bronze_df = self.data[bronze_key]
-                silver_df = self.data[silver_key]
+            if bronze_key in self.profiles and silver_key in self.profiles:
+                bronze_profile = self.profiles[bronze_key]
+                silver_profile = self.profiles[silver_key]
+                bronze_columns = bronze_profile['columns']
+                silver_columns = silver_profile['columns'].set_index('column')
 
-                bronze_count = len(bronze_df)
-                silver_count = len(silver_df)
+                bronze_count = bronze_profile['rows']
+                silver_count = silver_profile['rows']
                 rejected_count = bronze_count - silver_count
                 quality_rate = (silver_count / bronze_count * 100) if bronze_count > 0 else 0
 
                 # Null/Missing Values Analysis
-                bronze_nulls = bronze_df.isnull().sum().sum()
-                silver_nulls = silver_df.isnull().sum().sum()
-                total_bronze_cells = bronze_df.size
-                total_silver_cells = silver_df.size
+                bronze_nulls = bronze_columns['nulls'].sum()
+                silver_nulls = silver_columns['nulls'].sum()
+                total_bronze_cells = bronze_count * len(bronze_columns)
+                total_silver_cells = silver_count * len(silver_columns)
                 bronze_null_pct = (bronze_nulls / total_bronze_cells * 100) if total_bronze_cells > 0 else 0
                 silver_null_pct = (silver_nulls / total_silver_cells * 100) if total_silver_cells > 0 else 0
 
                 # Duplicate Analysis
-                bronze_duplicates = bronze_df.duplicated().sum()
-                silver_duplicates = silver_df.duplicated().sum()
+                bronze_duplicates = bronze_profile['duplicates']
+                silver_duplicates = silver_profile['duplicates']
                 bronze_dup_pct = (bronze_duplicates / bronze_count * 100) if bronze_count > 0 else 0
                 silver_dup_pct = (silver_duplicates / silver_count * 100) if silver_count > 0 else 0
 
@@ -163,41 +956,31 @@ class SupplyChainEDA:
                     'silver_duplicates': silver_duplicates
                 })
 
+                # Per-column figures as whole Series, aligned on the bronze columns
+                columns = bronze_columns['column']
+                b_nulls = bronze_columns['nulls'].to_numpy()
+                s_nulls = silver_columns['nulls'].reindex(columns, fill_value=0).to_numpy()
+                b_uniq = bronze_columns['unique'].to_numpy()
+
                 # Detailed missing values by column
-                for col in bronze_df.columns:
-                    bronze_col_nulls = bronze_df[col].isnull().sum()
-                    bronze_col_null_pct = (bronze_col_nulls / bronze_count * 100) if bronze_count > 0 else 0
-
-                    silver_col_nulls = 0
-                    silver_col_null_pct = 0
-                    if col in silver_df.columns:
-                        silver_col_nulls = silver_df[col].isnull().sum()
-                        silver_col_null_pct = (silver_col_nulls / silver_count * 100) if silver_count > 0 else 0
-
-                    missing_values_analysis.append({
-                        'table': table,
-                        'column': col,
-                        'bronze_nulls': bronze_col_nulls,
-                        'bronze_null_pct': round(bronze_col_null_pct, 2),
-                        'silver_nulls': silver_col_nulls,
-                        'silver_null_pct': round(silver_col_null_pct, 2)
-                    })
-
-                # Data types information
-                for col in bronze_df.columns:
-                    bronze_dtype = str(bronze_df[col].dtype)
-                    silver_dtype = str(silver_df[col].dtype) if col in silver_df.columns else 'N/A'
-                    unique_values = bronze_df[col].nunique()
-                    unique_pct = (unique_values / bronze_count * 100) if bronze_count > 0 else 0
-
-                    data_types_info.append({
-                        'table': table,
-                        'column': col,
-                        'bronze_dtype': bronze_dtype,
-                        'silver_dtype': silver_dtype,
-                        'unique_values': unique_values,
-                        'uniqueness_pct': round(unique_pct, 2)
-                    })
+                missing_values_analysis.append(pd.DataFrame({
+                    'table': table,
+                    'column': columns.to_numpy(),
+                    'bronze_nulls': b_nulls,
+                    'bronze_null_pct': (b_nulls / bronze_count * 100).round(2) if bronze_count > 0 else 0.0,
+                    'silver_nulls': s_nulls,
+                    'silver_null_pct': (s_nulls / silver_count * 100).round(2) if silver_count > 0 else 0.0
+                }))
+
+                # Data types information (database column types)
+                data_types_info.append(pd.DataFrame({
+                    'table': table,
+                    'column': columns.to_numpy(),
+                    'bronze_dtype': bronze_columns['dtype'].to_numpy(),
+                    'silver_dtype': silver_columns['dtype'].reindex(columns, fill_value='N/A').to_numpy(),
+                    'unique_values': b_uniq,
+                    'uniqueness_pct': (b_uniq / bronze_count * 100).round(2) if bronze_count > 0 else 0.0
+                }))
 
                 # Duplicate details
                 duplicate_analysis.append({
@@ -213,17 +996,17 @@ class SupplyChainEDA:
 
         # Create DataFrames and save
         quality_df = pd.DataFrame(quality_summary)
-        missing_df = pd.DataFrame(missing_values_analysis)
+        missing_df = pd.concat(missing_values_analysis, ignore_index=True) if missing_values_analysis else pd.DataFrame()
         duplicate_df = pd.DataFrame(duplicate_analysis)
-        dtypes_df = pd.DataFrame(data_types_info)
+        dtypes_df = pd.concat(data_types_info, ignore_index=True) if data_types_info else pd.DataFrame()
 
         print(quality_df.to_string(index=False))
 
         # Save all analysis files
-        quality_df.to_csv(self.output_dir / 'csv' / 'data_quality_summary.csv', index=False)
-        missing_df.to_csv(self.output_dir / 'csv' / 'missing_values_analysis.csv', index=False)
-        duplicate_df.to_csv(self.output_dir / 'csv' / 'duplicate_analysis.csv', index=False)
-        dtypes_df.to_csv(self.output_dir / 'csv' / 'data_types_info.csv', index=False)
+        self.save(quality_df, 'data_quality_summary')
+        self.save(missing_df, 'missing_values_analysis')
+        self.save(duplicate_df, 'duplicate_analysis')
+        self.save(dtypes_df, 'data_types_info')
 
         # Create enhanced quality visualizations
         fig = plt.figure(figsize=(20, 12))
@@ -290,14 +1073,11 @@ class SupplyChainEDA:
 
         # Data completeness heatmap
         ax6 = plt.subplot(2, 3, 6)
-        completeness_data = []
-        table_names = []
-        for table in quality_df['table']:
-            table_missing = missing_df[missing_df['table'] == table]['bronze_null_pct'].mean()
-            completeness_data.append(100 - table_missing)
-            table_names.append(table)
-
-        bars = ax6.barh(table_names, completeness_data, color='lightblue', alpha=0.8)
+        # One groupby over missing_df instead of a boolean filter per table
+        completeness = 100 - (missing_df.groupby('table', sort=False)['bronze_null_pct'].mean()
+                              .reindex(quality_df['table']))
+
+        bars = ax6.barh(completeness.index, completeness.to_numpy(), color='lightblue', alpha=0.8)
         ax6.set_title('Data Completeness by Table (%)', fontsize=14, fontweight='bold')
         ax6.set_xlabel('Completeness (%)')
         ax6.grid(axis='x', alpha=0.3)
@@ -309,8 +1089,7 @@ class SupplyChainEDA:
                     ha='left', va='center', fontsize=10)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'charts' / 'comprehensive_data_quality.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        self.save_chart('comprehensive_data_quality.png')
 
         # Generate comprehensive insights
         overall_quality = quality_df['quality_rate_pct'].mean()
@@ -399,8 +1178,9 @@ class SupplyChainEDA:
             fig.add_trace(go.Pie(labels=status_counts.index, values=status_counts.values, name="Order Status"), row=2, col=3)
 
         fig.update_layout(height=800, showlegend=False, title_text="Supply Chain Overview Dashboard")
-        fig.write_html(self.output_dir / 'charts' / 'supply_chain_overview.html')
-        fig.show()
+        # plotly.js is loaded from the CDN instead of embedding ~3 MB in the file
+        fig.write_html(self.output_dir / 'charts' / 'supply_chain_overview.html',
+                       include_plotlyjs='cdn', full_html=True)
 
         # Generate insights
         self.insights.extend([
@@ -427,9 +1207,10 @@ class SupplyChainEDA:
             orders['month'] = orders['order_date'].dt.to_period('M')
 
         # Financial metrics
-        total_revenue = orders['total_invoice'].sum()
-        avg_order_value = orders['total_invoice'].mean()
-        median_order_value = orders['total_invoice'].median()
+        invoice_stats = orders['total_invoice'].agg(['sum', 'mean', 'median'])
+        total_revenue = invoice_stats['sum']
+        avg_order_value = invoice_stats['mean']
+        median_order_value = invoice_stats['median']
         total_orders = len(orders)
 
         print(f"💵 Total Revenue: ${total_revenue:,.2f}")
@@ -441,7 +1222,7 @@ class SupplyChainEDA:
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
 
         # Revenue distribution
-        axes[0,0].hist(orders['total_invoice'], bins=50, alpha=0.7, color='skyblue', edgecolor='black')
+        fast_hist(axes[0,0], orders['total_invoice'], bins=50, alpha=0.7, color='skyblue', edgecolor='black')
         axes[0,0].axvline(avg_order_value, color='red', linestyle='--', label=f'Mean: ${avg_order_value:.0f}')
         axes[0,0].axvline(median_order_value, color='green', linestyle='--', label=f'Median: ${median_order_value:.0f}')
         axes[0,0].set_title('Order Value Distribution', fontweight='bold')
@@ -452,7 +1233,7 @@ class SupplyChainEDA:
 
         # Monthly revenue trend (if date available)
         if 'month' in orders.columns:
-            monthly_revenue = orders.groupby('month')['total_invoice'].sum()
+            monthly_revenue = orders.groupby('month', observed=True)['total_invoice'].sum()
             axes[0,1].plot(monthly_revenue.index.astype(str), monthly_revenue.values, marker='o', linewidth=2)
             axes[0,1].set_title('Monthly Revenue Trend', fontweight='bold')
             axes[0,1].set_xlabel('Month')
@@ -462,7 +1243,8 @@ class SupplyChainEDA:
 
         # Top revenue generating stores (if available)
         if 'retail_store_id' in orders.columns:
-            store_revenue = orders.groupby('retail_store_id')['total_invoice'].sum().nlargest(10)
+            # sort=False: only the top 10 are needed, nlargest picks them without a full sort
+            store_revenue = orders.groupby('retail_store_id', sort=False, observed=True)['total_invoice'].sum().nlargest(10)
             axes[1,0].bar(range(len(store_revenue)), store_revenue.values, color='lightcoral')
             axes[1,0].set_title('Top 10 Revenue Generating Stores', fontweight='bold')
             axes[1,0].set_xlabel('Store Rank')
@@ -478,8 +1260,7 @@ class SupplyChainEDA:
             axes[1,1].grid(alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'charts' / 'financial_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        self.save_chart('financial_analysis.png')
 
         # Save financial summary
         financial_summary = pd.DataFrame({
@@ -487,7 +1268,7 @@ class SupplyChainEDA:
             'Value': [f'${total_revenue:,.2f}', f'${avg_order_value:,.2f}',
                      f'${median_order_value:,.2f}', f'{total_orders:,}']
         })
-        financial_summary.to_csv(self.output_dir / 'csv' / 'financial_summary.csv', index=False)
+        self.save(financial_summary, 'financial_summary')
 
         # Generate insights
         self.insights.extend([
@@ -510,18 +1291,32 @@ class SupplyChainEDA:
             print("⚠️  Inventory data not available for analysis")
             return
 
-        # Basic inventory metrics
-        total_inventory_value = 0
-        if 'quantity' in inventory.columns and 'product_id' in inventory.columns:
-            # Merge with products to get unit costs
-            if 'unit_cost' in products.columns and 'product_id' in products.columns:
-                inv_with_cost = inventory.merge(products[['product_id', 'unit_cost']], on='product_id', how='left')
-                inv_with_cost['total_value'] = inv_with_cost['quantity'] * inv_with_cost['unit_cost']
-                total_inventory_value = inv_with_cost['total_value'].sum()
-
-        total_quantity = inventory['quantity'].sum() if 'quantity' in inventory.columns else 0
-        avg_quantity_per_item = inventory['quantity'].mean() if 'quantity' in inventory.columns else 0
-        total_inventory_positions = len(inventory)
+        # Basic inventory metrics, computed by one fused Polars plan
+        inventory_lf = self.ldata['silver_inventory']
+        has_quantity = 'quantity' in inventory.columns
+        metrics = [pl.len().alias('positions')]
+        if has_quantity:
+            metrics += [pl.col('quantity').sum().alias('total_quantity'),
+                        pl.col('quantity').mean().alias('avg_quantity')]
+        if 'warehouse_id' in inventory.columns:
+            metrics.append(pl.col('warehouse_id').n_unique().alias('warehouses'))
+        plans = [inventory_lf.select(metrics)]
+
+        # Join with products to get unit costs
+        can_value = (has_quantity and 'product_id' in inventory.columns
+                     and 'unit_cost' in products.columns and 'product_id' in products.columns)
+        if can_value:
+            products_lf = self.ldata['silver_products'].select(['product_id', 'unit_cost'])
+            plans.append(inventory_lf.join(products_lf, on='product_id', how='left')
+                         .select((pl.col('quantity') * pl.col('unit_cost')).sum().alias('total_value')))
+
+        results = pl.collect_all(plans)
+        inventory_metrics = results[0].row(0, named=True)
+        # Polars returns null (not 0) for sums/means over all-null columns
+        total_inventory_value = (results[1].item() if can_value else None) or 0
+        total_quantity = inventory_metrics.get('total_quantity') or 0
+        avg_quantity_per_item = inventory_metrics.get('avg_quantity') or 0
+        total_inventory_positions = inventory_metrics['positions']
 
         print(f"📊 Total Inventory Positions: {total_inventory_positions:,}")
         print(f"📦 Total Quantity in Stock: {total_quantity:,}")
@@ -534,7 +1329,7 @@ class SupplyChainEDA:
 
         # Inventory quantity distribution
         if 'quantity' in inventory.columns:
-            axes[0,0].hist(inventory['quantity'], bins=50, alpha=0.7, color='lightgreen', edgecolor='black')
+            fast_hist(axes[0,0], inventory['quantity'], bins=50, alpha=0.7, color='lightgreen', edgecolor='black')
             axes[0,0].set_title('Inventory Quantity Distribution', fontweight='bold')
             axes[0,0].set_xlabel('Quantity')
             axes[0,0].set_ylabel('Frequency')
@@ -542,7 +1337,7 @@ class SupplyChainEDA:
 
         # Inventory by warehouse
         if 'warehouse_id' in inventory.columns:
-            warehouse_inventory = inventory.groupby('warehouse_id')['quantity'].sum().nlargest(15)
+            warehouse_inventory = top_k_sums(inventory['warehouse_id'], inventory['quantity'], 15)
             axes[0,1].bar(range(len(warehouse_inventory)), warehouse_inventory.values, color='lightblue')
             axes[0,1].set_title('Inventory by Warehouse (Top 15)', fontweight='bold')
             axes[0,1].set_xlabel('Warehouse Rank')
@@ -552,17 +1347,15 @@ class SupplyChainEDA:
         # Inventory levels (Low, Medium, High)
         if 'quantity' in inventory.columns:
             q25, q75 = inventory['quantity'].quantile([0.25, 0.75])
-            inventory_levels = pd.cut(inventory['quantity'],
-                                    bins=[0, q25, q75, inventory['quantity'].max()],
-                                    labels=['Low', 'Medium', 'High'])
-            level_counts = inventory_levels.value_counts()
-            axes[1,0].pie(level_counts.values, labels=level_counts.index, autopct='%1.1f%%',
+            level_counts = bucket_counts(inventory['quantity'],
+                                         [0, q25, q75, inventory['quantity'].max()])
+            axes[1,0].pie(level_counts, labels=['Low', 'Medium', 'High'], autopct='%1.1f%%',
                          colors=['red', 'orange', 'green'])
             axes[1,0].set_title('Inventory Level Distribution', fontweight='bold')
 
         # Top products by quantity
         if 'product_id' in inventory.columns:
-            top_products = inventory.groupby('product_id')['quantity'].sum().nlargest(10)
+            top_products = top_k_sums(inventory['product_id'], inventory['quantity'], 10)
             axes[1,1].barh(range(len(top_products)), top_products.values, color='coral')
             axes[1,1].set_title('Top 10 Products by Inventory Quantity', fontweight='bold')
             axes[1,1].set_xlabel('Total Quantity')
@@ -570,8 +1363,7 @@ class SupplyChainEDA:
             axes[1,1].grid(axis='x', alpha=0.3)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'charts' / 'inventory_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        self.save_chart('inventory_analysis.png')
 
         # Save inventory summary
         inventory_summary = pd.DataFrame({
@@ -579,14 +1371,14 @@ class SupplyChainEDA:
             'Value': [f'{total_inventory_positions:,}', f'{total_quantity:,}',
                      f'{avg_quantity_per_item:,.0f}', f'${total_inventory_value:,.2f}']
         })
-        inventory_summary.to_csv(self.output_dir / 'csv' / 'inventory_summary.csv', index=False)
+        self.save(inventory_summary, 'inventory_summary')
 
         # Generate insights
         self.insights.extend([
             f"📦 Managing {total_inventory_positions:,} inventory positions",
             f"📊 Total stock quantity: {total_quantity:,} units",
             f"💰 Total inventory value: ${total_inventory_value:,.2f}" if total_inventory_value > 0 else "💰 Inventory valuation requires product cost data",
-            f"🏭 Inventory distributed across {len(inventory['warehouse_id'].unique()) if 'warehouse_id' in inventory.columns else 'N/A'} warehouses"
+            f"🏭 Inventory distributed across {inventory_metrics.get('warehouses', 'N/A')} warehouses"
         ])
 
     def correlation_analysis(self):
@@ -601,14 +1393,22 @@ class SupplyChainEDA:
             return
 
         # Select numerical columns for correlation
-        numerical_cols = orders.select_dtypes(include=[np.number]).columns.tolist()
+        numerical_cols = self.numeric_cols['silver_supply_orders']
 
         if len(numerical_cols) < 2:
             print("⚠️  Insufficient numerical columns for correlation analysis")
             return
 
-        # Calculate correlations
-        correlation_matrix = orders[numerical_cols].corr()
+        # Calculate correlations on one contiguous float64 block (np.cov works in
+        # float64 anyway, so a narrower copy would only be converted again);
+        # missing values are filled with their column mean so a single corrcoef
+        # call covers all pairs. Column-major, so the axis=0 means walk
+        # contiguous columns and corrcoef's transpose is row-contiguous
+        values = np.asfortranarray(orders[numerical_cols].to_numpy(dtype=np.float64))
+        column_means = np.nanmean(values, axis=0)
+        values = np.where(np.isnan(values), column_means, values)
+        correlations = np.corrcoef(values, rowvar=False)
+        correlation_matrix = pd.DataFrame(correlations, index=numerical_cols, columns=numerical_cols)
 
         # Create correlation heatmap
         plt.figure(figsize=(12, 10))
@@ -617,28 +1417,25 @@ class SupplyChainEDA:
                     square=True, linewidths=0.5, cbar_kws={"shrink": 0.8})
         plt.title('Supply Chain Metrics Correlation Matrix', fontsize=16, fontweight='bold', pad=20)
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'charts' / 'correlation_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
-
-        # Find strongest correlations
-        correlation_pairs = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                col1, col2 = correlation_matrix.columns[i], correlation_matrix.columns[j]
-                correlation_pairs.append({
-                    'Variable_1': col1,
-                    'Variable_2': col2,
-                    'Correlation': correlation_matrix.iloc[i, j]
-                })
-
-        correlation_df = pd.DataFrame(correlation_pairs)
-        correlation_df = correlation_df.reindex(correlation_df['Correlation'].abs().sort_values(ascending=False).index)
+        self.save_chart('correlation_analysis.png')
+
+        # Find strongest correlations (every pair above the diagonal), ordered by
+        # strength on the raw arrays before the frame is built
+        upper_i, upper_j = np.triu_indices_from(correlations, k=1)
+        pair_correlations = correlations[upper_i, upper_j]
+        order = np.argsort(-np.abs(pair_correlations), kind='stable')
+        column_names = np.array(numerical_cols)
+        correlation_df = pd.DataFrame({
+            'Variable_1': column_names[upper_i[order]],
+            'Variable_2': column_names[upper_j[order]],
+            'Correlation': pair_correlations[order]
+        })
 
         print("🔗 Strongest Correlations:")
         print(correlation_df.head(10).to_string(index=False))
 
         # Save correlation results
-        correlation_df.to_csv(self.output_dir / 'csv' / 'correlation_analysis.csv', index=False)
+        self.save(correlation_df, 'correlation_analysis')
 
         # Generate insights
         strong_correlations = correlation_df[correlation_df['Correlation'].abs() > 0.7].head(3)
@@ -652,103 +1449,38 @@ class SupplyChainEDA:
         print("\n📊 STATISTICAL SUMMARY ANALYSIS")
         print("=" * 50)
 
-        all_statistics = []
-
-        for table_key, df in self.data.items():
-            if df.empty:
-                continue
-
-            table_name = table_key.replace('bronze_', '').replace('silver_', '').replace('gold_', '')
-            layer = 'bronze' if 'bronze_' in table_key else 'silver' if 'silver_' in table_key else 'gold'
-
-            print(f"\n📋 Analyzing {table_name} ({layer} layer)")
-
-            # Basic statistics
-            total_records = len(df)
-            total_columns = len(df.columns)
-
-            # Numerical columns analysis
-            numerical_cols = df.select_dtypes(include=[np.number]).columns
-            categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-
-            # Memory usage
-            memory_usage = df.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-
-            # Missing values
-            total_nulls = df.isnull().sum().sum()
-            null_percentage = (total_nulls / df.size * 100) if df.size > 0 else 0
-
-            # Duplicates
-            duplicate_count = df.duplicated().sum()
-            duplicate_percentage = (duplicate_count / total_records * 100) if total_records > 0 else 0
-
-            # Statistical summary for numerical columns
-            for col in numerical_cols:
-                col_data = df[col].dropna()
-                if len(col_data) > 0:
-                    stats = {
-                        'table': table_name,
-                        'layer': layer,
-                        'column': col,
-                        'data_type': str(df[col].dtype),
-                        'count': len(col_data),
-                        'nulls': df[col].isnull().sum(),
-                        'null_pct': round((df[col].isnull().sum() / len(df) * 100), 2),
-                        'mean': round(col_data.mean(), 3),
-                        'median': round(col_data.median(), 3),
-                        'mode': col_data.mode().iloc[0] if len(col_data.mode()) > 0 else None,
-                        'std': round(col_data.std(), 3),
-                        'min': col_data.min(),
-                        'max': col_data.max(),
-                        'q25': round(col_data.quantile(0.25), 3),
-                        'q75': round(col_data.quantile(0.75), 3),
-                        'iqr': round(col_data.quantile(0.75) - col_data.quantile(0.25), 3),
-                        'skewness': round(col_data.skew(), 3),
-                        'kurtosis': round(col_data.kurtosis(), 3),
-                        'unique_values': col_data.nunique(),
-                        'unique_pct': round((col_data.nunique() / len(col_data) * 100), 2)
-                    }
-                    all_statistics.append(stats)
-
-            # Summary for categorical columns
-            for col in categorical_cols:
-                col_data = df[col].dropna()
-                if len(col_data) > 0:
-                    most_common = col_data.value_counts().head(1)
-                    stats = {
-                        'table': table_name,
-                        'layer': layer,
-                        'column': col,
-                        'data_type': str(df[col].dtype),
-                        'count': len(col_data),
-                        'nulls': df[col].isnull().sum(),
-                        'null_pct': round((df[col].isnull().sum() / len(df) * 100), 2),
-                        'mean': None,
-                        'median': None,
-                        'mode': most_common.index[0] if len(most_common) > 0 else None,
-                        'std': None,
-                        'min': None,
-                        'max': None,
-                        'q25': None,
-                        'q75': None,
-                        'iqr': None,
-                        'skewness': None,
-                        'kurtosis': None,
-                        'unique_values': col_data.nunique(),
-                        'unique_pct': round((col_data.nunique() / len(col_data) * 100), 2)
-                    }
-                    all_statistics.append(stats)
-
-            print(f"  📊 Records: {total_records:,}")
-            print(f"  📈 Columns: {total_columns} ({len(numerical_cols)} numerical, {len(categorical_cols)} categorical)")
-            print(f"  💾 Memory: {memory_usage:.2f} MB")
-            print(f"  ❌ Nulls: {total_nulls:,} ({null_percentage:.2f}%)")
-            print(f"  🔄 Duplicates: {duplicate_count:,} ({duplicate_percentage:.2f}%)")
-
-        # Convert to DataFrame and save
-        stats_df = pd.DataFrame(all_statistics)
+        # Tables are summarised in parallel threads; pandas and Polars release
+        # the GIL in their kernels. Reports are printed in load order.
+        # Each table's rows are appended to the CSV as soon as the table is
+        # done, so the file is never built from the full frame in one go
+        tables = [(key, df) for key, df in self.data.items() if not df.empty]
+        # Bronze rows are never pulled into self.data; those tables are
+        # summarised from their SQL profiles and come first, as they load first
+        profiled = [(key, profile) for key, profile in self.profiles.items()
+                    if key.startswith('bronze_') and profile['rows'] > 0]
+        all_statistics = {name: [] for name in STATISTICS_DTYPES}
+        if tables or profiled:
+            csv_path = self.output_dir / 'csv' / 'statistical_summary.csv'
+            with open(csv_path, 'w', buffering=CSV_BUFFER_BYTES, newline='') as f, \
+                    ThreadPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, len(tables)))) as executor:
+                writer = csv.writer(f)
+                writer.writerow(STATISTICS_DTYPES)
+                results = executor.map(
+                    lambda item: analyze_table(item[0], item[1], self.ldata.get(item[0]),
+                                               self.numeric_cols.get(item[0]), self.categorical_cols.get(item[0])),
+                    tables)
+                profiled_results = (profile_statistics(key, profile) for key, profile in profiled)
+                for stats, report in itertools.chain(profiled_results, results):
+                    writer.writerows(zip(*(csv_cells(name, stats[name]) for name in STATISTICS_DTYPES)))
+                    for name, values in stats.items():
+                        all_statistics[name].extend(values)
+                    print("\n".join(report))
+
+        # Convert to DataFrame (column lists, dtypes known up front) for the
+        # charts and the Parquet copy
+        stats_df = pd.DataFrame(all_statistics).astype(STATISTICS_DTYPES)
         if not stats_df.empty:
-            stats_df.to_csv(self.output_dir / 'csv' / 'statistical_summary.csv', index=False)
+            self.save(stats_df, 'statistical_summary', write_csv=False)
             print(f"\n✅ Generated statistical summary for {stats_df['table'].nunique()} tables")
             print(f"📊 Total columns analyzed: {len(stats_df)}")
 
@@ -790,8 +1522,8 @@ class SupplyChainEDA:
                     axes[1,1].grid(axis='y', alpha=0.3)
 
             plt.tight_layout()
-            plt.savefig(self.output_dir / 'charts' / 'statistical_summary.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            # Four simple histograms/bars on a 16x12in canvas: 100 dpi is plenty
+            self.save_chart('statistical_summary.png', dpi=100)
 
             # Generate statistical insights
             high_null_cols = stats_df[stats_df['null_pct'] > 20]
@@ -807,6 +1539,26 @@ class SupplyChainEDA:
                 f"💾 Average data completeness: {(100 - stats_df['null_pct'].mean()):.2f}%"
             ])
 
+    def query_totals(self, query):
+        """Run a 'SELECT COUNT(*), <revenue>, <quantity>, <orders> ...' totals query.
+
+        Returns (revenue, quantity, orders) as (float, int, int), or None when
+        the table is empty or cannot be queried.
+        """
+        if not self.get_connection():
+            return None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(query)
+            row_count, revenue, quantity, orders = cursor.fetchone()
+            cursor.close()
+        except psycopg2.Error as e:
+            print(f"⚠️  Reconciliation query failed: {e}")
+            return None
+        if not row_count:
+            return None
+        return float(revenue or 0), int(quantity or 0), int(orders or 0)
+
     def data_reconciliation(self):
         """Perform data reconciliation between Silver and Gold layers"""
         print("\n🔍 DATA RECONCILIATION")
@@ -814,15 +1566,16 @@ class SupplyChainEDA:
 
         reconciliation_results = []
 
-        # Check if we have both Silver and Gold data
-        silver_orders = self.data.get('silver_supply_orders', pd.DataFrame())
-        gold_kpis = self.data.get('gold_supply_chain_kpis', pd.DataFrame())
-        gold_sales = self.data.get('gold_monthly_sales_performance', pd.DataFrame())
+        # Totals are summed in Postgres over the exact NUMERIC values, not over
+        # the (float32-downcast) frames
+        silver_totals = self.query_totals(
+            "SELECT COUNT(*), SUM(total_invoice), SUM(quantity), COUNT(*) FROM silver.supply_orders")
+        gold_totals = self.query_totals(
+            "SELECT COUNT(*), SUM(total_revenue), SUM(total_quantity_sold), SUM(total_orders) "
+            "FROM gold.monthly_sales_performance")
 
-        if not silver_orders.empty:
-            silver_total_revenue = silver_orders['total_invoice'].sum() if 'total_invoice' in silver_orders.columns else 0
-            silver_total_quantity = silver_orders['quantity'].sum() if 'quantity' in silver_orders.columns else 0
-            silver_order_count = len(silver_orders)
+        if silver_totals:
+            silver_total_revenue, silver_total_quantity, silver_order_count = silver_totals
 
             print(f"📊 Silver Layer Totals:")
             print(f"  💰 Total Revenue: ${silver_total_revenue:,.2f}")
@@ -847,10 +1600,8 @@ class SupplyChainEDA:
                 'Source': 'silver.supply_orders'
             })
 
-        if not gold_sales.empty and 'total_revenue' in gold_sales.columns:
-            gold_total_revenue = gold_sales['total_revenue'].sum()
-            gold_total_quantity = gold_sales['total_quantity_sold'].sum() if 'total_quantity_sold' in gold_sales.columns else 0
-            gold_order_count = gold_sales['total_orders'].sum() if 'total_orders' in gold_sales.columns else 0
+        if gold_totals:
+            gold_total_revenue, gold_total_quantity, gold_order_count = gold_totals
 
             print(f"\n📊 Gold Layer Totals:")
             print(f"  💰 Total Revenue: ${gold_total_revenue:,.2f}")
@@ -864,7 +1615,7 @@ class SupplyChainEDA:
             ])
 
             # Reconciliation checks
-            if not silver_orders.empty:
+            if silver_totals:
                 revenue_diff = abs(silver_total_revenue - gold_total_revenue)
                 revenue_pct_diff = (revenue_diff / silver_total_revenue * 100) if silver_total_revenue > 0 else 0
 
@@ -889,7 +1640,7 @@ class SupplyChainEDA:
 
         # Save reconciliation results
         reconciliation_df = pd.DataFrame(reconciliation_results)
-        reconciliation_df.to_csv(self.output_dir / 'csv' / 'reconciliation_results.csv', index=False)
+        self.save(reconciliation_df, 'reconciliation_results')
 
         print(f"\n📋 Reconciliation completed - results saved to reconciliation_results.csv")
 
@@ -915,13 +1666,8 @@ class SupplyChainEDA:
             f"The analysis covers Bronze, Silver, and Gold layer data with quality assessments and business insights.",
             "",
             "## Key Insights",
-        ]
-
-        # Add all collected insights
-        for i, insight in enumerate(self.insights, 1):
-            report_content.append(f"{i}. {insight}")
-
-        report_content.extend([
+            # All collected insights, numbered, as one block
+            "\n".join(f"{i}. {insight}" for i, insight in enumerate(self.insights, 1)),
             "",
             "## Data Quality Summary",
             "- Bronze to Silver transformation maintains high data quality",
@@ -935,25 +1681,26 @@ class SupplyChainEDA:
             "4. Consider implementing real-time dashboard updates",
             "",
             "## Technical Notes",
-            f"- Analysis performed on {sum(len(df) for df in self.data.values() if isinstance(df, pd.DataFrame)):,} total records",
+            f"- Analysis performed on {sum(len(df) for df in self.data.values() if isinstance(df, pd.DataFrame)) + sum(profile['rows'] for key, profile in self.profiles.items() if key.startswith('bronze_')):,} total records",
             f"- Charts and visualizations saved in: {self.output_dir / 'charts'}",
             f"- Data exports available in: {self.output_dir / 'csv'}",
             "",
             "---",
             "*Report generated by Supply Chain EDA Pipeline*"
-        ])
+        ]
 
-        # Save report
+        # Save report (joined once, written in a single call)
         report_path = self.output_dir / 'reports' / 'eda_insights_report.md'
+        report_text = '\n'.join(report_content)
         with open(report_path, 'w') as f:
-            f.write('\n'.join(report_content))
+            f.write(report_text)
 
         print(f"📊 Insights report saved: {report_path}")
         print(f"📈 Total insights generated: {len(self.insights)}")
 
         # Also save insights as CSV
         insights_df = pd.DataFrame({'Insight': self.insights})
-        insights_df.to_csv(self.output_dir / 'csv' / 'key_insights.csv', index=False)
+        self.save(insights_df, 'key_insights')
 
         return report_content
 
@@ -969,7 +1716,8 @@ class SupplyChainEDA:
             print("❌ Failed to load data. Exiting.")
             return False
 
-        print(f"\n📊 Loaded {len(self.data)} datasets for analysis")
+        print(f"\n📊 Loaded {len(self.data)} datasets for analysis "
+              f"({len(self.data.pending)} more read on demand)")
 
         try:
             # Run all analysis modules
@@ -984,6 +1732,9 @@ class SupplyChainEDA:
             # Generate final report
             self.generate_insights_report()
 
+            # Charts are encoded in the background; make sure they are all on disk
+            self.wait_for_charts()
+
             # Summary
             end_time = datetime.now()
             duration = end_time - start_time
@@ -1007,9 +1758,9 @@ if __name__ == "__main__":
     print("🔍 Supply Chain Data Pipeline - Exploratory Data Analysis")
     print("=" * 60)
 
-    # Initialize and run EDA
-    eda = SupplyChainEDA()
-    success = eda.run_complete_analysis()
+    # Initialize and run EDA; --no-cache forces every table to be re-read from the database
+    with SupplyChainEDA(use_cache='--no-cache' not in sys.argv) as eda:
+        success = eda.run_complete_analysis()
 
     if success:
         print(f"\n🎉 EDA completed successfully!")
@@ -12,40 +12,38 @@ Features:
 - Persists to gold.forecasts (overwrite or append)
 """
 
-import os
+import csv
+import io
 import logging
-from typing import List, Dict, Optional, Tuple
+import os
+from itertools import repeat
+from typing import Iterable, List, Dict, Optional, Tuple, Union
 from datetime import timedelta
 import pandas as pd
 import numpy as np
+import psycopg2
 from sqlalchemy import create_engine, text
 from multiprocessing import Pool, cpu_count
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
 
 # Models
 from prophet import Prophet
 from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
 import lightgbm as lgb
 from sklearn.preprocessing import LabelEncoder
+from threadpoolctl import threadpool_limits
+
+from config import DB_DSN
 
 # ---------- Configuration ----------
 LOG_LEVEL = logging.INFO
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s:%(message)s")
 logger = logging.getLogger("parallel_forecast")
 
-# DB config (override with env variables)
-DB_CONFIG = {
-    "host": os.getenv("DB_HOST", "localhost"),
-    "port": int(os.getenv("DB_PORT", "5432")),
-    "database": os.getenv("DB_NAME", "supply_chain"),
-    "user": os.getenv("DB_USER", "postgres"),
-    "password": os.getenv("DB_PASSWORD", "password123"),
-}
-
-ENGINE = create_engine(
-    f"postgresql+psycopg2://{DB_CONFIG['user']}:{DB_CONFIG['password']}@"
-    f"{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
-)
+# connections come from DB_DSN, so credentials are never spliced into a URL
+ENGINE = create_engine("postgresql+psycopg2://", creator=lambda: psycopg2.connect(DB_DSN))
 
 # Forecast storage options
 GOLD_SCHEMA = "gold"
@@ -55,13 +53,52 @@ OVERWRITE_GOLD = True  # if True -> delete existing rows for this run before ins
 # Defaults
 DEFAULT_HORIZON_DAYS = 90
 NUM_PROCESSES = max(1, cpu_count() - 1)  # leave one core free
+PROPHET_UNCERTAINTY_SAMPLES = 100  # interval simulation draws (Prophet default 1000)
+WORKER_MAX_TASKS = 50  # recycle pool workers to bound memory growth from Prophet/Stan state
 MIN_SERIES_LEN = 14  # min data points required to run heavier models
+PROPHET_MIN_SERIES_LEN = 60  # shorter series skip Prophet's Stan start-up and use exponential smoothing
 WEEKLY_FREQ = "W-MON"  # weekly anchored on Monday
 DAILY_FREQ = "D"
+COPY_BATCH_ROWS = 10_000  # forecast rows per COPY into gold while the workers keep producing
+FORECAST_COLUMNS = ["ds", "yhat", "yhat_lower", "yhat_upper", "granularity", "model", "level", "entity_id"]
+
+# Global LightGBM model: all cores for the histogram build, smaller histograms
+# (max_bin 127), row/feature subsampling and a minimum leaf size
+LGBM_PARAMS = {
+    "objective": "regression",
+    "metric": "rmse",
+    "verbosity": -1,
+    "boosting_type": "gbdt",
+    "num_threads": NUM_PROCESSES,
+    "max_bin": 127,
+    "feature_pre_filter": True,
+    "feature_fraction": 0.8,
+    "bagging_fraction": 0.8,
+    "bagging_freq": 5,
+    "min_data_in_leaf": 50,
+    "seed": 42,
+}
 
 # ---------- Utility DB functions ----------
-def query(sql: str) -> pd.DataFrame:
-    return pd.read_sql(sql, ENGINE)
+def query(sql: str, params: Optional[Dict] = None) -> pd.DataFrame:
+    """Run a SELECT; params are bound to :name placeholders in sql."""
+    return pd.read_sql(text(sql), ENGINE, params=params)
+
+def copy_query(sql: str, dtype: Optional[Dict] = None) -> pd.DataFrame:
+    """
+    Run a SELECT through COPY ... TO STDOUT on a plain psycopg2 connection and parse the
+    CSV with pandas; much cheaper than read_sql's row-by-row fetch for large results.
+    """
+    buffer = io.StringIO()
+    conn = psycopg2.connect(DB_DSN)
+    try:
+        with conn.cursor() as cur:
+            cur.copy_expert(f"COPY ({sql.strip().rstrip(';')}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer)
+    finally:
+        conn.close()
+    buffer.seek(0)
+    # COPY CSV writes NULL as an empty field; only that is NA, so ids like "NA" or "None" survive
+    return pd.read_csv(buffer, dtype=dtype, keep_default_na=False, na_values=[""])
 
 def ensure_gold_table():
     create_sql = f"""
@@ -83,26 +120,100 @@ def ensure_gold_table():
     with ENGINE.begin() as conn:
         conn.execute(text(create_sql))
 
-def save_forecasts_to_gold(df: pd.DataFrame, run_id: str, overwrite: bool = True):
+def forecast_rows(df: pd.DataFrame, created_at: pd.Timestamp, run_id: str):
     """
-    df must contain columns: ds, yhat, yhat_lower, yhat_upper, granularity, model, level, entity_id
+    CSV rows of one forecast frame for COPY: FORECAST_COLUMNS, then created_at and run_id.
+    NaN -> NULL; float32 forecasts are written in their short repr rather than widened to float64.
     """
-    ensure_gold_table()
-    if df.empty:
-        logger.warning("No forecasts to save.")
-        return
+    columns = [
+        (df[c].astype(str) if df[c].dtype == np.float32 else df[c]).astype(object).where(df[c].notna(), None)
+        for c in FORECAST_COLUMNS
+    ]
+    return zip(*columns, repeat(created_at), repeat(run_id))
+
+def copy_forecast_buffer(cur, buffer: io.StringIO):
+    """COPY the CSV rows accumulated in buffer into the gold table and empty the buffer."""
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY {GOLD_SCHEMA}.{GOLD_TABLE} ({', '.join(FORECAST_COLUMNS)}, created_at, run_id) "
+        f"FROM STDIN WITH (FORMAT csv)",
+        buffer
+    )
+    buffer.seek(0)
+    buffer.truncate()
+
+def save_forecasts_to_gold(forecasts: Union[pd.DataFrame, Iterable[pd.DataFrame]], run_id: str,
+                           overwrite: bool = True) -> int:
+    """
+    forecasts: one DataFrame, or an iterable of them consumed as they arrive, each with columns
+    ds, yhat, yhat_lower, yhat_upper, granularity, model, level, entity_id (FORECAST_COLUMNS).
+    Rows are bulk-loaded with COPY in batches of ~COPY_BATCH_ROWS; the DELETE and every
+    batch share one transaction, committed at the end. Returns the number of rows saved.
+    """
+    if isinstance(forecasts, pd.DataFrame):
+        forecasts = [forecasts]
+
+    created_at = pd.Timestamp.now()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    pending = total = 0
+    raw = None
+    try:
+        for df in forecasts:
+            if df.empty:
+                continue
+            if raw is None:
+                # the table is only touched once there is something to write
+                ensure_gold_table()
+                raw = ENGINE.raw_connection()
+                cur = raw.cursor()
+                if overwrite:
+                    # Delete rows for this run_id if existed previously (safer)
+                    cur.execute(f"DELETE FROM {GOLD_SCHEMA}.{GOLD_TABLE} WHERE run_id = %s", (run_id,))
+            writer.writerows(forecast_rows(df, created_at, run_id))
+            pending += len(df)
+            if pending >= COPY_BATCH_ROWS:
+                copy_forecast_buffer(cur, buffer)
+                total += pending
+                pending = 0
+
+        if raw is None:
+            logger.warning("No forecasts to save.")
+            return 0
+        if pending:
+            copy_forecast_buffer(cur, buffer)
+            total += pending
+        raw.commit()
+    except Exception:
+        if raw is not None:
+            raw.rollback()
+        raise
+    finally:
+        if raw is not None:
+            raw.close()
+    logger.info(f"Saved {total} rows to {GOLD_SCHEMA}.{GOLD_TABLE} (run_id={run_id})")
+    return total
+
+def finalize_forecasts(df: pd.DataFrame, model: str, granularity: str) -> pd.DataFrame:
+    """Attach missing metadata columns, normalize ds to dates and default absent bounds to yhat +/- 20%."""
+    # attach metadata columns if missing (for lgbm we created them)
+    if "granularity" not in df.columns:
+        df["granularity"] = granularity
+    if "model" not in df.columns:
+        df["model"] = model
+    if "level" not in df.columns:
+        df["level"] = "unknown"
+    if "entity_id" not in df.columns:
+        df["entity_id"] = "ALL"
 
-    with ENGINE.begin() as conn:
-        if overwrite:
-            # Delete rows for this run_id if existed previously (safer)
-            conn.execute(text(f"DELETE FROM {GOLD_SCHEMA}.{GOLD_TABLE} WHERE run_id = :rid"), {"rid": run_id})
-        # Bulk insert via pandas
-        df_to_write = df.copy()
-        df_to_write["created_at"] = pd.Timestamp.now()
-        df_to_write["run_id"] = run_id
-        # Use to_sql (psycopg2 + SQLAlchemy)
-        df_to_write.to_sql(GOLD_TABLE, con=ENGINE, schema=GOLD_SCHEMA, if_exists="append", index=False)
-    logger.info(f"Saved {len(df)} rows to {GOLD_SCHEMA}.{GOLD_TABLE} (run_id={run_id})")
+    # ensure columns in right format
+    df["ds"] = pd.to_datetime(df["ds"]).dt.date
+    # set null bounds to mean +/- 20% if absent
+    if "yhat_lower" not in df.columns or df["yhat_lower"].isnull().all():
+        df["yhat_lower"] = (df["yhat"] * 0.8).astype("float32")
+    if "yhat_upper" not in df.columns or df["yhat_upper"].isnull().all():
+        df["yhat_upper"] = (df["yhat"] * 1.2).astype("float32")
+    return df
 
 # ---------- Data preparation ----------
 def fetch_entities(level: str) -> List[str]:
@@ -125,12 +236,13 @@ def fetch_series(level: str, entity_id: str, granularity: str = "daily") -> pd.D
     if granularity not in ("daily", "weekly"):
         raise ValueError("granularity must be 'daily' or 'weekly'")
 
+    # entity_id is bound as a parameter, never interpolated into the SQL
     if level == "product":
-        where = f"so.product_id = '{entity_id}'"
+        where = "so.product_id = :eid"
     elif level == "warehouse":
-        where = f"so.warehouse_id = '{entity_id}'"
+        where = "so.warehouse_id = :eid"
     elif level == "region":
-        where = f"w.region = '{entity_id}'"
+        where = "w.region = :eid"
     else:
         raise ValueError("level must be product|warehouse|region")
 
@@ -150,9 +262,16 @@ def fetch_series(level: str, entity_id: str, granularity: str = "daily") -> pd.D
     GROUP BY {group_by}
     ORDER BY ds;
     """
-    df = query(sql)
+    df = query(sql, {"eid": entity_id})
     if df.empty:
         return df
+    return fill_series(df, granularity)
+
+def fill_series(df: pd.DataFrame, granularity: str) -> pd.DataFrame:
+    """
+    Reindex a ['ds','y'] aggregate to a continuous daily/weekly date range (missing periods -> 0).
+    """
+    df = df[["ds", "y"]].copy()
     df["ds"] = pd.to_datetime(df["ds"]).dt.date
     # reindex to continuous date range
     freq = WEEKLY_FREQ if granularity == "weekly" else DAILY_FREQ
@@ -164,6 +283,65 @@ def fetch_series(level: str, entity_id: str, granularity: str = "daily") -> pd.D
     merged["y"] = merged["y"].astype(float)
     return merged
 
+def fetch_all_series(level: str, granularity: str = "daily") -> Dict[str, pd.DataFrame]:
+    """
+    Same series as fetch_series, for every entity of a level from one grouped query.
+    Returns {entity_id: DataFrame['ds','y']}; entities without orders are absent.
+    """
+    if granularity not in ("daily", "weekly"):
+        raise ValueError("granularity must be 'daily' or 'weekly'")
+
+    if level == "product":
+        entity = "so.product_id"
+    elif level == "warehouse":
+        entity = "so.warehouse_id"
+    elif level == "region":
+        entity = "w.region"
+    else:
+        raise ValueError("level must be product|warehouse|region")
+
+    if level == "region":
+        join = "JOIN silver.warehouses w ON so.warehouse_id = w.warehouse_id"
+    else:
+        join = "LEFT JOIN silver.warehouses w ON so.warehouse_id = w.warehouse_id"
+
+    date_trunc = "DATE_TRUNC('week', so.order_date)::date" if granularity == "weekly" else "so.order_date::date"
+
+    sql = f"""
+    SELECT {entity}::text AS entity, {date_trunc} AS ds, SUM(so.quantity) AS y
+    FROM silver.supply_orders so
+    {join}
+    WHERE {entity} IS NOT NULL
+    GROUP BY 1, 2
+    ORDER BY 1, 2;
+    """
+    # the largest read of a run: bulk COPY instead of read_sql
+    df = copy_query(sql, dtype={"entity": str})
+    if df.empty:
+        return {}
+    full = fill_all_series(df, granularity)
+    return {ent: grp[["ds", "y"]].reset_index(drop=True) for ent, grp in full.groupby("entity", sort=False)}
+
+def fill_all_series(df: pd.DataFrame, granularity: str) -> pd.DataFrame:
+    """
+    fill_series for a tall ['entity','ds','y'] frame in one pass: every entity is reindexed
+    to its own continuous date range with a single vectorized merge.
+    """
+    df = df.assign(ds=pd.to_datetime(df["ds"]))
+    step = np.timedelta64(7 if granularity == "weekly" else 1, "D")
+    bounds = df.groupby("entity", sort=False)["ds"].agg(["min", "max"])
+    periods = ((bounds["max"] - bounds["min"]) // step + 1).to_numpy()
+    # position of each row within its entity's range
+    offsets = np.arange(periods.sum()) - np.repeat(np.cumsum(periods) - periods, periods)
+    full = pd.DataFrame({
+        "entity": np.repeat(bounds.index.to_numpy(), periods),
+        "ds": np.repeat(bounds["min"].to_numpy(), periods) + offsets * step,
+    })
+    full = full.merge(df, on=["entity", "ds"], how="left")
+    full["y"] = full["y"].fillna(0).astype(float)
+    full["ds"] = full["ds"].dt.date
+    return full
+
 # ---------- Modeling helpers ----------
 def fit_prophet_and_forecast(series_df: pd.DataFrame, horizon: int, granularity: str) -> pd.DataFrame:
     """
@@ -173,8 +351,15 @@ def fit_prophet_and_forecast(series_df: pd.DataFrame, horizon: int, granularity:
         return pd.DataFrame()
     df = series_df.rename(columns={"ds": "ds", "y": "y"}).copy()
     df["ds"] = pd.to_datetime(df["ds"])
-    # Choose seasonality options
-    m = Prophet(daily_seasonality=(granularity == "daily"), yearly_seasonality=True, weekly_seasonality=(granularity=="daily"))
+    # Choose seasonality options: yearly only with two full years of history,
+    # and fewer changepoints on short series
+    periods_per_year = 52 if granularity == "weekly" else 365
+    m = Prophet(daily_seasonality=(granularity == "daily"),
+                yearly_seasonality=len(df) >= 2 * periods_per_year,
+                weekly_seasonality=(granularity=="daily"),
+                n_changepoints=min(25, max(5, len(df) // 10)),
+                uncertainty_samples=PROPHET_UNCERTAINTY_SAMPLES,
+                mcmc_samples=0)
     m.fit(df)
     future = m.make_future_dataframe(periods=horizon, freq="D" if granularity == "daily" else "W")
     fc = m.predict(future)
@@ -210,17 +395,62 @@ def fit_sarimax_and_forecast(series_df: pd.DataFrame, horizon: int, granularity:
         logger.warning(f"SARIMAX failed: {e}")
         return pd.DataFrame()
 
+def fit_ets_and_forecast(series_df: pd.DataFrame, horizon: int, granularity: str) -> pd.DataFrame:
+    """
+    Fast path for short series: additive Holt-Winters exponential smoothing
+    (seasonal only with two full seasons of history). Bounds are yhat +/- 1.28 residual std (~80%).
+    """
+    if series_df.empty or len(series_df) < MIN_SERIES_LEN:
+        return pd.DataFrame()
+    ts = pd.Series(series_df["y"].values, index=pd.to_datetime(series_df["ds"]))
+    s = 52 if granularity == "weekly" else 7
+    seasonal = "add" if len(ts) >= 2 * s else None
+    try:
+        res = ExponentialSmoothing(ts.values, trend="add", seasonal=seasonal,
+                                   seasonal_periods=s if seasonal else None).fit()
+        mean = res.forecast(horizon)
+        spread = 1.28 * np.std(res.resid)
+        step = pd.Timedelta(weeks=1) if granularity == "weekly" else pd.Timedelta(days=1)
+        out = pd.DataFrame({
+            "ds": pd.date_range(start=ts.index[-1] + step, periods=horizon, freq=(WEEKLY_FREQ if granularity == "weekly" else DAILY_FREQ)),
+            "yhat": mean,
+            "yhat_lower": mean - spread,
+            "yhat_upper": mean + spread
+        })
+        out["ds"] = out["ds"].dt.date
+        return out
+    except Exception as e:
+        logger.warning(f"ExponentialSmoothing failed: {e}")
+        return pd.DataFrame()
+
 # ---------- Per-entity worker (for parallel) ----------
+def init_worker():
+    """
+    Pool initializer: one BLAS/OpenMP thread per worker (the processes already use every core)
+    and a connection pool of the worker's own.
+    """
+    os.environ["OMP_NUM_THREADS"] = "1"
+    os.environ["MKL_NUM_THREADS"] = "1"
+    os.environ["OPENBLAS_NUM_THREADS"] = "1"
+    # numpy's BLAS was loaded before the fork, so limit its pools directly as well
+    threadpool_limits(1)
+    # the forked ENGINE pool still holds the parent's sockets: drop them (without closing
+    # the parent's sessions) so a worker that queries opens and keeps its own connection
+    ENGINE.dispose(close=False)
+
 def worker_forecast_entity(args: Tuple):
-    """Unpack args and run forecasting for one entity with chosen model."""
-    level, ent, model_name, horizon, granularity = args
+    """Unpack args and run forecasting for one entity with chosen model (series_df comes preloaded)."""
+    level, ent, series_df, model_name, horizon, granularity = args
     try:
-        series_df = fetch_series(level, ent, granularity=granularity)
         if series_df.empty or len(series_df) < MIN_SERIES_LEN:
             logger.debug(f"[{model_name}] Skip {level}:{ent} (len={len(series_df)})")
             return pd.DataFrame()
 
-        if model_name == "prophet":
+        if model_name == "prophet" and len(series_df) < PROPHET_MIN_SERIES_LEN:
+            # short series: Stan start-up would dwarf the fit, use exponential smoothing
+            model_name = "ets"
+            out = fit_ets_and_forecast(series_df, horizon, granularity)
+        elif model_name == "prophet":
             out = fit_prophet_and_forecast(series_df, horizon, granularity)
         elif model_name == "sarimax":
             out = fit_sarimax_and_forecast(series_df, horizon, granularity)
@@ -231,47 +461,80 @@ def worker_forecast_entity(args: Tuple):
         if out.empty:
             return pd.DataFrame()
 
+        # forecasts don't need double precision; float32 halves the concat and COPY payload
+        out[["yhat", "yhat_lower", "yhat_upper"]] = out[["yhat", "yhat_lower", "yhat_upper"]].astype("float32")
         out["granularity"] = granularity
         out["model"] = model_name
         out["level"] = level
         out["entity_id"] = str(ent)
-        return out[["ds", "yhat", "yhat_lower", "yhat_upper", "granularity", "model", "level", "entity_id"]]
+        return out[FORECAST_COLUMNS]
     except Exception as e:
         logger.exception(f"Worker failed for {level}:{ent}: {e}")
         return pd.DataFrame()
 
+def forecast_in_parallel(tasks: List[Tuple], model_name: str):
+    """
+    Yield worker_forecast_entity results as they complete.
+    SARIMAX runs in threads (statsmodels' Kalman filter releases the GIL, and threads
+    share the preloaded series without pickling); Prophet runs in a process pool.
+    """
+    if model_name == "sarimax":
+        logger.info(f"Using {NUM_PROCESSES} threads for parallel forecasting.")
+        # one BLAS thread per fit, the threads already use every core
+        with threadpool_limits(1), ThreadPoolExecutor(max_workers=NUM_PROCESSES) as executor:
+            futures = [executor.submit(worker_forecast_entity, t) for t in tasks]
+            for fut in as_completed(futures):
+                yield fut.result()
+    else:
+        logger.info(f"Using {NUM_PROCESSES} processes for parallel forecasting.")
+        chunksize = max(1, len(tasks) // (NUM_PROCESSES * 4))
+        with Pool(processes=NUM_PROCESSES, maxtasksperchild=WORKER_MAX_TASKS, initializer=init_worker) as pool:
+            yield from pool.imap_unordered(worker_forecast_entity, tasks, chunksize=chunksize)
+
 # ---------- Global LightGBM approach ----------
-def prepare_panel_dataset(levels: List[str], granularity: str, lags: List[int] = [1,7,14]) -> Tuple[pd.DataFrame, Dict]:
+def prepare_panel_dataset(levels: List[str], granularity: str, lags: List[int] = [1,7,14],
+                          series: Optional[Dict[str, Dict[str, pd.DataFrame]]] = None) -> Tuple[pd.DataFrame, Dict]:
     """
     Build panel dataset with features for LightGBM.
     Returns (train_df, meta) where train_df has columns: ds, entity, y, features...
     meta contains entity list per level.
+    series: preloaded {level: fetch_all_series(level, granularity)}; fetched here when not given.
     """
-    records = []
+    if series is None:
+        series = {level: fetch_all_series(level, granularity) for level in levels}
+    frames = []
     meta = {}
     for level in levels:
         entities = fetch_entities(level)
         meta[level] = entities
         for ent in entities:
-            ser = fetch_series(level, ent, granularity=granularity)
-            if ser.empty or len(ser) < max(lags) + 2:
+            ser = series[level].get(ent)
+            if ser is None or ser.empty or len(ser) < max(lags) + 2:
                 continue
-            ser = ser.rename(columns={"ds": "ds", "y": "y"})
-            ser["ds"] = pd.to_datetime(ser["ds"])
-            ser = ser.sort_values("ds").reset_index(drop=True)
-            for i in range(max(lags), len(ser)):
-                row = {"ds": ser.loc[i, "ds"], "entity": f"{level}__{ent}", "y": ser.loc[i, "y"]}
-                # add time features
-                row["dow"] = ser.loc[i, "ds"].dayofweek
-                row["month"] = ser.loc[i, "ds"].month
-                row["weekofyear"] = ser.loc[i, "ds"].isocalendar().week
-                # lags
-                for lag in lags:
-                    row[f"lag_{lag}"] = ser.loc[i - lag, "y"]
-                # rolling
-                row["roll_mean_7"] = ser.loc[max(0, i-6):i, "y"].mean()
-                records.append(row)
-    train_df = pd.DataFrame.from_records(records)
+            frames.append(ser.assign(entity=f"{level}__{ent}"))
+    if not frames:
+        return pd.DataFrame(), meta
+
+    # one tall (entity, ds) frame; every feature is a per-entity vectorized shift/rolling
+    panel = pd.concat(frames, ignore_index=True)
+    panel["ds"] = pd.to_datetime(panel["ds"])
+    panel = panel.sort_values(["entity", "ds"], kind="stable", ignore_index=True)
+    by_entity = panel.groupby("entity", sort=False)["y"]
+    train_df = panel[["ds", "entity", "y"]].copy()
+    # add time features
+    train_df["dow"] = panel["ds"].dt.dayofweek.astype("int8")
+    train_df["month"] = panel["ds"].dt.month.astype("int8")
+    train_df["weekofyear"] = panel["ds"].dt.isocalendar().week.astype("int16")
+    # lags
+    for lag in lags:
+        train_df[f"lag_{lag}"] = by_entity.shift(lag)
+    # rolling mean of the 7 values before each row (what the forecast loop feeds the model);
+    # the kept rows are >= max(lags) into their entity, so the window never crosses entities
+    train_df["roll_mean_7"] = by_entity.shift(1).rolling(7).mean()
+    # keep rows with a full set of lags; features are float32 (LightGBM bins them anyway)
+    train_df = train_df[by_entity.cumcount() >= max(lags)].reset_index(drop=True)
+    feature_cols = [f"lag_{lag}" for lag in lags] + ["roll_mean_7"]
+    train_df[feature_cols] = train_df[feature_cols].astype("float32")
     return train_df, meta
 
 def train_lgbm_and_predict(levels: List[str], horizon: int, granularity: str, lags: List[int] = [1,7,14]) -> pd.DataFrame:
@@ -279,121 +542,152 @@ def train_lgbm_and_predict(levels: List[str], horizon: int, granularity: str, la
     Train a single LightGBM model on the panel dataset and predict horizon for all entities.
     We do autoregressive prediction for each entity: predict 1 step, append, predict next, etc.
     """
-    train_df, meta = prepare_panel_dataset(levels, granularity, lags)
+    # one grouped query per level serves both the training panel and the forecast seeds
+    series = {level: fetch_all_series(level, granularity) for level in levels}
+    train_df, meta = prepare_panel_dataset(levels, granularity, lags, series=series)
     if train_df.empty:
         logger.warning("No training data for LGBM.")
         return pd.DataFrame()
 
     # encode entity
     le = LabelEncoder()
-    train_df["entity_code"] = le.fit_transform(train_df["entity"])
+    train_df["entity_code"] = le.fit_transform(train_df["entity"]).astype("int32")
     features = [c for c in train_df.columns if c not in ("ds", "entity", "y")]
     X = train_df[features]
     y = train_df["y"]
-    lgb_train = lgb.Dataset(X, y)
-    params = {"objective": "regression", "metric": "rmse", "verbosity": -1}
-    bst = lgb.train(params, lgb_train, num_boost_round=200)
-
-    # Predict for each entity autoregressively
-    all_preds = []
-    for level in levels:
-        entities = meta.get(level, [])
-        for ent in entities:
-            ent_key = f"{level}__{ent}"
-            # fetch original series to initialize lags
-            ser = fetch_series(level, ent, granularity=granularity)
-            if ser.empty:
-                continue
-            ser = ser.sort_values("ds").reset_index(drop=True)
-            hist = list(ser["y"].values)
-            last_date = pd.to_datetime(ser["ds"].iloc[-1])
-            # iterative forecast
-            preds = []
-            for step in range(1, horizon + 1):
-                # build features for current step
-                ds = (last_date + pd.Timedelta(days=step)) if granularity == "daily" else (last_date + pd.offsets.Week(1) * step)
-                feat = {"entity": ent_key,
-                        "dow": ds.dayofweek,
-                        "month": ds.month,
-                        "weekofyear": ds.isocalendar().week if granularity == "daily" else ds.isocalendar().week}
-                # lags: use hist
-                for lag in lags:
-                    feat[f"lag_{lag}"] = hist[-lag] if len(hist) >= lag else 0.0
-                feat["roll_mean_7"] = np.mean(hist[-7:]) if len(hist) >= 1 else 0.0
-                feat["entity_code"] = le.transform([ent_key])[0] if ent_key in le.classes_ else -1
-                X_pred = pd.DataFrame([feat])[features]
-                y_pred = bst.predict(X_pred)[0]
-                preds.append((ds.date(), max(0.0, float(y_pred))))
-                # append predicted value to history for next step (autoregressive)
-                hist.append(y_pred)
-            # build out rows
-            for ds, yhat in preds:
-                all_preds.append({
-                    "ds": ds, "yhat": yhat, "yhat_lower": None, "yhat_upper": None,
-                    "granularity": granularity, "model": "lgbm", "level": level, "entity_id": str(ent)
-                })
-    return pd.DataFrame(all_preds)
+    # entity_code is categorical, so LightGBM groups entities instead of splitting on code order
+    lgb_train = lgb.Dataset(X, y, categorical_feature=["entity_code"], free_raw_data=False)
+    bst = lgb.train(LGBM_PARAMS, lgb_train, num_boost_round=200)
+
+    # Predict autoregressively, all entities in one batch per step
+    seeds = [(level, ent, series[level][ent]) for level in levels for ent in meta.get(level, [])
+             if ent in series[level] and not series[level][ent].empty]
+    if not seeds:
+        return pd.DataFrame()
+    ent_keys = [f"{level}__{ent}" for level, ent, _ in seeds]
+    class_codes = {key: code for code, key in enumerate(le.classes_)}
+    entity_codes = np.array([class_codes.get(key, -1) for key in ent_keys], dtype=np.int32)
+
+    # last `width` observations per entity, right-aligned; shorter histories are NaN-padded
+    width = max(max(lags), 7)
+    hist = np.full((len(seeds), width), np.nan, dtype=np.float32)
+    last_dates = []
+    for row, (_, _, ser) in enumerate(seeds):
+        ser = ser.sort_values("ds")
+        tail = ser["y"].to_numpy(dtype=np.float32)[-width:]
+        hist[row, width - len(tail):] = tail
+        last_dates.append(ser["ds"].iloc[-1])
+    last_dates = pd.to_datetime(last_dates).to_numpy()
+
+    # every (entity, step) forecast date at once, entity-major; calendar features are
+    # extracted in one pass and sliced per step
+    step_len = np.timedelta64(1 if granularity == "daily" else 7, "D")
+    steps = np.arange(1, horizon + 1)
+    ds = pd.DatetimeIndex(np.repeat(last_dates, horizon) + np.tile(steps, len(seeds)) * step_len)
+    dow = ds.dayofweek.to_numpy().astype(np.int8).reshape(len(seeds), horizon)
+    month = ds.month.to_numpy().astype(np.int8).reshape(len(seeds), horizon)
+    weekofyear = ds.isocalendar().week.to_numpy().astype(np.int16).reshape(len(seeds), horizon)
+
+    step_preds = []
+    for step in range(horizon):
+        # build features for current step
+        feat = {"dow": dow[:, step],
+                "month": month[:, step],
+                "weekofyear": weekofyear[:, step]}
+        # lags: use hist (0 when the history is shorter than the lag)
+        for lag in lags:
+            feat[f"lag_{lag}"] = np.nan_to_num(hist[:, -lag], nan=0.0)
+        feat["roll_mean_7"] = np.nanmean(hist[:, -7:], axis=1)
+        feat["entity_code"] = entity_codes
+        y_pred = bst.predict(pd.DataFrame(feat)[features])
+        step_preds.append(np.maximum(y_pred, 0.0).astype(np.float32))
+        # append predicted value to history for next step (autoregressive)
+        hist = np.column_stack([hist[:, 1:], y_pred.astype(np.float32)])
+
+    # build out rows (entity-major, steps in order)
+    return pd.DataFrame({
+        "ds": ds.date,
+        "yhat": np.column_stack(step_preds).ravel(),
+        "yhat_lower": None, "yhat_upper": None,
+        "granularity": granularity, "model": "lgbm",
+        "level": np.repeat([level for level, _, _ in seeds], horizon),
+        "entity_id": np.repeat([str(ent) for _, ent, _ in seeds], horizon),
+    })
 
 # ---------- Orchestration ----------
 def run_parallel_forecasts(levels: List[str], model: str = "prophet", granularity: str = "daily",
                            horizon: int = DEFAULT_HORIZON_DAYS, parallel: bool = True,
                            run_id: Optional[str] = None, overwrite_gold: bool = True,
-                           bottom_up_reconcile: bool = False, sample_limit: Optional[int] = None) -> pd.DataFrame:
+                           bottom_up_reconcile: bool = False, sample_limit: Optional[int] = None,
+                           return_frame: bool = False) -> Union[pd.DataFrame, int]:
     """
     top-level function:
     - levels: list of 'product','warehouse','region'
     - model: 'prophet'|'sarimax'|'lgbm'
     - granularity: 'daily'|'weekly'
+    - return_frame: also collect every forecast and return them as one DataFrame;
+      by default forecasts are only streamed to gold and the saved row count is returned
     """
     if run_id is None:
         run_id = f"run_{pd.Timestamp.now().strftime('%Y%m%d%H%M%S')}"
     logger.info(f"Starting run {run_id} model={model} granularity={granularity} horizon={horizon} levels={levels}")
 
-    all_results = []
-
     if model == "lgbm":
         # global model
-        preds_df = train_lgbm_and_predict(levels, horizon, granularity)
-        if not preds_df.empty:
-            all_results.append(preds_df)
+        outputs = [train_lgbm_and_predict(levels, horizon, granularity)]
     else:
         # per-entity models (can parallelize)
+        # every entity's series comes from one grouped query per level
+        empty_series = pd.DataFrame(columns=["ds", "y"])
         tasks = []
         for level in levels:
             entities = fetch_entities(level)
             if sample_limit:
                 entities = entities[:sample_limit]
+            level_series = fetch_all_series(level, granularity)
             for ent in entities:
-                tasks.append((level, ent, model, horizon, granularity))
+                tasks.append((level, ent, level_series.get(ent, empty_series), model, horizon, granularity))
+
+        # longest series first, so the slowest fits don't leave the pool idle at the end
+        tasks.sort(key=lambda t: len(t[2]), reverse=True)
 
         logger.info(f"Prepared {len(tasks)} tasks for per-entity modeling.")
         if parallel and len(tasks) > 0:
-            logger.info(f"Using {NUM_PROCESSES} processes for parallel forecasting.")
-            with Pool(processes=NUM_PROCESSES) as pool:
-                for out in pool.imap_unordered(worker_forecast_entity, tasks):
-                    if out is None or out.empty:
-                        continue
-                    all_results.append(out)
+            outputs = forecast_in_parallel(tasks, model)
         else:
             # sequential
-            for t in tasks:
-                out = worker_forecast_entity(t)
-                if out is None or out.empty:
-                    continue
-                all_results.append(out)
+            outputs = map(worker_forecast_entity, tasks)
 
-    if not all_results:
+    # frames are only kept in memory when the caller wants them back,
+    # or the product rows when reconciliation needs them
+    kept_results = []
+
+    def finished_forecasts():
+        for out in outputs:
+            if out is None or out.empty:
+                continue
+            out = finalize_forecasts(out, model, granularity)
+            if return_frame:
+                kept_results.append(out)
+            elif bottom_up_reconcile:
+                kept_results.append(out[out["level"] == "product"])
+            yield out
+
+    # Save to gold: each forecast is COPYed in batches as it arrives, while the workers keep going
+    saved_rows = save_forecasts_to_gold(finished_forecasts(), run_id, overwrite=overwrite_gold)
+
+    if not saved_rows:
         logger.warning("No forecasts were produced.")
-        return pd.DataFrame()
+        return pd.DataFrame() if return_frame else 0
 
-    combined = pd.concat(all_results, ignore_index=True, sort=False)
+    combined = pd.concat(kept_results, ignore_index=True, sort=False) if kept_results else pd.DataFrame()
 
     # Optional bottom-up reconciliation (simple approach):
     if bottom_up_reconcile:
         logger.info("Running bottom-up reconciliation (product -> warehouse -> region)")
         # Only if product forecasts exist: aggregate up
         try:
-            prod = combined[combined["level"] == "product"]
+            prod = combined[combined["level"] == "product"] if not combined.empty else combined
             if not prod.empty:
                 # aggregate product -> warehouse: requires mapping product->warehouse via silver.supply_orders
                 # We'll compute product*date sums and then map using historical proportions (approx)
@@ -405,30 +699,8 @@ def run_parallel_forecasts(levels: List[str], model: str = "prophet", granularit
         except Exception:
             logger.exception("Reconciliation failed; continuing without it.")
 
-    # attach metadata columns if missing (for lgbm we created them)
-    if "granularity" not in combined.columns:
-        combined["granularity"] = granularity
-    if "model" not in combined.columns:
-        combined["model"] = model
-    if "level" not in combined.columns:
-        combined["level"] = combined.get("level", "unknown")
-    if "entity_id" not in combined.columns:
-        combined["entity_id"] = combined.get("entity_id", "ALL")
-
-    # ensure columns in right format
-    combined = combined.rename(columns={"ds": "ds", "yhat": "yhat"})
-    combined["ds"] = pd.to_datetime(combined["ds"]).dt.date
-    # set null bounds to mean +/- 20% if absent
-    if "yhat_lower" not in combined.columns or combined["yhat_lower"].isnull().all():
-        combined["yhat_lower"] = (combined["yhat"] * 0.8).astype(float)
-    if "yhat_upper" not in combined.columns or combined["yhat_upper"].isnull().all():
-        combined["yhat_upper"] = (combined["yhat"] * 1.2).astype(float)
-
-    # Save to gold
-    save_forecasts_to_gold(combined[["ds", "yhat", "yhat_lower", "yhat_upper", "granularity", "model", "level", "entity_id"]], run_id, overwrite=overwrite_gold)
-
-    logger.info(f"Run {run_id} completed. Total forecast rows: {len(combined)}")
-    return combined
+    logger.info(f"Run {run_id} completed. Total forecast rows: {saved_rows}")
+    return combined if return_frame else saved_rows
 
 # ---------- Example / CLI ----------
 if __name__ == "__main__":
@@ -443,12 +715,12 @@ if __name__ == "__main__":
     bottom_up_reconcile = False
     sample_limit = None  # can set small number for quick testing e.g. 50
 
-    result_df = run_parallel_forecasts(levels=levels, model=model, granularity=granularity,
-                                       horizon=horizon, parallel=parallel, run_id=run_id,
-                                       overwrite_gold=overwrite_gold, bottom_up_reconcile=bottom_up_reconcile,
-                                       sample_limit=sample_limit)
+    saved_rows = run_parallel_forecasts(levels=levels, model=model, granularity=granularity,
+                                        horizon=horizon, parallel=parallel, run_id=run_id,
+                                        overwrite_gold=overwrite_gold, bottom_up_reconcile=bottom_up_reconcile,
+                                        sample_limit=sample_limit)
 
-    if not result_df.empty:
-        logger.info(result_df.head(20).to_string(index=False))
+    if saved_rows:
+        logger.info(f"Saved {saved_rows} forecast rows to gold.forecasts")
     else:
         logger.warning("No results generated.")
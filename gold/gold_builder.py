@@ -12,7 +12,7 @@ from pathlib import Path
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG
+from config import DB_DSN
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class GoldBuilder:
     def get_connection(self):
         """Get database connection."""
         try:
-            return psycopg2.connect(**DB_CONFIG)
+            return psycopg2.connect(DB_DSN)
         except psycopg2.Error as e:
             logger.error(f"Database connection error: {e}")
             return None
@@ -415,7 +415,9 @@ class GoldBuilder:
             logger.info(f"✅ supply_chain_dashboard created with {count:,} rows")
 
             # Helpful indexes for BI slicing
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_gscd_order_date ON gold.supply_chain_dashboard(order_date)")
+            # Rows are written in order_date order, so a BRIN index gives the same
+            # date range scans as a B-tree at a fraction of the size and build time
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_gscd_order_date ON gold.supply_chain_dashboard USING BRIN (order_date) WITH (pages_per_range = 32)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_gscd_order_year_month ON gold.supply_chain_dashboard(order_year_month)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_gscd_product_category ON gold.supply_chain_dashboard(product_category)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_gscd_main_category ON gold.supply_chain_dashboard(main_category)")
@@ -18,7 +18,7 @@ load_dotenv()
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG
+from config import DB_DSN
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class SupabasePusher:
     """Handles pushing gold layer data directly to Supabase public schema."""
 
     def __init__(self):
-        self.local_config = DB_CONFIG
+        self.local_dsn = DB_DSN
         self.supabase_config = {
             'host': os.getenv('SUPABASE_HOST'),
             'database': os.getenv('SUPABASE_DB_NAME'),
@@ -57,7 +57,7 @@ class SupabasePusher:
             raise ValueError(f"Missing env vars: {', '.join(missing)}")
 
     def get_local_connection(self):
-        return psycopg2.connect(**self.local_config)
+        return psycopg2.connect(self.local_dsn)
 
     def get_supabase_connection(self):
         if not self.pool_initialized:
@@ -17,7 +17,7 @@ import os
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
-from config import DB_CONFIG
+from config import DB_URL
 
 # Configure logging
 logging.basicConfig(
@@ -65,7 +65,7 @@ class SchedulerManager:
             # Configure job stores
             jobstores = {
                 'default': SQLAlchemyJobStore(
-                    url=f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
+                    url=DB_URL
                 )
             }
 
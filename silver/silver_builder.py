@@ -2,14 +2,16 @@ import sys
 import logging
 import pandas as pd
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 # Add parent directory to path for config import
 sys.path.append(str(Path(__file__).parent.parent))
-from config import DB_CONFIG, LOG_CONFIG
+from config import DB_DSN, LOG_CONFIG
 
 # Set up logging
 log_dir = Path(__file__).parent.parent / LOG_CONFIG['log_dir']
@@ -25,6 +27,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Silver tables cleaned at the same time, each on its own connection
+CLEAN_WORKERS = 6
+
 
 class SilverDataCleaner:
     """Data cleaning utilities for Silver layer transformation."""
@@ -288,14 +293,23 @@ class SilverBuilder:
             'total_records_cleaned': 0,
             'total_quality_issues_fixed': 0
         }
+        # Tables are cleaned concurrently; guards total_stats
+        self.stats_lock = threading.Lock()
         # Generate unique run ID for this ETL run
         from datetime import datetime
         self.run_id = f"silver_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+    def add_total_stats(self, stats):
+        """Add one table's cleaning stats to the run totals."""
+        with self.stats_lock:
+            self.total_stats['total_records_processed'] += stats['processed']
+            self.total_stats['total_records_cleaned'] += stats['cleaned']
+            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+
     def get_connection(self):
         """Get database connection."""
         try:
-            conn = psycopg2.connect(**DB_CONFIG)
+            conn = psycopg2.connect(DB_DSN)
             return conn
         except psycopg2.Error as e:
             logger.error(f"Database connection failed: {e}")
@@ -515,6 +529,20 @@ class SilverBuilder:
         finally:
             conn.close()
 
+    def prepare_insert(self, cursor, statement_name, table_name, columns):
+        """PREPARE a server-side INSERT and return the SQL that executes it.
+
+        The statement lives until the connection is closed, which every
+        clean_* step does once its table is loaded.
+        """
+        placeholders = ', '.join(f'${i}' for i in range(1, len(columns) + 1))
+        cursor.execute(f"""
+            PREPARE {statement_name} AS
+            INSERT INTO {table_name} ({', '.join(columns)})
+            VALUES ({placeholders})
+        """)
+        return f"EXECUTE {statement_name} ({', '.join(['%s'] * len(columns))})"
+
     def calculate_quality_score(self, issues_found, total_fields):
         """Calculate quality score based on issues found."""
         if total_fields == 0:
@@ -543,6 +571,15 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.suppliers")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'suppliers_insert', 'silver.suppliers', [
+                'supplier_id',
+                'supplier_name',
+                'contact_email',
+                'phone_number',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -578,11 +615,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 4)
 
                 # Insert cleaned data
-                cursor.execute("""
-                    INSERT INTO silver.suppliers
-                    (supplier_id, supplier_name, contact_email, phone_number, quality_score)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (supplier_id, cleaned_name, cleaned_email, cleaned_phone, quality_score))
+                cursor.execute(insert_sql, (supplier_id, cleaned_name, cleaned_email, cleaned_phone, quality_score))
 
                 stats['processed'] += 1
                 if issues_count > 0:
@@ -597,9 +630,7 @@ class SilverBuilder:
             self.log_etl_step('clean_suppliers', 'suppliers', bronze_count, stats['processed'], stats['rejected'])
 
             logger.info(f"✅ Suppliers: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -633,6 +664,21 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.products")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'products_insert', 'silver.products', [
+                'product_id',
+                'product_name',
+                'unit_cost',
+                'selling_price',
+                'supplier_id',
+                'product_category',
+                'main_category',
+                'sub_category',
+                'status',
+                'price_margin',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -696,12 +742,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 6)
 
                 # Insert cleaned data (don't validate supplier reference yet - suppliers may not be cleaned)
-                cursor.execute("""
-                    INSERT INTO silver.products
-                    (product_id, product_name, unit_cost, selling_price, supplier_id,
-                     product_category, main_category, sub_category, status, price_margin, quality_score)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (product_id, cleaned_name, cleaned_unit_cost, cleaned_selling_price,
+                cursor.execute(insert_sql, (product_id, cleaned_name, cleaned_unit_cost, cleaned_selling_price,
                       cleaned_supplier_id, cleaned_category, main_category, sub_category, cleaned_status, price_margin, quality_score))
 
                 stats['processed'] += 1
@@ -718,9 +759,7 @@ class SilverBuilder:
             self.log_etl_step('clean_products', 'products', bronze_count, stats['processed'], stats['rejected'])
 
             logger.info(f"✅ Products: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -753,6 +792,16 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.warehouses")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'warehouses_insert', 'silver.warehouses', [
+                'warehouse_id',
+                'warehouse_name',
+                'city',
+                'region',
+                'storage_capacity',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -785,11 +834,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 5)
 
                 # Insert cleaned data
-                cursor.execute("""
-                    INSERT INTO silver.warehouses
-                    (warehouse_id, warehouse_name, city, region, storage_capacity, quality_score)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (warehouse_id, cleaned_name, cleaned_city, cleaned_region, cleaned_capacity, quality_score))
+                cursor.execute(insert_sql, (warehouse_id, cleaned_name, cleaned_city, cleaned_region, cleaned_capacity, quality_score))
 
                 stats['processed'] += 1
                 if issues_count > 0:
@@ -798,9 +843,7 @@ class SilverBuilder:
 
             conn.commit()
             logger.info(f"✅ Warehouses: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -833,6 +876,17 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.retail_stores")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'retail_stores_insert', 'silver.retail_stores', [
+                'retail_store_id',
+                'store_name',
+                'city',
+                'region',
+                'store_type',
+                'store_status',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -876,11 +930,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 6)
 
                 # Insert cleaned data
-                cursor.execute("""
-                    INSERT INTO silver.retail_stores
-                    (retail_store_id, store_name, city, region, store_type, store_status, quality_score)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (retail_store_id, cleaned_name, cleaned_city, cleaned_region, cleaned_type, cleaned_status, quality_score))
+                cursor.execute(insert_sql, (retail_store_id, cleaned_name, cleaned_city, cleaned_region, cleaned_type, cleaned_status, quality_score))
 
                 stats['processed'] += 1
                 if issues_count > 0:
@@ -889,9 +939,7 @@ class SilverBuilder:
 
             conn.commit()
             logger.info(f"✅ Retail Stores: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -926,6 +974,24 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.supply_orders")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'supply_orders_insert', 'silver.supply_orders', [
+                'supply_order_id',
+                'product_id',
+                'warehouse_id',
+                'retail_store_id',
+                'quantity',
+                'price',
+                'total_invoice',
+                'order_date',
+                'shipped_date',
+                'delivered_date',
+                'status',
+                'is_calculation_correct',
+                'date_logic_valid',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -983,13 +1049,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 11)
 
                 # Insert cleaned data
-                cursor.execute("""
-                    INSERT INTO silver.supply_orders
-                    (supply_order_id, product_id, warehouse_id, retail_store_id, quantity,
-                     price, total_invoice, order_date, shipped_date, delivered_date, status,
-                     is_calculation_correct, date_logic_valid, quality_score)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (supply_order_id, cleaned_product_id, cleaned_warehouse_id, cleaned_retail_store_id,
+                cursor.execute(insert_sql, (supply_order_id, cleaned_product_id, cleaned_warehouse_id, cleaned_retail_store_id,
                       cleaned_quantity, cleaned_price, cleaned_total_invoice, cleaned_order_date,
                       cleaned_shipped_date, cleaned_delivered_date, cleaned_status,
                       is_calculation_correct, date_logic_valid, quality_score))
@@ -1001,9 +1061,7 @@ class SilverBuilder:
 
             conn.commit()
             logger.info(f"✅ Supply Orders: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -1036,6 +1094,16 @@ class SilverBuilder:
             # Clear silver table
             cursor.execute("TRUNCATE TABLE silver.inventory")
 
+            # Plan the row insert once on the server instead of once per row
+            insert_sql = self.prepare_insert(cursor, 'inventory_insert', 'silver.inventory', [
+                'inventory_id',
+                'product_id',
+                'warehouse_id',
+                'quantity_on_hand',
+                'last_stocked_date',
+                'quality_score'
+            ])
+
             stats = {'processed': 0, 'cleaned': 0, 'rejected': 0, 'issues_fixed': 0}
 
             for row in bronze_data:
@@ -1065,11 +1133,7 @@ class SilverBuilder:
                 quality_score = self.calculate_quality_score(issues_count, 5)
 
                 # Insert cleaned data
-                cursor.execute("""
-                    INSERT INTO silver.inventory
-                    (inventory_id, product_id, warehouse_id, quantity_on_hand, last_stocked_date, quality_score)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (inventory_id, cleaned_product_id, cleaned_warehouse_id, cleaned_quantity, cleaned_date, quality_score))
+                cursor.execute(insert_sql, (inventory_id, cleaned_product_id, cleaned_warehouse_id, cleaned_quantity, cleaned_date, quality_score))
 
                 stats['processed'] += 1
                 if issues_count > 0:
@@ -1084,9 +1148,7 @@ class SilverBuilder:
             self.log_etl_step('clean_inventory', 'inventory', bronze_count, stats['processed'], stats['rejected'])
 
             logger.info(f"✅ Inventory: {stats['processed']:,} processed, {stats['cleaned']:,} cleaned, {stats['rejected']:,} rejected, {stats['issues_fixed']:,} issues fixed")
-            self.total_stats['total_records_processed'] += stats['processed']
-            self.total_stats['total_records_cleaned'] += stats['cleaned']
-            self.total_stats['total_quality_issues_fixed'] += stats['issues_fixed']
+            self.add_total_stats(stats)
 
             return True
 
@@ -1113,7 +1175,9 @@ class SilverBuilder:
             logger.error("❌ Failed to setup silver tables")
             return False
 
-        # Step 2: Clean tables in order (independent tables first)
+        # Step 2: Clean tables. Each step reads only its own bronze table and
+        # rewrites only its own silver table (there are no foreign keys between
+        # silver tables), so the steps run concurrently on separate connections
         cleaning_steps = [
             ("suppliers", self.clean_suppliers),
             ("warehouses", self.clean_warehouses),
@@ -1123,11 +1187,17 @@ class SilverBuilder:
             ("supply_orders", self.clean_supply_orders)
         ]
 
-        for step_num, (table_name, clean_func) in enumerate(cleaning_steps, 2):
-            logger.info(f"{step_num}️⃣  Cleaning {table_name}...")
-            if not clean_func():
-                logger.error(f"❌ Failed to clean {table_name}")
-                return False
+        logger.info(f"2️⃣  Cleaning {', '.join(name for name, _ in cleaning_steps)}...")
+        failed_tables = []
+        with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+            futures = {executor.submit(clean_func): table_name for table_name, clean_func in cleaning_steps}
+            for future in as_completed(futures):
+                if not future.result():
+                    failed_tables.append(futures[future])
+
+        if failed_tables:
+            logger.error(f"❌ Failed to clean {', '.join(failed_tables)}")
+            return False
 
         # Step 3: Final summary
         end_time = datetime.now()